@@ -17,6 +17,48 @@ from datetime import datetime, timedelta
 import pandas as pd
 
 
+# Metric values reported when a backtest made no trades
+_EMPTY_METRICS = {
+    "total_trades": 0,
+    "winning_trades": 0,
+    "losing_trades": 0,
+    "win_rate": 0.0,
+    "total_profit_pct": 0.0,
+    "total_profit_abs": 0.0,
+    "avg_profit_pct": 0.0,
+    "sharpe_ratio": 0.0,
+    "sortino_ratio": 0.0,
+    "max_drawdown_pct": 0.0,
+    "max_drawdown_abs": 0.0,
+    "avg_duration": "0:00",
+    "best_trade_pct": 0.0,
+    "worst_trade_pct": 0.0,
+}
+
+
+# SUMMARY METRICS row label -> (metric key, converter for the value cell).
+# Freqtrade may qualify a label, e.g. "Sharpe (closed trades)"; such rows are
+# matched on the part before " (", and the first row for a metric wins.
+_SUMMARY_PARSERS = {
+    # "45 / 0.25"
+    "Total/Daily Avg Trades": ("total_trades", lambda v: int(v.split("/")[0])),
+    # "-0.18%"
+    "Total profit %": ("total_profit_pct", lambda v: float(v.replace("%", ""))),
+    # "-18.371 USDT"
+    "Absolute profit": ("total_profit_abs", lambda v: float(v.split()[0])),
+    "Sharpe": ("sharpe_ratio", float),
+    "Sortino": ("sortino_ratio", float),
+    # "0.25%"
+    "Max % of account underwater": (
+        "max_drawdown_pct",
+        lambda v: abs(float(v.replace("%", ""))),
+    ),
+    # "ETH/USDT 2.00%"
+    "Best trade": ("best_trade_pct", lambda v: float(v.split()[1].replace("%", ""))),
+    "Worst trade": ("worst_trade_pct", lambda v: float(v.split()[1].replace("%", ""))),
+}
+
+
 @dataclass
 class BacktestResults:
     """Container for backtest results"""
@@ -356,101 +398,48 @@ class BacktestEngine:
     ) -> BacktestResults:
         """Parse Freqtrade backtest output"""
 
-        # Initialize default values
-        metrics = {
-            "total_trades": 0,
-            "winning_trades": 0,
-            "losing_trades": 0,
-            "win_rate": 0.0,
-            "total_profit_pct": 0.0,
-            "total_profit_abs": 0.0,
-            "avg_profit_pct": 0.0,
-            "sharpe_ratio": 0.0,
-            "sortino_ratio": 0.0,
-            "max_drawdown_pct": 0.0,
-            "max_drawdown_abs": 0.0,
-            "avg_duration": "0:00",
-            "best_trade_pct": 0.0,
-            "worst_trade_pct": 0.0,
-        }
-
-        lines = output.split("\n")
-
-        for line in lines:
-            # Parse from SUMMARY METRICS table
-            if "Total/Daily Avg Trades" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        trades_str = parts[2].strip().split("/")[0].strip()
-                        metrics["total_trades"] = int(trades_str)
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Total profit %" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        pct_str = parts[2].strip().replace("%", "").strip()
-                        metrics["total_profit_pct"] = float(pct_str)
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Absolute profit" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        profit_str = parts[2].strip().split()[0].strip()
-                        metrics["total_profit_abs"] = float(profit_str)
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Sharpe" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        metrics["sharpe_ratio"] = float(parts[2].strip())
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Sortino" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        metrics["sortino_ratio"] = float(parts[2].strip())
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Max % of account underwater" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        dd_str = parts[2].strip().replace("%", "").strip()
-                        metrics["max_drawdown_pct"] = abs(float(dd_str))
-                    except (ValueError, IndexError):
-                        pass
-
-            elif "Best trade" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
-                    try:
-                        best_str = parts[2].strip().split()[1].replace("%", "")
-                        metrics["best_trade_pct"] = float(best_str)
-                    except (ValueError, IndexError):
-                        pass
+        # A run without trades only has the zeroed defaults to report
+        if "No trades made." in output:
+            return self._build_results(
+                _EMPTY_METRICS,
+                strategy,
+                timeframe,
+                start_date,
+                end_date,
+                pairs,
+                output,
+            )
 
-            elif "Worst trade" in line and "│" in line:
-                parts = line.split("│")
-                if len(parts) >= 3:
+        # Initialize default values
+        metrics = dict(_EMPTY_METRICS)
+        # Summary metrics already parsed (later qualified variants are ignored)
+        parsed = set()
+
+        for line in output.split("\n"):
+            # Every metric lives in a table row; skip log and blank lines early
+            if "│" not in line:
+                continue
+
+            parts = line.split("│")
+            if len(parts) < 3:
+                continue
+
+            # Parse from SUMMARY METRICS table: "│ <label> │ <value> │"
+            label = parts[1].strip()
+            summary_parser = _SUMMARY_PARSERS.get(label)
+            if summary_parser is None and " (" in label:
+                summary_parser = _SUMMARY_PARSERS.get(label.split(" (", 1)[0])
+            if summary_parser is not None:
+                key, convert = summary_parser
+                if key not in parsed:
                     try:
-                        worst_str = parts[2].strip().split()[1].replace("%", "")
-                        metrics["worst_trade_pct"] = float(worst_str)
+                        metrics[key] = convert(parts[2].strip())
+                        parsed.add(key)
                     except (ValueError, IndexError):
                         pass
 
             # Parse from BACKTESTING REPORT table (TOTAL row)
             elif "│    TOTAL │" in line or "│ TOTAL │" in line:
-                parts = line.split("│")
                 if len(parts) >= 8:
                     try:
                         # Win stats: "21     0    24  46.7"
@@ -468,21 +457,23 @@ class BacktestEngine:
                     except (ValueError, IndexError):
                         pass
 
+        return self._build_results(
+            metrics, strategy, timeframe, start_date, end_date, pairs, output
+        )
+
+    def _build_results(
+        self,
+        metrics: Dict,
+        strategy: str,
+        timeframe: str,
+        start_date: str,
+        end_date: str,
+        pairs: List[str],
+        output: str,
+    ) -> BacktestResults:
+        """Combine parsed metrics with run parameters into BacktestResults"""
         return BacktestResults(
-            total_trades=metrics["total_trades"],
-            winning_trades=metrics["winning_trades"],
-            losing_trades=metrics["losing_trades"],
-            win_rate=metrics["win_rate"],
-            total_profit_pct=metrics["total_profit_pct"],
-            total_profit_abs=metrics["total_profit_abs"],
-            avg_profit_pct=metrics["avg_profit_pct"],
-            sharpe_ratio=metrics["sharpe_ratio"],
-            sortino_ratio=metrics["sortino_ratio"],
-            max_drawdown_pct=metrics["max_drawdown_pct"],
-            max_drawdown_abs=metrics["max_drawdown_abs"],
-            avg_duration=metrics["avg_duration"],
-            best_trade_pct=metrics["best_trade_pct"],
-            worst_trade_pct=metrics["worst_trade_pct"],
+            **metrics,
             strategy_name=strategy,
             start_date=datetime.strptime(start_date, "%Y-%m-%d"),
             end_date=datetime.strptime(end_date, "%Y-%m-%d"),
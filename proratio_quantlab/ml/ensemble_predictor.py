@@ -14,12 +14,15 @@ Date: 2025-10-11
 Phase: 3.3 - Ensemble Learning
 """
 
+import json
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Union
 import logging
 from pathlib import Path
 import joblib
+from joblib import Parallel, delayed
+from scipy.optimize import nnls
 from sklearn.linear_model import Ridge, Lasso
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
@@ -27,6 +30,10 @@ from sklearn.metrics import mean_squared_error, mean_absolute_error
 
 logger = logging.getLogger(__name__)
 
+# On-disk layout written by EnsemblePredictor.save()
+_SAVE_FORMAT_VERSION = 2
+_MANIFEST_FILE = "manifest.json"
+
 # Optional imports with graceful fallback
 try:
     from .lstm_predictor import LSTMPredictor
@@ -78,6 +85,8 @@ class EnsemblePredictor:
         meta_model_type: str = "ridge",
         base_models: Optional[Dict[str, object]] = None,
         weights: Optional[Dict[str, float]] = None,
+        n_jobs: int = 1,
+        meta_dtype: Union[str, np.dtype] = np.float64,
     ):
         """
         Initialize ensemble predictor.
@@ -87,6 +96,11 @@ class EnsemblePredictor:
             meta_model_type: 'ridge', 'lasso', 'rf' (for stacking)
             base_models: Dictionary of model_name -> model_object
             weights: Dictionary of model_name -> weight (for blending)
+            n_jobs: Threads used to run base-model predictions. Defaults to 1
+                (sequential), since most base models are multithreaded
+                themselves; -1 runs one thread per model on all cores
+            meta_dtype: dtype of the internal meta-feature matrix; float32 halves
+                its memory traffic, ensemble predictions are always float64
         """
         self.ensemble_method = ensemble_method
         self.meta_model_type = meta_model_type
@@ -97,6 +111,10 @@ class EnsemblePredictor:
         self.model_names = []
         self.performance_history = []
         self.feature_names = None  # Store feature names for validation
+        self.n_jobs = n_jobs
+        self.meta_dtype = np.dtype(meta_dtype)
+        # Squared-error scratch buffer reused by update_weights_dynamic()
+        self._dyn_err_buf = None
 
         # Validate ensemble method
         valid_methods = ["stacking", "blending", "voting"]
@@ -134,6 +152,38 @@ class EnsemblePredictor:
         self.model_names.append(name)
         logger.info(f"Added base model: {name} (weight={weight:.2f})")
 
+    def _base_model_predict(
+        self, name: str, X: np.ndarray, pred_cache: Optional[dict] = None
+    ) -> np.ndarray:
+        """
+        Get 1D predictions of a base model.
+
+        Args:
+            name: Base model name
+            X: Input features
+            pred_cache: Dict created by a single train/evaluate call to share
+                base-model predictions between its steps. It keys on
+                (name, id(X)) and holds X, so the id cannot be reused while
+                the call runs. Nothing is cached across calls.
+
+        Returns:
+            Flattened predictions of the base model
+        """
+        key = (name, id(X))
+        if pred_cache is not None:
+            cached = pred_cache.get(key)
+            if cached is not None and cached[0] is X:
+                return cached[1]
+
+        pred = self.base_models[name].predict(X)
+        # Ensure 1D array
+        if len(pred.shape) > 1:
+            pred = pred.flatten()
+
+        if pred_cache is not None:
+            pred_cache[key] = (X, pred)
+        return pred
+
     def train_stacking(
         self,
         X_train: np.ndarray,
@@ -149,6 +199,11 @@ class EnsemblePredictor:
         2. Use these predictions as features for meta-model
         3. Train meta-model to learn optimal combination
 
+        This is holdout stacking: the already-fitted base models predict the
+        validation set once and no K-fold out-of-fold refits are run, so the
+        cost is one predict() per base model. The validation set must not
+        overlap the data the base models were trained on.
+
         Args:
             X_train: Training features (not used, base models already trained)
             y_train: Training targets (not used, base models already trained)
@@ -189,8 +244,9 @@ class EnsemblePredictor:
         """
         Train blending ensemble by optimizing weights.
 
-        Uses grid search to find optimal weights that minimize
-        the specified metric on validation set.
+        Finds non-negative weights (summing to 1.0) that minimize the
+        specified metric on validation set: a single NNLS solve for MSE,
+        a grid search for MAE.
 
         Args:
             X_val: Validation features
@@ -204,8 +260,9 @@ class EnsemblePredictor:
             f"Training blending ensemble with {len(self.base_models)} base models"
         )
 
-        # Get base model predictions
-        base_predictions = self._get_base_predictions(X_val)
+        # Get base model predictions (shared with the final evaluation below)
+        pred_cache = {}
+        base_predictions = self._get_base_predictions(X_val, pred_cache)
 
         # Grid search for optimal weights
         best_weights = self._optimize_weights(
@@ -215,7 +272,7 @@ class EnsemblePredictor:
         self.weights = dict(zip(self.model_names, best_weights))
 
         # Evaluate final ensemble
-        ensemble_pred = self.predict_blending(X_val)
+        ensemble_pred = self._predict("blending", X_val, pred_cache)
         mse = mean_squared_error(y_val, ensemble_pred)
         mae = mean_absolute_error(y_val, ensemble_pred)
 
@@ -228,14 +285,39 @@ class EnsemblePredictor:
         self, base_predictions: np.ndarray, y_true: np.ndarray, metric: str = "mse"
     ) -> List[float]:
         """
-        Find optimal weights using grid search.
+        Find optimal blending weights that sum to 1.0.
 
-        Searches over weight combinations that sum to 1.0.
+        For MSE the weights come from one non-negative least squares solve on
+        the base predictions, with an extra heavily weighted row that enforces
+        the sum-to-one constraint (the exact simplex-constrained fit, up to
+        rounding). MAE has no closed form, so weight combinations are grid
+        searched instead.
         """
         n_models = len(self.model_names)
-        best_score = float("inf")
         best_weights = [1.0 / n_models] * n_models
 
+        # Align targets with base predictions (LSTM may reduce size)
+        if len(base_predictions) < len(y_true):
+            y_true = y_true[-len(base_predictions) :]
+
+        if metric == "mse":
+            A = np.asarray(base_predictions, dtype=np.float64)
+            b = np.asarray(y_true, dtype=np.float64)
+            # Penalty row large enough to dominate the residual, so the
+            # solution lies on the simplex instead of being rescaled onto it
+            penalty = 1e3 * np.sqrt(len(b)) * max(np.abs(A).max(), np.abs(b).max(), 1.0)
+            A = np.vstack([A, np.full((1, n_models), penalty)])
+            b = np.append(b, penalty)
+
+            weights, _ = nnls(A, b)
+            weight_sum = weights.sum()
+            # Absorb the residual constraint violation
+            if weight_sum > 0:
+                best_weights = (weights / weight_sum).tolist()
+            return best_weights
+
+        best_score = float("inf")
+
         # Grid search resolution
         steps = 11  # 0.0, 0.1, 0.2, ..., 1.0
 
@@ -252,14 +334,11 @@ class EnsemblePredictor:
                 continue
             weights = weights / weight_sum
 
-            # Calculate ensemble prediction
-            ensemble_pred = (base_predictions * weights).sum(axis=1)
+            # Calculate ensemble prediction (one matrix-vector product)
+            ensemble_pred = base_predictions @ weights
 
             # Calculate metric
-            if metric == "mse":
-                score = mean_squared_error(y_true, ensemble_pred)
-            else:  # mae
-                score = mean_absolute_error(y_true, ensemble_pred)
+            score = mean_absolute_error(y_true, ensemble_pred)
 
             # Update best
             if score < best_score:
@@ -268,29 +347,38 @@ class EnsemblePredictor:
 
         return best_weights
 
-    def _get_base_predictions(self, X: np.ndarray) -> np.ndarray:
+    def _get_base_predictions(
+        self, X: np.ndarray, pred_cache: Optional[dict] = None
+    ) -> np.ndarray:
         """
         Get predictions from all base models.
 
+        Args:
+            X: Input features
+            pred_cache: Optional per-call prediction cache (see
+                _base_model_predict)
+
         Returns:
-            Array of shape (n_samples, n_models)
+            Column-major array of shape (n_samples, n_models)
         """
-        predictions = []
-
-        for name in self.model_names:
-            model = self.base_models[name]
 
+        def predict_one(name: str) -> np.ndarray:
             # Handle different model types
             try:
-                pred = model.predict(X)
-                # Ensure 1D array
-                if len(pred.shape) > 1:
-                    pred = pred.flatten()
-                predictions.append(pred)
+                return self._base_model_predict(name, X, pred_cache)
             except Exception as e:
                 logger.error(f"Error getting predictions from {name}: {e}")
                 raise
 
+        # Base models are independent, so with n_jobs != 1 fan out across threads
+        # (sklearn, LightGBM, XGBoost and PyTorch release the GIL while predicting)
+        if len(self.model_names) > 1 and self.n_jobs != 1:
+            predictions = Parallel(n_jobs=self.n_jobs, backend="threading")(
+                delayed(predict_one)(name) for name in self.model_names
+            )
+        else:
+            predictions = [predict_one(name) for name in self.model_names]
+
         # LSTM may return fewer predictions due to sequence_length
         # Align all predictions to the shortest length
         min_length = min(len(p) for p in predictions)
@@ -299,9 +387,16 @@ class EnsemblePredictor:
                 f"Aligning predictions to minimum length {min_length} "
                 f"(LSTM sequence_length reduces output size)"
             )
-            predictions = [p[-min_length:] for p in predictions]
 
-        return np.column_stack(predictions)
+        # Fill a Fortran-ordered buffer so each model's column is contiguous,
+        # matching how the linear meta-models traverse features
+        meta = np.empty(
+            (min_length, len(predictions)), dtype=self.meta_dtype, order="F"
+        )
+        for i, pred in enumerate(predictions):
+            meta[:, i] = pred[len(pred) - min_length :]
+
+        return meta
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -313,35 +408,61 @@ class EnsemblePredictor:
         Returns:
             Ensemble predictions
         """
-        if self.ensemble_method == "stacking":
-            return self.predict_stacking(X)
-        elif self.ensemble_method == "blending":
-            return self.predict_blending(X)
-        else:  # voting
-            return self.predict_voting(X)
+        return self._predict(self.ensemble_method, X)
 
     def predict_stacking(self, X: np.ndarray) -> np.ndarray:
         """Predict using stacking (meta-model)."""
-        if self.meta_model is None:
-            raise ValueError("Meta-model not trained. Call train_stacking() first.")
-
-        base_predictions = self._get_base_predictions(X)
-        return self.meta_model.predict(base_predictions)
+        return self._predict("stacking", X)
 
     def predict_blending(self, X: np.ndarray) -> np.ndarray:
         """Predict using weighted blending."""
-        if not self.weights:
-            raise ValueError("Weights not set. Call train_blending() or set manually.")
-
-        base_predictions = self._get_base_predictions(X)
-        weights = np.array([self.weights[name] for name in self.model_names])
-
-        return (base_predictions * weights).sum(axis=1)
+        return self._predict("blending", X)
 
     def predict_voting(self, X: np.ndarray) -> np.ndarray:
         """Predict using simple voting (equal weights)."""
-        base_predictions = self._get_base_predictions(X)
-        return base_predictions.mean(axis=1)
+        return self._predict("voting", X)
+
+    def _predict(
+        self, method: str, X: np.ndarray, pred_cache: Optional[dict] = None
+    ) -> np.ndarray:
+        """
+        Combine base-model predictions for X with the given ensemble method.
+
+        Args:
+            method: 'stacking', 'blending' or 'voting'
+            X: Input features
+            pred_cache: Optional per-call prediction cache (see
+                _base_model_predict)
+
+        Returns:
+            Ensemble predictions
+        """
+        if method == "stacking":
+            if self.meta_model is None:
+                raise ValueError("Meta-model not trained. Call train_stacking() first.")
+
+            base_predictions = self._get_base_predictions(X, pred_cache)
+            return self.meta_model.predict(base_predictions).astype(
+                np.float64, copy=False
+            )
+
+        if method == "blending":
+            if not self.weights:
+                raise ValueError(
+                    "Weights not set. Call train_blending() or set manually."
+                )
+
+            base_predictions = self._get_base_predictions(X, pred_cache)
+            weights = np.array(
+                [self.weights[name] for name in self.model_names], dtype=np.float64
+            )
+
+            # Weighted sum as a single matrix-vector product (BLAS gemv)
+            return (base_predictions @ weights).astype(np.float64, copy=False)
+
+        # Voting
+        base_predictions = self._get_base_predictions(X, pred_cache)
+        return base_predictions.mean(axis=1, dtype=np.float64)
 
     def update_weights_dynamic(
         self, X_recent: np.ndarray, y_recent: np.ndarray, window_size: int = 100
@@ -364,23 +485,25 @@ class EnsemblePredictor:
         X_window = X_recent[-window_size:]
         y_window = y_recent[-window_size:]
 
-        # Calculate performance for each model
-        performances = {}
-        for name in self.model_names:
-            model = self.base_models[name]
-            pred = model.predict(X_window)
-            if len(pred.shape) > 1:
-                pred = pred.flatten()
+        base_predictions = self._get_base_predictions(X_window)
+        # Align y_window with base predictions (LSTM may reduce size)
+        y_window = np.asarray(y_window, dtype=np.float64)[-len(base_predictions) :]
 
-            # Use inverse MSE as performance score (higher is better)
-            mse = mean_squared_error(y_window, pred)
-            performances[name] = 1.0 / (mse + 1e-8)
+        # Squared errors of all models at once, in a buffer reused across calls
+        errors = self._dyn_err_buf
+        if errors is None or errors.shape != base_predictions.shape:
+            errors = np.empty(base_predictions.shape, dtype=np.float64, order="F")
+            self._dyn_err_buf = errors
+        np.subtract(base_predictions, y_window[:, np.newaxis], out=errors)
+        np.square(errors, out=errors)
+        mse = errors.mean(axis=0)
+
+        # Use inverse MSE as performance score (higher is better)
+        scores = 1.0 / (mse + 1e-8)
 
         # Normalize to weights (sum to 1.0)
-        total_performance = sum(performances.values())
-        new_weights = {
-            name: perf / total_performance for name, perf in performances.items()
-        }
+        performances = dict(zip(self.model_names, scores.tolist()))
+        new_weights = dict(zip(self.model_names, (scores / scores.sum()).tolist()))
 
         self.weights = new_weights
         self.performance_history.append(
@@ -398,8 +521,12 @@ class EnsemblePredictor:
         """
         results = {}
 
+        # Base-model predictions are shared between the ensemble and
+        # per-model metrics, for this call only
+        pred_cache = {}
+
         # Ensemble prediction
-        ensemble_pred = self.predict(X_test)
+        ensemble_pred = self._predict(self.ensemble_method, X_test, pred_cache)
 
         # Align y_test with predictions (LSTM may reduce size)
         if len(ensemble_pred) < len(y_test):
@@ -415,10 +542,7 @@ class EnsemblePredictor:
 
         # Individual model predictions
         for name in self.model_names:
-            model = self.base_models[name]
-            pred = model.predict(X_test)
-            if len(pred.shape) > 1:
-                pred = pred.flatten()
+            pred = self._base_model_predict(name, X_test, pred_cache)
 
             # Align y_test with prediction
             if len(pred) < len(y_test):
@@ -441,45 +565,137 @@ class EnsemblePredictor:
         Returns:
             DataFrame with columns for each model's prediction and final ensemble
         """
-        base_predictions = self._get_base_predictions(X)
-        ensemble_pred = self.predict(X)
-
-        df = pd.DataFrame(
-            base_predictions, columns=[f"{name}_pred" for name in self.model_names]
-        )
-        df["ensemble_pred"] = ensemble_pred
+        # Each base model predicts once; the second pass reuses the results
+        pred_cache = {}
+        ensemble_pred = self._predict(self.ensemble_method, X, pred_cache)
+        base_predictions = self._get_base_predictions(X, pred_cache)
+
+        # Build all columns up front and hand pandas a single dict, instead of
+        # inserting them one at a time
+        data = {
+            f"{name}_pred": base_predictions[:, i].astype(np.float64)
+            for i, name in enumerate(self.model_names)
+        }
+        data["ensemble_pred"] = ensemble_pred
 
         # Add weights if using blending
         if self.ensemble_method == "blending":
+            n_rows = len(ensemble_pred)
             for name in self.model_names:
-                df[f"{name}_weight"] = self.weights[name]
+                data[f"{name}_weight"] = np.full(n_rows, self.weights[name])
 
-        return df
+        return pd.DataFrame(data, copy=False)
 
     def save(self, path: Union[str, Path]):
-        """Save ensemble predictor to disk."""
+        """
+        Save ensemble predictor to disk.
+
+        A path with a file suffix (e.g. ``models/ensemble_model.pkl``) gets a
+        single compressed joblib file. A path without one becomes a directory
+        holding ``manifest.json`` with the ensemble configuration, one
+        compressed joblib file per base model and one for the meta-model, so
+        base models can be loaded lazily and independently.
+
+        Args:
+            path: Target file, or target directory (created if missing)
+        """
         path = Path(path)
-        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix:
+            self._save_single_file(path)
+            return
+
+        path.mkdir(parents=True, exist_ok=True)
+
+        model_files = {}
+        for i, name in enumerate(self.model_names):
+            model = _unwrap_lazy(self.base_models[name])
+            model_files[name] = f"base_{i}.joblib"
+            joblib.dump(model, path / model_files[name], compress=3)
+
+        meta_model_file = None
+        if self.meta_model is not None:
+            meta_model_file = "meta_model.joblib"
+            joblib.dump(self.meta_model, path / meta_model_file, compress=3)
 
         # Save ensemble configuration
+        manifest = {
+            "format_version": _SAVE_FORMAT_VERSION,
+            "ensemble_method": self.ensemble_method,
+            "meta_model_type": self.meta_model_type,
+            "weights": self.weights,
+            "model_names": self.model_names,
+            "model_files": model_files,
+            "meta_model_file": meta_model_file,
+            "performance_history": self.performance_history,
+            # Save feature names for validation
+            "feature_names": (
+                list(self.feature_names) if self.feature_names is not None else None
+            ),
+        }
+        with open(path / _MANIFEST_FILE, "w") as f:
+            json.dump(manifest, f, indent=2, default=float)
+
+        logger.info(f"Ensemble predictor saved to {path}")
+
+    def _save_single_file(self, path: Path):
+        """Save the whole ensemble as one compressed joblib file."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
         ensemble_config = {
             "ensemble_method": self.ensemble_method,
             "meta_model_type": self.meta_model_type,
             "weights": self.weights,
             "model_names": self.model_names,
-            "base_models": self.base_models,  # Save base models!
+            "base_models": {
+                name: _unwrap_lazy(model) for name, model in self.base_models.items()
+            },
             "meta_model": self.meta_model,
             "performance_history": self.performance_history,
             "feature_names": self.feature_names,  # Save feature names for validation
         }
 
-        joblib.dump(ensemble_config, path)
+        joblib.dump(ensemble_config, path, compress=3)
         logger.info(f"Ensemble predictor saved to {path}")
 
     def load(self, path: Union[str, Path]):
-        """Load ensemble predictor from disk."""
+        """
+        Load ensemble predictor from disk.
+
+        For a directory written by save(), base models are wrapped in lazy
+        proxies and only deserialized on their first ``predict()`` call.
+        Single-file ensembles are loaded eagerly.
+
+        Args:
+            path: Directory or single file written by save()
+        """
         path = Path(path)
 
+        if path.is_file():
+            self._load_single_file(path)
+            return
+
+        with open(path / _MANIFEST_FILE) as f:
+            manifest = json.load(f)
+
+        self.ensemble_method = manifest["ensemble_method"]
+        self.meta_model_type = manifest["meta_model_type"]
+        self.weights = manifest["weights"]
+        self.model_names = manifest["model_names"]
+        self.base_models = {
+            name: _LazyModel(path / filename)
+            for name, filename in manifest["model_files"].items()
+        }
+        meta_model_file = manifest.get("meta_model_file")
+        self.meta_model = (
+            joblib.load(path / meta_model_file) if meta_model_file else None
+        )
+        self.performance_history = manifest.get("performance_history", [])
+        self.feature_names = manifest.get("feature_names")
+
+        logger.info(f"Ensemble predictor loaded from {path}")
+
+    def _load_single_file(self, path: Path):
+        """Load an ensemble saved as a single joblib file."""
         ensemble_config = joblib.load(path)
         self.ensemble_method = ensemble_config["ensemble_method"]
         self.meta_model_type = ensemble_config["meta_model_type"]
@@ -493,6 +709,36 @@ class EnsemblePredictor:
         logger.info(f"Ensemble predictor loaded from {path}")
 
 
+def _unwrap_lazy(model):
+    """Return the real model behind a lazy proxy (so it is saved, not the proxy)."""
+    return model.model if isinstance(model, _LazyModel) else model
+
+
+class _LazyModel:
+    """
+    Proxy for a saved base model that is deserialized on first use.
+
+    Keeps peak memory at load time independent of the number and size of
+    base models until they are actually needed for prediction.
+    """
+
+    __slots__ = ("path", "_model")
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._model = None
+
+    @property
+    def model(self):
+        """Underlying model, loaded from disk on first access."""
+        if self._model is None:
+            self._model = joblib.load(self.path)
+        return self._model
+
+    def predict(self, X):
+        return self.model.predict(X)
+
+
 class EnsembleBuilder:
     """
     Helper class to build ensemble from scratch.
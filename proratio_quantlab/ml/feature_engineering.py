@@ -12,7 +12,7 @@ Phase: 3.1 - FreqAI Integration
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Sequence, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -371,8 +371,14 @@ class FeatureEngineer:
         return df
 
 
+# Future return edges (%) separating down / neutral / up direction labels
+_DIRECTION_EDGES = np.array([-0.5, 0.5])
+
+
 def create_target_labels(
-    dataframe: pd.DataFrame, target_type: str = "regression", lookahead_periods: int = 4
+    dataframe: pd.DataFrame,
+    target_type: str = "regression",
+    lookahead_periods: Union[int, Sequence[int]] = 4,
 ) -> pd.DataFrame:
     """
     Create target labels for ML models.
@@ -380,39 +386,60 @@ def create_target_labels(
     Args:
         dataframe: OHLCV dataframe
         target_type: 'regression' or 'classification'
-        lookahead_periods: Number of periods to look ahead
+        lookahead_periods: Number of periods to look ahead, or a list of them to
+            label several horizons at once (columns get a ``_<periods>`` suffix)
 
     Returns:
         Dataframe with target labels
+
+    Raises:
+        ValueError: If lookahead_periods is an empty sequence
     """
     df = dataframe.copy()
 
-    if target_type == "regression":
-        # Future price (absolute)
-        df["target_price"] = df["close"].shift(-lookahead_periods)
-
+    if isinstance(lookahead_periods, int):
+        horizons = [lookahead_periods]
+        multi_horizon = False
+    else:
+        horizons = list(lookahead_periods)
+        multi_horizon = True
+        if not horizons:
+            raise ValueError("lookahead_periods must contain at least one horizon")
+
+    # Shift the close column once as an ndarray and slice it per horizon
+    close = df["close"].to_numpy(dtype=np.float64)
+    n_rows = len(close)
+
+    for periods in horizons:
+        suffix = f"_{periods}" if multi_horizon else ""
+
+        future_close = np.full(n_rows, np.nan)
+        if periods < n_rows:
+            future_close[: n_rows - periods] = close[periods:]
         # Future return (percentage)
-        df["target_return"] = (
-            (df["close"].shift(-lookahead_periods) - df["close"]) / df["close"]
-        ) * 100
+        future_return = ((future_close - close) / close) * 100
+
+        if target_type == "regression":
+            # Future price (absolute)
+            df[f"target_price{suffix}"] = future_close
+            df[f"target_return{suffix}"] = future_return
+
+        elif target_type == "classification":
+            # Future direction (0=down, 1=neutral, 2=up)
+            # Binary search against the +/-0.5% edges labels every row in one pass;
+            # side="left" keeps the intervals right-closed: (-inf, -0.5], (-0.5, 0.5]
+            direction = np.searchsorted(_DIRECTION_EDGES, future_return).astype(
+                np.float64
+            )
+            direction[np.isnan(future_return)] = np.nan
+            df[f"target_direction{suffix}"] = direction
 
-    elif target_type == "classification":
-        # Future direction (0=down, 1=neutral, 2=up)
-        future_return = (
-            (df["close"].shift(-lookahead_periods) - df["close"]) / df["close"]
-        ) * 100
-        df["target_direction"] = pd.cut(
-            future_return,
-            bins=[-np.inf, -0.5, 0.5, np.inf],
-            labels=[0, 1, 2],  # down, neutral, up
-        ).astype(float)
-
-        # Binary profitable entry (1 if future price > current + threshold)
-        threshold = 1.0  # 1% profit threshold
-        df["target_profitable"] = (future_return > threshold).astype(int)
-
-    # Remove last N rows (no future data available)
-    df = df.iloc[:-lookahead_periods]
+            # Binary profitable entry (1 if future price > current + threshold)
+            threshold = 1.0  # 1% profit threshold
+            df[f"target_profitable{suffix}"] = (future_return > threshold).astype(int)
+
+    # Remove last N rows (no future data available for the longest horizon)
+    df = df.iloc[: -max(horizons)]
 
     return df
 
@@ -14,15 +14,59 @@ import numpy as np
 import pandas as pd
 import torch
 import torch.nn as nn
+from torch.func import functional_call
+from torch.utils.checkpoint import checkpoint
 from torch.utils.data import Dataset, DataLoader
 from typing import Tuple, Optional, Dict, List
 import logging
+import zipfile
 from pathlib import Path
 import joblib
 from sklearn.preprocessing import StandardScaler
 
 logger = logging.getLogger(__name__)
 
+# Fitted StandardScaler attributes persisted alongside the model weights
+_SCALER_STATE = ("mean_", "var_", "scale_", "n_samples_seen_", "n_features_in_")
+
+# Per-layer parameter names of nn.LSTM / nn.GRU (suffixed with _l{layer})
+_RNN_LAYER_PARAMS = ("weight_ih", "weight_hh", "bias_ih", "bias_hh")
+
+
+def _rnn_layer(rnn: nn.RNNBase, layer: int, x: torch.Tensor) -> torch.Tensor:
+    """Run one layer of a stacked batch_first RNN with that layer's weights."""
+    # Parameter-free template on the meta device; the real weights are
+    # swapped in by functional_call, so the stacked module stays the only owner
+    template = type(rnn)(x.size(-1), rnn.hidden_size, batch_first=True, device="meta")
+    params = {
+        f"{name}_l0": getattr(rnn, f"{name}_l{layer}") for name in _RNN_LAYER_PARAMS
+    }
+    return functional_call(template, params, (x,))[0]
+
+
+def _checkpointed_rnn(rnn: nn.RNNBase, x: torch.Tensor) -> torch.Tensor:
+    """
+    Stacked RNN pass that checkpoints each layer separately.
+
+    Checkpointing the whole stack as one segment recomputes every layer at
+    once during backward, so peak memory barely moves. One segment per layer
+    keeps only the layer outputs plus a single layer's activations alive.
+
+    Args:
+        rnn: Stacked nn.LSTM or nn.GRU (batch_first)
+        x: Input tensor (batch_size, sequence_length, input_size)
+
+    Returns:
+        Output of the last layer (batch_size, sequence_length, hidden_size)
+    """
+    out = x
+    for layer in range(rnn.num_layers):
+        if layer > 0:
+            # Inter-layer dropout, as applied inside the stacked module
+            out = nn.functional.dropout(out, rnn.dropout, rnn.training)
+        out = checkpoint(_rnn_layer, rnn, layer, out, use_reentrant=False)
+    return out
+
 
 class TimeSeriesDataset(Dataset):
     """
@@ -56,6 +100,14 @@ class TimeSeriesDataset(Dataset):
         # Calculate valid sample indices
         self.n_samples = len(data) - sequence_length
 
+        # All sliding windows as one zero-copy strided view over self.data:
+        # (n_samples, sequence_length, n_features)
+        if self.n_samples > 0:
+            self.windows = self.data.unfold(0, sequence_length, 1).transpose(1, 2)
+            self.windows = self.windows[: self.n_samples]
+        else:
+            self.windows = self.data.new_empty((0, sequence_length, self.data.shape[1]))
+
     def __len__(self) -> int:
         return self.n_samples
 
@@ -67,10 +119,20 @@ class TimeSeriesDataset(Dataset):
             X: (sequence_length, n_features) tensor
             y: (1,) tensor
         """
-        X = self.data[idx : idx + self.sequence_length]
+        X = self.windows[idx]
         y = self.targets[idx + self.sequence_length]
         return X, y
 
+    def get_all(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Get every sequence and target as one batch.
+
+        Returns:
+            X: (n_samples, sequence_length, n_features) tensor
+            y: (n_samples,) tensor
+        """
+        return self.windows, self.targets[self.sequence_length :]
+
 
 class LSTMModel(nn.Module):
     """
@@ -89,6 +151,7 @@ class LSTMModel(nn.Module):
         num_layers: int = 2,
         dropout: float = 0.2,
         output_size: int = 1,
+        gradient_checkpointing: bool = False,
     ):
         """
         Initialize LSTM model.
@@ -99,6 +162,8 @@ class LSTMModel(nn.Module):
             num_layers: Number of LSTM layers
             dropout: Dropout rate for regularization
             output_size: Number of output predictions (1 for single-step)
+            gradient_checkpointing: Recompute LSTM activations during backward
+                instead of storing them (less memory, ~20% more compute)
         """
         super(LSTMModel, self).__init__()
 
@@ -106,6 +171,7 @@ class LSTMModel(nn.Module):
         self.hidden_size = hidden_size
         self.num_layers = num_layers
         self.output_size = output_size
+        self.gradient_checkpointing = gradient_checkpointing
 
         # LSTM layers
         self.lstm = nn.LSTM(
@@ -122,6 +188,14 @@ class LSTMModel(nn.Module):
         self.dropout = nn.Dropout(dropout)
         self.fc2 = nn.Linear(hidden_size // 2, output_size)
 
+        # Total trainable parameter count (fixed once the layers are built)
+        self.num_parameters = sum(p.numel() for p in self.parameters())
+
+    @torch.jit.unused
+    def _checkpointed_lstm(self, x: torch.Tensor) -> torch.Tensor:
+        """LSTM pass that recomputes activations during backward (eager only)."""
+        return _checkpointed_rnn(self.lstm, x)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
         Forward pass through LSTM model.
@@ -133,7 +207,10 @@ class LSTMModel(nn.Module):
             Output tensor (batch_size, output_size)
         """
         # LSTM forward pass
-        lstm_out, (h_n, c_n) = self.lstm(x)
+        if self.gradient_checkpointing and self.training and torch.is_grad_enabled():
+            lstm_out = self._checkpointed_lstm(x)
+        else:
+            lstm_out, _ = self.lstm(x)
 
         # Use last hidden state
         last_hidden = lstm_out[:, -1, :]
@@ -162,6 +239,7 @@ class GRUModel(nn.Module):
         num_layers: int = 2,
         dropout: float = 0.2,
         output_size: int = 1,
+        gradient_checkpointing: bool = False,
     ):
         """
         Initialize GRU model.
@@ -172,6 +250,8 @@ class GRUModel(nn.Module):
             num_layers: Number of GRU layers
             dropout: Dropout rate for regularization
             output_size: Number of output predictions
+            gradient_checkpointing: Recompute GRU activations during backward
+                instead of storing them (less memory, ~20% more compute)
         """
         super(GRUModel, self).__init__()
 
@@ -179,6 +259,7 @@ class GRUModel(nn.Module):
         self.hidden_size = hidden_size
         self.num_layers = num_layers
         self.output_size = output_size
+        self.gradient_checkpointing = gradient_checkpointing
 
         # GRU layers
         self.gru = nn.GRU(
@@ -195,6 +276,14 @@ class GRUModel(nn.Module):
         self.dropout = nn.Dropout(dropout)
         self.fc2 = nn.Linear(hidden_size // 2, output_size)
 
+        # Total trainable parameter count (fixed once the layers are built)
+        self.num_parameters = sum(p.numel() for p in self.parameters())
+
+    @torch.jit.unused
+    def _checkpointed_gru(self, x: torch.Tensor) -> torch.Tensor:
+        """GRU pass that recomputes activations during backward (eager only)."""
+        return _checkpointed_rnn(self.gru, x)
+
     def forward(self, x: torch.Tensor) -> torch.Tensor:
         """
         Forward pass through GRU model.
@@ -206,7 +295,10 @@ class GRUModel(nn.Module):
             Output tensor (batch_size, output_size)
         """
         # GRU forward pass
-        gru_out, h_n = self.gru(x)
+        if self.gradient_checkpointing and self.training and torch.is_grad_enabled():
+            gru_out = self._checkpointed_gru(x)
+        else:
+            gru_out, _ = self.gru(x)
 
         # Use last hidden state
         last_hidden = gru_out[:, -1, :]
@@ -238,6 +330,11 @@ class LSTMPredictor:
         learning_rate: float = 0.001,
         batch_size: int = 32,
         device: Optional[str] = None,
+        amp_dtype: Optional[torch.dtype] = None,
+        gradient_checkpointing: bool = False,
+        num_workers: int = 0,
+        pin_memory: bool = False,
+        jit: bool = False,
     ):
         """
         Initialize LSTM predictor.
@@ -251,6 +348,15 @@ class LSTMPredictor:
             learning_rate: Learning rate for optimizer
             batch_size: Training batch size
             device: 'cpu', 'cuda', or None (auto-detect)
+            amp_dtype: Autocast dtype for mixed precision (e.g. torch.bfloat16),
+                or None to run in float32
+            gradient_checkpointing: Trade recompute for activation memory when
+                training large models
+            num_workers: DataLoader worker processes (0 = load in main process)
+            pin_memory: Stage batches in pinned host memory for asynchronous
+                copies to CUDA (ignored without CUDA)
+            jit: Compile the model with TorchScript (lower per-call overhead
+                than torch.compile for small recurrent models)
         """
         self.model_type = model_type
         self.sequence_length = sequence_length
@@ -268,6 +374,12 @@ class LSTMPredictor:
 
         logger.info(f"Using device: {self.device}")
 
+        self.amp_dtype = amp_dtype
+        self.gradient_checkpointing = gradient_checkpointing
+        self.num_workers = num_workers
+        self.pin_memory = pin_memory
+        self.jit = jit
+
         # Model and scaler (initialized during fit)
         self.model = None
         self.scaler = StandardScaler()
@@ -283,6 +395,7 @@ class LSTMPredictor:
                 num_layers=self.num_layers,
                 dropout=self.dropout,
                 output_size=1,
+                gradient_checkpointing=self.gradient_checkpointing,
             )
         elif self.model_type == "gru":
             model = GRUModel(
@@ -291,11 +404,48 @@ class LSTMPredictor:
                 num_layers=self.num_layers,
                 dropout=self.dropout,
                 output_size=1,
+                gradient_checkpointing=self.gradient_checkpointing,
             )
         else:
             raise ValueError(f"Unknown model_type: {self.model_type}")
 
-        return model.to(self.device)
+        model = model.to(self.device)
+        if self.jit:
+            if self.gradient_checkpointing:
+                raise ValueError("gradient_checkpointing is not supported with jit")
+            model = torch.jit.script(model)
+
+        return model
+
+    def _autocast(self):
+        """Mixed-precision context for forward passes (no-op without amp_dtype)."""
+        return torch.autocast(
+            device_type=torch.device(self.device).type,
+            dtype=self.amp_dtype,
+            enabled=self.amp_dtype is not None,
+        )
+
+    def _create_loader(
+        self, X: np.ndarray, y: np.ndarray, shuffle: bool = False
+    ) -> DataLoader:
+        """Create a DataLoader over sliding-window sequences of X and y."""
+        # With workers or pinned memory the dataset stays on the host and each
+        # batch is copied to the device asynchronously in the training loop;
+        # otherwise the whole dataset lives on the device up front
+        host_side = self.num_workers > 0 or self.pin_memory
+        dataset = TimeSeriesDataset(
+            X, y, self.sequence_length, "cpu" if host_side else self.device
+        )
+        return DataLoader(
+            dataset,
+            batch_size=self.batch_size,
+            shuffle=shuffle,
+            num_workers=self.num_workers,
+            pin_memory=self.pin_memory and torch.cuda.is_available(),
+            # Keep workers alive across epochs instead of respawning them
+            persistent_workers=self.num_workers > 0,
+            prefetch_factor=2 if self.num_workers > 0 else None,
+        )
 
     def preprocess_data(
         self,
@@ -371,22 +521,12 @@ class LSTMPredictor:
             self.input_size = X_train.shape[1]
             self.model = self._create_model(self.input_size)
 
-        # Create datasets
-        train_dataset = TimeSeriesDataset(
-            X_train, y_train, self.sequence_length, self.device
-        )
-        train_loader = DataLoader(
-            train_dataset, batch_size=self.batch_size, shuffle=True
-        )
+        # Create data loaders
+        train_loader = self._create_loader(X_train, y_train, shuffle=True)
 
         val_loader = None
         if X_val is not None and y_val is not None:
-            val_dataset = TimeSeriesDataset(
-                X_val, y_val, self.sequence_length, self.device
-            )
-            val_loader = DataLoader(
-                val_dataset, batch_size=self.batch_size, shuffle=False
-            )
+            val_loader = self._create_loader(X_val, y_val)
 
         # Loss and optimizer
         criterion = nn.MSELoss()
@@ -403,9 +543,13 @@ class LSTMPredictor:
             train_losses = []
 
             for X_batch, y_batch in train_loader:
+                X_batch = X_batch.to(self.device, non_blocking=True)
+                y_batch = y_batch.to(self.device, non_blocking=True)
                 optimizer.zero_grad()
-                outputs = self.model(X_batch).squeeze()
-                loss = criterion(outputs, y_batch)
+                # bfloat16 keeps float32's exponent range, so no GradScaler needed
+                with self._autocast():
+                    outputs = self.model(X_batch).squeeze()
+                    loss = criterion(outputs, y_batch)
                 loss.backward()
                 optimizer.step()
                 train_losses.append(loss.item())
@@ -418,8 +562,10 @@ class LSTMPredictor:
                 self.model.eval()
                 val_losses = []
 
-                with torch.no_grad():
+                with torch.no_grad(), self._autocast():
                     for X_batch, y_batch in val_loader:
+                        X_batch = X_batch.to(self.device, non_blocking=True)
+                        y_batch = y_batch.to(self.device, non_blocking=True)
                         outputs = self.model(X_batch).squeeze()
                         loss = criterion(outputs, y_batch)
                         val_losses.append(loss.item())
@@ -451,12 +597,14 @@ class LSTMPredictor:
 
         return history
 
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def predict(self, X: np.ndarray, batch_size: Optional[int] = None) -> np.ndarray:
         """
         Make predictions on new data.
 
         Args:
             X: Input features (n_samples, n_features)
+            batch_size: Windows per forward pass, or None to run all
+                windows in a single batch
 
         Returns:
             Predictions (n_samples - sequence_length,)
@@ -466,30 +614,31 @@ class LSTMPredictor:
 
         self.model.eval()
 
-        # Create dataset
         # Use dummy targets (zeros) since we only need predictions
         dummy_targets = np.zeros(len(X))
-        dataset = TimeSeriesDataset(X, dummy_targets, self.sequence_length, self.device)
-        loader = DataLoader(dataset, batch_size=self.batch_size, shuffle=False)
-
-        predictions = []
-        with torch.no_grad():
-            for X_batch, _ in loader:
-                outputs = self.model(X_batch).squeeze()
-                # Handle both single sample and batch predictions
-                output_np = outputs.cpu().numpy()
-                if output_np.ndim == 0:
-                    predictions.append(output_np.item())
-                else:
-                    predictions.extend(output_np)
+        windows, _ = TimeSeriesDataset(
+            X, dummy_targets, self.sequence_length, self.device
+        ).get_all()
+        if len(windows) == 0:
+            return np.empty(0, dtype=np.float32)
+
+        chunks = windows.split(batch_size) if batch_size else (windows,)
+        with torch.inference_mode(), self._autocast():
+            outputs = torch.cat([self.model(chunk) for chunk in chunks])
 
-        return np.array(predictions)
+        return outputs.float().reshape(-1).cpu().numpy()
 
     def save(self, path: str):
         """Save model and scaler to disk."""
         save_dict = {
             "model_state_dict": self.model.state_dict(),
-            "scaler": self.scaler,
+            # Fitted scaler statistics as tensors, so the checkpoint holds no
+            # pickled objects and can be loaded with weights_only=True
+            "scaler_state": {
+                name: torch.as_tensor(np.asarray(getattr(self.scaler, name)))
+                for name in _SCALER_STATE
+                if hasattr(self.scaler, name)
+            },
             "feature_names": self.feature_names,
             "input_size": self.input_size,
             "config": {
@@ -502,12 +651,24 @@ class LSTMPredictor:
         }
 
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump(save_dict, path)
+        torch.save(save_dict, path)
         logger.info(f"Model saved to {path}")
 
     def load(self, path: str):
         """Load model and scaler from disk."""
-        save_dict = joblib.load(path)
+        if zipfile.is_zipfile(path):
+            # Tensors are memory-mapped and only read when copied into the model
+            save_dict = torch.load(
+                path, map_location="cpu", mmap=True, weights_only=True
+            )
+            self.scaler = StandardScaler()
+            for name, value in save_dict["scaler_state"].items():
+                value = value.numpy()
+                setattr(self.scaler, name, value if value.ndim else value.item())
+        else:
+            # Checkpoints written with joblib before the switch to torch.save
+            save_dict = joblib.load(path)
+            self.scaler = save_dict["scaler"]
 
         # Restore configuration
         config = save_dict["config"]
@@ -517,8 +678,7 @@ class LSTMPredictor:
         self.num_layers = config["num_layers"]
         self.dropout = config["dropout"]
 
-        # Restore scaler and features
-        self.scaler = save_dict["scaler"]
+        # Restore features
         self.feature_names = save_dict["feature_names"]
         self.input_size = save_dict["input_size"]
 
@@ -11,14 +11,74 @@ Expected: 40-60% false signal reduction, 65-70% win rate, 2.0-2.5 Sharpe
 
 from dataclasses import dataclass
 from typing import Dict, List, Optional
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from itertools import islice
 import logging
+import math
+import re
 
 import numpy as np
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Optional JIT compilation with graceful fallback to plain Python
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _agreement_kernel(predictions: np.ndarray, decay: float) -> float:
+    """
+    Map the (population) spread of predictions to an agreement score.
+
+    Returns e^(-decay * std): identical predictions score 1.0.
+    """
+    n = predictions.shape[0]
+    mean = 0.0
+    for i in range(n):
+        mean += predictions[i]
+    mean /= n
+
+    var = 0.0
+    for i in range(n):
+        diff = predictions[i] - mean
+        var += diff * diff
+
+    return math.exp(-decay * math.sqrt(var / n))
+
+
+@njit(cache=True)
+def _hybrid_agreement_kernel(
+    ml_confidence: float,
+    llm_confidence: float,
+    ml_agreement: float,
+    llm_agreement: float,
+    directional_match: bool,
+) -> float:
+    """
+    Blend direction, confidence alignment and internal agreement into one score.
+
+    Direction match contributes 0.5, similar confidence up to 0.3 and the
+    average internal agreement up to 0.2; the total is capped at 1.0.
+    """
+    base_score = 0.5 if directional_match else 0.0
+    confidence_bonus = (1.0 - abs(ml_confidence - llm_confidence)) * 0.3
+    internal_bonus = (ml_agreement + llm_agreement) / 2 * 0.2
+    return min(base_score + confidence_bonus + internal_bonus, 1.0)
+
 
 class SignalStrength(Enum):
     """Signal strength classification"""
@@ -31,6 +91,36 @@ class SignalStrength(Enum):
     NO_SIGNAL = "no_signal"  # Both uncertain
 
 
+# Exclusive STRONG / VERY_STRONG thresholds for the ML and LLM confidences and
+# for the agreement score; a signal gets the lowest tier of the three
+_CONFIDENCE_TIERS = (0.65, 0.75)
+_AGREEMENT_TIERS = (0.70, 0.85)
+_TIER_STRENGTH = (None, SignalStrength.STRONG, SignalStrength.VERY_STRONG)
+
+# Position size multiplier per strength: (base, slope on combined confidence)
+# Very strong: oversized 1.0-1.5x, strong: full 1.0x, moderate: reduced 0.5-0.7x;
+# anything else means no trade
+_POSITION_SIZING = {
+    SignalStrength.VERY_STRONG: (1.0, 0.5),
+    SignalStrength.STRONG: (1.0, 0.0),
+    SignalStrength.MODERATE: (0.5, 0.2),
+}
+
+# Lines of LLM reasoning that start with a bullet or a "1."-"3." list marker
+_KEY_FACTOR_RE = re.compile(r"^\s*(?:[•\-*]|[123]\.).*$", re.MULTILINE)
+_KEY_FACTOR_PREFIX = "•-*123456789. "
+
+# LLM direction labels -> ML direction format (anything else is neutral)
+_LLM_DIRECTIONS = {
+    "long": "up",
+    "buy": "up",
+    "bullish": "up",
+    "short": "down",
+    "sell": "down",
+    "bearish": "down",
+}
+
+
 @dataclass
 class MLPrediction:
     """ML Ensemble prediction"""
@@ -130,14 +220,22 @@ class HybridMLLLMPredictor:
         """
         logger.info(f"Generating hybrid signal for {pair}")
 
-        # Stage 1: Get ML Ensemble Prediction
-        ml_pred = self._get_ml_prediction(pair, ohlcv_data)
+        # Stages 1 & 2 are independent: run the LLM consensus (network-bound) in
+        # a worker while the ML ensemble predicts on this thread
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            llm_future = executor.submit(
+                self._get_llm_prediction, pair, ohlcv_data, market_context
+            )
+
+            # Stage 1: Get ML Ensemble Prediction
+            ml_pred = self._get_ml_prediction(pair, ohlcv_data)
+
+            # Stage 2: Get LLM Consensus Prediction
+            llm_pred = llm_future.result()
+
         logger.info(
             f"ML Prediction: {ml_pred.direction} ({ml_pred.confidence:.1%} confidence)"
         )
-
-        # Stage 2: Get LLM Consensus Prediction
-        llm_pred = self._get_llm_prediction(pair, ohlcv_data, market_context)
         logger.info(
             f"LLM Prediction: {llm_pred.direction} ({llm_pred.confidence:.1%} confidence)"
         )
@@ -396,17 +494,13 @@ class HybridMLLLMPredictor:
         Normalize LLM direction to match ML direction format
 
         Args:
-            llm_direction: 'long', 'short', 'neutral'
+            llm_direction: 'long'/'bullish'/'buy', 'short'/'bearish'/'sell',
+                or 'neutral' (case-insensitive)
 
         Returns:
             'up', 'down', 'neutral'
         """
-        if llm_direction == "long":
-            return "up"
-        elif llm_direction == "short":
-            return "down"
-        else:
-            return "neutral"
+        return _LLM_DIRECTIONS.get(llm_direction.lower(), "neutral")
 
     def _calculate_agreement(self, predictions: List[float]) -> float:
         """
@@ -421,15 +515,10 @@ class HybridMLLLMPredictor:
         if not predictions:
             return 0.0
 
-        # Calculate standard deviation (lower = more agreement)
-        std = np.std(predictions)
-
-        # Convert to agreement score (0 std = 1.0 agreement)
+        # Convert standard deviation to agreement score (0 std = 1.0 agreement)
         # Use exponential decay: agreement = e^(-k*std)
         k = 2.0  # Decay constant
-        agreement = np.exp(-k * std)
-
-        return float(agreement)
+        return float(_agreement_kernel(np.asarray(predictions, dtype=np.float64), k))
 
     def _calculate_hybrid_agreement(
         self, ml_pred: MLPrediction, llm_pred: LLMPrediction, directional_match: bool
@@ -445,26 +534,15 @@ class HybridMLLLMPredictor:
         Returns:
             Agreement score (0.0-1.0)
         """
-        # Base agreement from directional match
-        if not directional_match:
-            base_score = 0.0  # Complete disagreement on direction
-        else:
-            base_score = 0.5  # At least they agree on direction
-
-        # Add confidence alignment bonus
-        # If both have similar confidence levels, that's stronger agreement
-        confidence_diff = abs(ml_pred.confidence - llm_pred.confidence)
-        confidence_bonus = (1.0 - confidence_diff) * 0.3  # Up to 30% bonus
-
-        # Add internal agreement bonus
-        # If ML models agree internally AND LLM providers agree internally
-        internal_agreement = (ml_pred.model_agreement + llm_pred.provider_agreement) / 2
-        internal_bonus = internal_agreement * 0.2  # Up to 20% bonus
-
-        # Total agreement
-        agreement = base_score + confidence_bonus + internal_bonus
-
-        return min(agreement, 1.0)  # Cap at 100%
+        return float(
+            _hybrid_agreement_kernel(
+                float(ml_pred.confidence),
+                float(llm_pred.confidence),
+                float(ml_pred.model_agreement),
+                float(llm_pred.provider_agreement),
+                bool(directional_match),
+            )
+        )
 
     def _classify_signal_strength(
         self,
@@ -485,27 +563,20 @@ class HybridMLLLMPredictor:
         Returns:
             SignalStrength classification
         """
-        # Perfect agreement: Both high confidence + same direction + high agreement
-        if (
-            directional_match
-            and ml_pred.confidence > 0.75
-            and llm_pred.confidence > 0.75
-            and agreement_score > 0.85
-        ):
-            return SignalStrength.VERY_STRONG
-
-        # Strong: Both agree + decent confidence + good agreement
-        if (
-            directional_match
-            and ml_pred.confidence > 0.65
-            and llm_pred.confidence > 0.65
-            and agreement_score > 0.70
-        ):
-            return SignalStrength.STRONG
-
-        # Moderate: ML strong but LLM uncertain (or vice versa)
-        if directional_match and ml_pred.confidence > 0.70 and llm_pred.confidence > 0.50:
-            return SignalStrength.MODERATE
+        if directional_match:
+            # Very strong: both confidences > 0.75 and agreement > 0.85
+            # Strong: both confidences > 0.65 and agreement > 0.70
+            tier = min(
+                bisect_left(_CONFIDENCE_TIERS, ml_pred.confidence),
+                bisect_left(_CONFIDENCE_TIERS, llm_pred.confidence),
+                bisect_left(_AGREEMENT_TIERS, agreement_score),
+            )
+            if tier:
+                return _TIER_STRENGTH[tier]
+
+            # Moderate: ML strong but LLM uncertain (or vice versa)
+            if ml_pred.confidence > 0.70 and llm_pred.confidence > 0.50:
+                return SignalStrength.MODERATE
 
         # Weak: Low confidence from either
         if ml_pred.confidence < 0.60 or llm_pred.confidence < 0.60:
@@ -578,14 +649,11 @@ class HybridMLLLMPredictor:
             Combined confidence (0.0-1.0)
         """
         # Weighted average (ML slightly favored for quantitative data)
-        base_confidence = (ml_pred.confidence * 0.6) + (llm_pred.confidence * 0.4)
-
-        # Agreement bonus (0-20% boost)
-        # 50% agreement = 0 bonus, 100% agreement = 20% bonus
-        agreement_bonus = (agreement_score - 0.5) * 0.4
-        agreement_bonus = max(0, agreement_bonus)  # No penalty for disagreement
-
-        combined = base_confidence + agreement_bonus
+        # plus agreement bonus (0-20% boost): 50% agreement = 0 bonus,
+        # 100% agreement = 20% bonus, no penalty for disagreement
+        combined = (ml_pred.confidence * 0.6) + (llm_pred.confidence * 0.4)
+        if agreement_score > 0.5:
+            combined += (agreement_score - 0.5) * 0.4
 
         return min(combined, 1.0)  # Cap at 100%
 
@@ -602,21 +670,8 @@ class HybridMLLLMPredictor:
         Returns:
             Position size multiplier (0.0-1.5)
         """
-        if strength == SignalStrength.VERY_STRONG:
-            # Oversized position: 1.2-1.5x
-            return 1.0 + (combined_confidence * 0.5)
-
-        elif strength == SignalStrength.STRONG:
-            # Full position: 1.0x
-            return 1.0
-
-        elif strength == SignalStrength.MODERATE:
-            # Reduced position: 0.5-0.7x
-            return 0.5 + (combined_confidence * 0.2)
-
-        else:
-            # No trade
-            return 0.0
+        base, slope = _POSITION_SIZING.get(strength, (0.0, 0.0))
+        return base + (combined_confidence * slope) if slope else base
 
     def _extract_key_factors(self, reasoning: str) -> List[str]:
         """
@@ -629,17 +684,13 @@ class HybridMLLLMPredictor:
             List of key factors
         """
         # Simple extraction - look for bullet points or numbered lists
-        key_factors = []
-
-        for line in reasoning.split("\n"):
-            line = line.strip()
-            # Look for bullet points or numbered items
-            if line.startswith(("•", "-", "*", "1.", "2.", "3.")):
-                factor = line.lstrip("•-*123456789. ").strip()
-                if factor:
-                    key_factors.append(factor)
+        factors = (
+            match.group().strip().lstrip(_KEY_FACTOR_PREFIX).strip()
+            for match in _KEY_FACTOR_RE.finditer(reasoning)
+        )
 
-        return key_factors[:5]  # Return top 5 factors
+        # Return top 5 factors (stops scanning once found)
+        return list(islice(filter(None, factors), 5))
 
     def _generate_reasoning(
         self,
@@ -5,6 +5,7 @@ Abstract base class for all LLM providers (ChatGPT, Claude, Gemini).
 Ensures consistent interface across different AI services.
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
@@ -13,6 +14,11 @@ import pandas as pd
 
 from .exceptions import ProviderError, classify_error
 
+# Direction keywords for the default response parser (substring matches;
+# bullish keywords take precedence over bearish ones)
+_LONG_RE = re.compile(r"long|buy|bullish", re.IGNORECASE)
+_SHORT_RE = re.compile(r"short|sell|bearish", re.IGNORECASE)
+
 
 @dataclass
 class MarketAnalysis:
@@ -51,33 +57,29 @@ class OHLCVData:
         """Convert recent OHLCV data to text summary for LLM"""
         recent = self.data.tail(lookback)
 
-        current_price = recent["close"].iloc[-1]
-        price_change_pct = (
-            (current_price - recent["close"].iloc[0]) / recent["close"].iloc[0]
-        ) * 100
+        close = recent["close"].to_numpy()
+        current_price = close[-1]
+        price_change_pct = ((current_price - close[0]) / close[0]) * 100
         high_24h = recent["high"].max()
         low_24h = recent["low"].min()
         avg_volume = recent["volume"].mean()
 
-        summary = f"""
-Pair: {self.pair}
+        indicators_text = ""
+        if self.indicators:
+            indicators_text = "\n\nTechnical Indicators:\n" + "\n".join(
+                f"  {key}: {value:.2f}"
+                if isinstance(value, (int, float))
+                else f"  {key}: {value}"
+                for key, value in self.indicators.items()
+            )
+
+        return f"""Pair: {self.pair}
 Timeframe: {self.timeframe}
 Current Price: ${current_price:,.2f}
 Price Change ({lookback} periods): {price_change_pct:+.2f}%
 24h High: ${high_24h:,.2f}
 24h Low: ${low_24h:,.2f}
-Average Volume: {avg_volume:,.0f}
-"""
-
-        if self.indicators:
-            summary += "\nTechnical Indicators:\n"
-            for key, value in self.indicators.items():
-                if isinstance(value, (int, float)):
-                    summary += f"  {key}: {value:.2f}\n"
-                else:
-                    summary += f"  {key}: {value}\n"
-
-        return summary.strip()
+Average Volume: {avg_volume:,.0f}{indicators_text}"""
 
 
 class BaseLLMProvider(ABC):
@@ -165,23 +167,15 @@ class BaseLLMProvider(ABC):
         sentiment = ""
         reasoning = raw_response
 
-        # Try to extract structured data from response
-        response_lower = raw_response.lower()
-
         # Extract direction
-        if (
-            "long" in response_lower
-            or "buy" in response_lower
-            or "bullish" in response_lower
-        ):
+        if _LONG_RE.search(raw_response):
             direction = "long"
-        elif (
-            "short" in response_lower
-            or "sell" in response_lower
-            or "bearish" in response_lower
-        ):
+        elif _SHORT_RE.search(raw_response):
             direction = "short"
 
+        # Try to extract structured data from response
+        response_lower = raw_response.lower()
+
         # Extract confidence (look for percentages or confidence indicators)
         if "high confidence" in response_lower or "strong signal" in response_lower:
             confidence = 0.8
@@ -7,8 +7,6 @@ Weight in consensus: 40%
 
 from typing import Dict, Any, Optional
 import json
-import openai
-from openai import OpenAI
 from .base import BaseLLMProvider, MarketAnalysis, OHLCVData
 from .exceptions import (
     APIKeyError,
@@ -43,7 +41,9 @@ class ChatGPTProvider(BaseLLMProvider):
         if not self.api_key or not self.api_key.startswith("sk-"):
             raise ValueError("Invalid OpenAI API key format (should start with 'sk-')")
 
-        # Initialize OpenAI client
+        # Initialize OpenAI client (SDK imported lazily - it is slow to import)
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key)
 
     def _call_api(self, prompt: str) -> str:
@@ -64,6 +64,8 @@ class ChatGPTProvider(BaseLLMProvider):
             ModelNotFoundError: Model not found or unavailable
             InvalidResponseError: Unexpected response format
         """
+        import openai
+
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
@@ -7,8 +7,6 @@ Weight in consensus: 35%
 
 from typing import Dict, Any, Optional
 import json
-import anthropic
-from anthropic import Anthropic
 from .base import BaseLLMProvider, MarketAnalysis, OHLCVData
 from .exceptions import (
     APIKeyError,
@@ -46,7 +44,9 @@ class ClaudeProvider(BaseLLMProvider):
                 "Invalid Anthropic API key format (should start with 'sk-ant-')"
             )
 
-        # Initialize Anthropic client
+        # Initialize Anthropic client (SDK imported lazily - it is slow to import)
+        from anthropic import Anthropic
+
         self.client = Anthropic(api_key=self.api_key)
 
     def _call_api(self, prompt: str) -> str:
@@ -67,6 +67,8 @@ class ClaudeProvider(BaseLLMProvider):
             ModelNotFoundError: Model not found or unavailable
             InvalidResponseError: Unexpected response format
         """
+        import anthropic
+
         try:
             response = self.client.messages.create(
                 model=self.model,
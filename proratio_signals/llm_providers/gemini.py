@@ -7,7 +7,6 @@ Weight in consensus: 25%
 
 from typing import Dict, Any, Optional
 import json
-import google.generativeai as genai
 from .base import BaseLLMProvider, MarketAnalysis, OHLCVData
 from .exceptions import (
     APIKeyError,
@@ -43,7 +42,9 @@ class GeminiProvider(BaseLLMProvider):
         if not self.api_key or len(self.api_key) < 20:
             raise ValueError("Invalid Google API key format")
 
-        # Configure Gemini
+        # Configure Gemini (SDK imported lazily - it is slow to import)
+        import google.generativeai as genai
+
         genai.configure(api_key=self.api_key)
         self.model_instance = genai.GenerativeModel(self.model)
 
@@ -65,6 +66,8 @@ class GeminiProvider(BaseLLMProvider):
             ModelNotFoundError: Model not found or unavailable
             InvalidResponseError: Unexpected response format
         """
+        import google.generativeai as genai
+
         try:
             # Add JSON format instruction to prompt
             json_prompt = f"""{prompt}
@@ -9,7 +9,8 @@ Weight Distribution:
 - Gemini: 25% (Market sentiment)
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import pandas as pd
 from datetime import datetime
@@ -127,12 +128,26 @@ class SignalOrchestrator:
         "gemini": 0.25,  # Sentiment
     }
 
+    # Prompt used by each provider
+    PROMPTS = {
+        "chatgpt": TECHNICAL_ANALYSIS_PROMPT,
+        "claude": RISK_ASSESSMENT_PROMPT,
+        "gemini": SENTIMENT_ANALYSIS_PROMPT,
+    }
+
+    # Display names for console output
+    PROVIDER_LABELS = {"chatgpt": "ChatGPT", "claude": "Claude", "gemini": "Gemini"}
+
+    # Providers queried first; the rest only run if these disagree
+    PRIMARY_PROVIDERS = ("chatgpt", "claude")
+
     def __init__(
         self,
         chatgpt_key: Optional[str] = None,
         claude_key: Optional[str] = None,
         gemini_key: Optional[str] = None,
         consensus_threshold: float = 0.6,
+        early_consensus_tolerance: Optional[float] = 0.2,
     ):
         """
         Initialize signal orchestrator.
@@ -142,6 +157,9 @@ class SignalOrchestrator:
             claude_key: Anthropic API key (or load from settings)
             gemini_key: Google API key (or load from settings)
             consensus_threshold: Minimum consensus score to generate signal
+            early_consensus_tolerance: Max confidence gap between agreeing
+                primary providers for skipping the remaining providers
+                (None = always query every provider)
         """
         settings = get_settings()
 
@@ -176,6 +194,7 @@ class SignalOrchestrator:
                 print(f"Gemini initialization failed: {e}")
 
         self.consensus_threshold = consensus_threshold
+        self.early_consensus_tolerance = early_consensus_tolerance
 
         # Validate at least one provider is available
         if not self.providers:
@@ -193,6 +212,12 @@ class SignalOrchestrator:
         """
         Generate consensus signal from multiple AI providers.
 
+        ChatGPT and Claude are queried concurrently first. If both respond
+        with the same direction and confidences within
+        ``early_consensus_tolerance`` of each other, Gemini is skipped and
+        the consensus is built from those two. Otherwise Gemini is queried
+        as the tie-breaker.
+
         Args:
             pair: Trading pair (e.g., 'BTC/USDT')
             timeframe: Timeframe (e.g., '1h', '4h')
@@ -217,176 +242,25 @@ class SignalOrchestrator:
         print("  AI PROVIDER ANALYSIS")
         print("=" * 70)
 
-        # ChatGPT: Technical Analysis
-        if "chatgpt" in self.providers:
-            try:
-                print(
-                    f"\n→ ChatGPT ({self.providers['chatgpt'].model})... ",
-                    end="",
-                    flush=True,
-                )
-                analyses["chatgpt"] = self.providers["chatgpt"].analyze_market(
-                    ohlcv_data=ohlcv, prompt_template=TECHNICAL_ANALYSIS_PROMPT
-                )
-                provider_models["chatgpt"] = self.providers["chatgpt"].model
-                print("✓")
-            except APIKeyError as e:
-                reason = f"API Key Error: {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except QuotaError as e:
-                reason = f"Quota Exceeded: {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except RateLimitError as e:
-                reason = f"Rate Limited (retry after {e.retry_after}s): {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except TimeoutError as e:
-                reason = f"Timeout: {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except ModelNotFoundError as e:
-                reason = f"Model Error: {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except ProviderError as e:
-                reason = f"Provider Error: {str(e)}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-            except Exception as e:
-                reason = f"Unexpected Error: {str(e)[:100]}"
-                failure_reasons["chatgpt"] = reason
-                failed_providers.append("chatgpt")
-                print(f"✗\n  Error: {reason}")
-
-        # Claude: Risk Assessment
-        if "claude" in self.providers:
-            try:
-                print(
-                    f"\n→ Claude ({self.providers['claude'].model})... ",
-                    end="",
-                    flush=True,
-                )
-                analyses["claude"] = self.providers["claude"].analyze_market(
-                    ohlcv_data=ohlcv, prompt_template=RISK_ASSESSMENT_PROMPT
-                )
-                provider_models["claude"] = self.providers["claude"].model
-                print("✓")
-            except APIKeyError as e:
-                reason = f"API Key Error: {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except QuotaError as e:
-                reason = f"Quota Exceeded: {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except RateLimitError as e:
-                reason = f"Rate Limited (retry after {e.retry_after}s): {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except TimeoutError as e:
-                reason = f"Timeout: {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except ModelNotFoundError as e:
-                reason = f"Model Error: {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except ProviderError as e:
-                reason = f"Provider Error: {str(e)}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-            except Exception as e:
-                reason = f"Unexpected Error: {str(e)[:100]}"
-                failure_reasons["claude"] = reason
-                failed_providers.append("claude")
-                print(f"✗\n  Error: {reason}")
-
-        # Gemini: Sentiment
-        if "gemini" in self.providers:
-            try:
-                print(
-                    f"\n→ Gemini ({self.providers['gemini'].model})... ",
-                    end="",
-                    flush=True,
-                )
-                analyses["gemini"] = self.providers["gemini"].analyze_market(
-                    ohlcv_data=ohlcv, prompt_template=SENTIMENT_ANALYSIS_PROMPT
-                )
-                provider_models["gemini"] = self.providers["gemini"].model
-                print("✓")
-            except APIKeyError as e:
-                reason = f"API Key Error: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except QuotaError as e:
-                reason = f"Quota Exceeded: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except RateLimitError as e:
-                reason = f"Rate Limited (retry after {e.retry_after}s): {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except TimeoutError as e:
-                reason = f"Timeout: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except ModelNotFoundError as e:
-                reason = f"Model Error: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except InvalidPromptError as e:
-                reason = f"Content Policy: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except ProviderError as e:
-                reason = f"Provider Error: {str(e)}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
-
-            except Exception as e:
-                reason = f"Unexpected Error: {str(e)[:100]}"
-                failure_reasons["gemini"] = reason
-                failed_providers.append("gemini")
-                print(f"✗\n  Error: {reason}")
+        primary = [name for name in self.PRIMARY_PROVIDERS if name in self.providers]
+        secondary = [name for name in self.providers if name not in primary]
+
+        self._run_providers(
+            primary, ohlcv, analyses, failed_providers, provider_models, failure_reasons
+        )
+
+        skipped_providers = []
+        if secondary and self._primary_agreement(analyses, primary):
+            skipped_providers = secondary
+        else:
+            self._run_providers(
+                secondary,
+                ohlcv,
+                analyses,
+                failed_providers,
+                provider_models,
+                failure_reasons,
+            )
 
         # Show final status
         print("\n" + "=" * 70)
@@ -394,6 +268,10 @@ class SignalOrchestrator:
             print(
                 f"✓ Active: {', '.join(analyses.keys())} ({len(analyses)}/{len(self.providers)})"
             )
+        if skipped_providers:
+            print(
+                f"⏭  Skipped (primary providers agree): {', '.join(skipped_providers)}"
+            )
         if failed_providers:
             print(f"✗ Failed: {', '.join(failed_providers)}")
             for provider in failed_providers:
@@ -407,6 +285,121 @@ class SignalOrchestrator:
             analyses, pair, timeframe, failed_providers, provider_models
         )
 
+    def _run_providers(
+        self,
+        names: List[str],
+        ohlcv: OHLCVData,
+        analyses: Dict[str, MarketAnalysis],
+        failed_providers: List[str],
+        provider_models: Dict[str, str],
+        failure_reasons: Dict[str, str],
+    ) -> None:
+        """
+        Query a group of providers concurrently and record their results.
+
+        Args:
+            names: Provider names to query
+            ohlcv: OHLCV data with indicators
+            analyses: Output dict of provider name -> MarketAnalysis
+            failed_providers: Output list of providers that failed
+            provider_models: Output dict of provider name -> model name
+            failure_reasons: Output dict of provider name -> failure reason
+        """
+        if not names:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            futures = {
+                name: executor.submit(self._query_provider, name, ohlcv)
+                for name in names
+            }
+
+        # Record results in a fixed order so output stays deterministic
+        for name in names:
+            analysis, reason = futures[name].result()
+            model = self.providers[name].model
+            label = self.PROVIDER_LABELS.get(name, name)
+
+            if analysis is not None:
+                analyses[name] = analysis
+                provider_models[name] = model
+                print(f"\n→ {label} ({model})... ✓")
+            else:
+                failure_reasons[name] = reason
+                failed_providers.append(name)
+                print(f"\n→ {label} ({model})... ✗\n  Error: {reason}")
+
+    def _query_provider(
+        self, name: str, ohlcv: OHLCVData
+    ) -> Tuple[Optional[MarketAnalysis], Optional[str]]:
+        """
+        Run a single provider's analysis.
+
+        Args:
+            name: Provider name
+            ohlcv: OHLCV data with indicators
+
+        Returns:
+            (analysis, None) on success, (None, failure reason) on error
+        """
+        try:
+            analysis = self.providers[name].analyze_market(
+                ohlcv_data=ohlcv, prompt_template=self.PROMPTS[name]
+            )
+            return analysis, None
+
+        except APIKeyError as e:
+            return None, f"API Key Error: {str(e)}"
+
+        except QuotaError as e:
+            return None, f"Quota Exceeded: {str(e)}"
+
+        except RateLimitError as e:
+            return None, f"Rate Limited (retry after {e.retry_after}s): {str(e)}"
+
+        except TimeoutError as e:
+            return None, f"Timeout: {str(e)}"
+
+        except ModelNotFoundError as e:
+            return None, f"Model Error: {str(e)}"
+
+        except InvalidPromptError as e:
+            return None, f"Content Policy: {str(e)}"
+
+        except ProviderError as e:
+            return None, f"Provider Error: {str(e)}"
+
+        except Exception as e:
+            return None, f"Unexpected Error: {str(e)[:100]}"
+
+    def _primary_agreement(
+        self, analyses: Dict[str, MarketAnalysis], primary: List[str]
+    ) -> bool:
+        """
+        Check whether the primary providers agree closely enough to skip the rest.
+
+        Args:
+            analyses: Analyses collected so far
+            primary: Primary provider names that were queried
+
+        Returns:
+            True if all primary providers responded with the same direction
+            and their confidences lie within ``early_consensus_tolerance``
+        """
+        if self.early_consensus_tolerance is None or len(primary) < 2:
+            return False
+
+        if any(name not in analyses for name in primary):
+            return False
+
+        directions = {analyses[name].direction for name in primary}
+        confidences = [analyses[name].confidence for name in primary]
+
+        return (
+            len(directions) == 1
+            and max(confidences) - min(confidences) < self.early_consensus_tolerance
+        )
+
     def _calculate_consensus(
         self,
         analyses: Dict[str, MarketAnalysis],
@@ -469,9 +462,10 @@ class SignalOrchestrator:
                 direction_scores[direction] *= reweight_factor
             weighted_confidence *= reweight_factor
 
-            # Log reweighting
+            # Log reweighting (failed or skipped providers)
+            missing = [name for name in self.WEIGHTS if name not in analyses]
             print(
-                f"⚙️  Dynamic reweighting: {total_weight:.0%} → 100% (missing: {', '.join(failed_providers)})"
+                f"⚙️  Dynamic reweighting: {total_weight:.0%} → 100% (missing: {', '.join(missing)})"
             )
 
         # Determine consensus direction (highest score)
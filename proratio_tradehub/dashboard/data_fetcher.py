@@ -6,11 +6,14 @@ database, and AI signal orchestrator.
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 from datetime import datetime
 import sqlite3
 from pathlib import Path
 
+import pandas as pd
+
 from proratio_utilities.config.trading_config import TradingConfig
 from proratio_signals.orchestrator import SignalOrchestrator
 
@@ -120,12 +123,15 @@ class TradeDatabaseReader:
         """Get database connection"""
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(self.db_path)
+        # PRAGMAs are per-connection: memory-map the file and use a 64MB page cache
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-64000")
+        return conn
 
     def get_all_trades(self, limit: int = 100) -> List[Dict]:
         """Get all trades from database"""
         conn = self.get_connection()
-        cursor = conn.cursor()
 
         query = """
         SELECT
@@ -137,12 +143,14 @@ class TradeDatabaseReader:
         LIMIT ?
         """
 
-        cursor.execute(query, (limit,))
-        columns = [desc[0] for desc in cursor.description]
-        trades = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        try:
+            df = pd.read_sql_query(query, conn, params=(limit,))
+        finally:
+            conn.close()
 
-        conn.close()
-        return trades
+        # Keep NULLs (e.g. close_rate of open trades) as None rather than NaN
+        df = df.astype(object).where(df.notna(), None)
+        return df.to_dict(orient="records")
 
     def get_open_trades(self) -> List[Dict]:
         """Get currently open trades"""
@@ -169,37 +177,26 @@ class TradeDatabaseReader:
         conn = self.get_connection()
         cursor = conn.cursor()
 
-        # Total trades
-        cursor.execute("SELECT COUNT(*) FROM trades WHERE is_open = 0")
-        total_trades = cursor.fetchone()[0]
-
-        # Winning trades
         cursor.execute(
-            "SELECT COUNT(*) FROM trades WHERE is_open = 0 AND close_profit > 0"
+            """
+            SELECT
+                COUNT(*),
+                SUM(CASE WHEN close_profit > 0 THEN 1 ELSE 0 END),
+                SUM(CASE WHEN close_profit <= 0 THEN 1 ELSE 0 END),
+                SUM(close_profit_abs),
+                AVG(CASE WHEN close_profit > 0 THEN close_profit END),
+                AVG(CASE WHEN close_profit <= 0 THEN close_profit END)
+            FROM trades
+            WHERE is_open = 0
+            """
         )
-        winning_trades = cursor.fetchone()[0]
-
-        # Losing trades
-        cursor.execute(
-            "SELECT COUNT(*) FROM trades WHERE is_open = 0 AND close_profit <= 0"
-        )
-        losing_trades = cursor.fetchone()[0]
-
-        # Total profit
-        cursor.execute("SELECT SUM(close_profit_abs) FROM trades WHERE is_open = 0")
-        total_profit = cursor.fetchone()[0] or 0.0
-
-        # Average profit
-        cursor.execute(
-            "SELECT AVG(close_profit) FROM trades WHERE is_open = 0 AND close_profit > 0"
-        )
-        avg_profit = cursor.fetchone()[0] or 0.0
-
-        # Average loss
-        cursor.execute(
-            "SELECT AVG(close_profit) FROM trades WHERE is_open = 0 AND close_profit <= 0"
-        )
-        avg_loss = cursor.fetchone()[0] or 0.0
+        row = cursor.fetchone()
+        total_trades = row[0]
+        winning_trades = row[1] or 0
+        losing_trades = row[2] or 0
+        total_profit = row[3] or 0.0
+        avg_profit = row[4] or 0.0
+        avg_loss = row[5] or 0.0
 
         conn.close()
 
@@ -254,13 +251,18 @@ class DashboardDataFetcher:
 
     def get_trading_status(self) -> Dict:
         """Get comprehensive trading status"""
-        # Get from API
-        api_status = self.api.get_status()
-        api_profit = self.api.get_profit()
-
-        # Get from database
-        db_stats = self.db.get_trade_statistics()
-        open_trades = self.db.get_open_trades()
+        # Query the API and database concurrently so a refresh costs the
+        # slowest call rather than the sum of all four
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            status_future = executor.submit(self.api.get_status)
+            profit_future = executor.submit(self.api.get_profit)
+            stats_future = executor.submit(self.db.get_trade_statistics)
+            open_trades_future = executor.submit(self.db.get_open_trades)
+
+            api_status = status_future.result()
+            api_profit = profit_future.result()
+            db_stats = stats_future.result()
+            open_trades = open_trades_future.result()
 
         # Load config
         config = TradingConfig.load_from_file(self.config_path)
@@ -9,6 +9,24 @@ from datetime import datetime, timedelta
 import time
 from proratio_utilities.config.settings import get_settings
 
+# Candle duration in seconds for each Binance timeframe
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "2h": 7200,
+    "4h": 14400,
+    "6h": 21600,
+    "8h": 28800,
+    "12h": 43200,
+    "1d": 86400,
+    "3d": 259200,
+    "1w": 604800,
+}
+
 
 class BinanceCollector:
     """Binance data collector using CCXT"""
@@ -170,18 +188,14 @@ class BinanceCollector:
 
         Returns:
             Seconds as integer
-        """
-        unit = timeframe[-1]
-        amount = int(timeframe[:-1])
-
-        multipliers = {
-            "m": 60,  # minutes
-            "h": 3600,  # hours
-            "d": 86400,  # days
-            "w": 604800,  # weeks
-        }
 
-        return amount * multipliers.get(unit, 3600)
+        Raises:
+            ValueError: If the timeframe is not a supported Binance timeframe
+        """
+        try:
+            return TIMEFRAME_SECONDS[timeframe]
+        except KeyError:
+            raise ValueError(f"Unsupported timeframe: {timeframe}") from None
 
     def get_exchange_info(self) -> dict:
         """Get exchange information (markets, limits, etc.)"""
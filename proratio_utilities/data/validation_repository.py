@@ -120,13 +120,19 @@ class ValidationRepository:
         self.database_url = database_url
 
         # Create SQLAlchemy engine with connection pooling
+        # (SQLite uses its own pool classes, which reject pool sizing arguments)
+        pool_kwargs = {}
+        if not database_url.startswith("sqlite"):
+            pool_kwargs = {
+                "pool_size": 5,  # Connection pool size
+                "max_overflow": 10,  # Additional connections beyond pool_size
+            }
         try:
             self.engine: Engine = create_engine(
                 database_url,
                 pool_pre_ping=True,  # Verify connections before using
-                pool_size=5,  # Connection pool size
-                max_overflow=10,  # Additional connections beyond pool_size
                 echo=False,  # Set to True for SQL debugging
+                **pool_kwargs,
             )
             logger.info("ValidationRepository initialized successfully")
         except SQLAlchemyError as e:
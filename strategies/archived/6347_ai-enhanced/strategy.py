@@ -16,10 +16,16 @@ This strategy requires:
 - Historical OHLCV data for AI context
 """
 
+import hashlib
+import logging
+import pickle
+import sqlite3
 import sys
+import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 # Add project root to Python path for imports
 project_root = Path(__file__).resolve().parents[2]
@@ -27,13 +33,77 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 # These imports must come after sys.path modification - ignore linting
-import talib.abstract as ta  # noqa: E402
-from freqtrade.strategy import IStrategy  # noqa: E402
+import numpy as np  # noqa: E402
+import talib  # noqa: E402
+from freqtrade.strategy import IStrategy, timeframe_to_minutes  # noqa: E402
 from pandas import DataFrame  # noqa: E402
 
 from proratio_signals import SignalOrchestrator, ConsensusSignal  # noqa: E402
 from proratio_signals.llm_providers.base import OHLCVData  # noqa: E402
 
+logger = logging.getLogger(__name__)
+
+# Optional JIT compilation with graceful fallback to plain Python
+try:
+    from numba import njit  # noqa: E402
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _stake_multiplier(
+    confidence: float,
+    multiplier_min: float,
+    multiplier_max: float,
+    min_confidence: float,
+) -> float:
+    """
+    Map AI confidence linearly onto the stake multiplier range.
+
+    Normalizes confidence from [min_confidence, 1.0] to [0, 1] and scales it
+    into [multiplier_min, multiplier_max].
+    """
+    confidence_normalized = (confidence - min_confidence) / (1.0 - min_confidence)
+    return multiplier_min + confidence_normalized * (multiplier_max - multiplier_min)
+
+
+def _rolling_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Trailing simple moving average computed from a cumulative sum.
+
+    Matches ``Series.rolling(window).mean()``: the first ``window - 1``
+    values are NaN.
+    """
+    result = np.full(len(values), np.nan)
+    if len(values) >= window:
+        csum = np.cumsum(values)
+        result[window - 1] = csum[window - 1]
+        result[window:] = csum[window:] - csum[:-window]
+        result[window - 1 :] /= window
+    return result
+
+
+def _crossed_above(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """True where series1 closes above series2 after being at or below it."""
+    crossed = np.zeros(len(series1), dtype=bool)
+    crossed[1:] = (series1[1:] > series2[1:]) & (series1[:-1] <= series2[:-1])
+    return crossed
+
+
+def _crossed_below(series1: np.ndarray, series2: np.ndarray) -> np.ndarray:
+    """True where series1 closes below series2 after being at or above it."""
+    crossed = np.zeros(len(series1), dtype=bool)
+    crossed[1:] = (series1[1:] < series2[1:]) & (series1[:-1] >= series2[:-1])
+    return crossed
+
 
 class AIEnhancedStrategy(IStrategy):
     """
@@ -82,8 +152,14 @@ class AIEnhancedStrategy(IStrategy):
 
     # AI Configuration
     ai_min_confidence = 0.50  # Minimum AI confidence to enter (50%) - lowered for 2/3 providers
-    ai_lookback_candles = 50  # Number of candles to send to AI for context
-    ai_cache_minutes = 60  # Cache AI signals for 60 minutes to avoid API spam
+    # Number of candles passed to the AI orchestrator. Providers condense this
+    # into a fixed-size text summary of the last 20 candles
+    # (OHLCVData.to_summary_text), so prompt size does not grow with it.
+    ai_lookback_candles = 50
+    ai_cache_minutes = 60  # Max age of a cached AI signal at trade confirmation
+    ai_candle_cache_size = 256  # Max (pair, candle) signals kept in the LRU cache
+    ai_disk_cache_enabled = False  # Persist AI signals across runs (SQLite)
+    ai_disk_cache_days = 30  # Drop persisted AI signals older than this
 
     # Position sizing multipliers based on AI confidence
     # Confidence 50% = 0.8x stake, 75% = 1.0x stake, 100% = 1.2x stake
@@ -103,17 +179,47 @@ class AIEnhancedStrategy(IStrategy):
         try:
             self.ai_orchestrator = SignalOrchestrator()
             self.ai_enabled = True
-            print("✓ AI Orchestrator initialized successfully")
-            print(f"  Active providers: {len(self.ai_orchestrator.providers)}")
+            logger.info(
+                "AI Orchestrator initialized (active providers: %d)",
+                len(self.ai_orchestrator.providers),
+            )
         except Exception as e:
-            print(f"✗ Failed to initialize AI Orchestrator: {e}")
-            print("  Strategy will run in TECHNICAL-ONLY mode (no AI signals)")
+            logger.warning(
+                "Failed to initialize AI Orchestrator: %s - running in "
+                "TECHNICAL-ONLY mode (no AI signals)",
+                e,
+            )
             self.ai_orchestrator = None
             self.ai_enabled = False
 
-        # Cache for AI signals (pair -> {signal, timestamp})
+        # Latest AI signal per pair (pair -> {signal, timestamp})
         self.ai_signal_cache = {}
 
+        # Time of the current bot iteration, refreshed once per loop in
+        # bot_loop_start. Only used to stamp signals for frames without a
+        # datetime candle index (see _signal_timestamp)
+        self._loop_time = datetime.now(timezone.utc)
+
+        # LRU cache of AI signals keyed on (pair, candle time), so a signal is
+        # reused for the whole lifetime of a candle
+        self._signal_by_candle = OrderedDict()
+
+        # On-disk AI signal cache, so backtest reruns replay identical signals
+        # instead of re-querying the LLMs
+        self._disk_cache_path = None
+        if self.ai_enabled and self.ai_disk_cache_enabled:
+            user_data_dir = Path(config.get("user_data_dir", "user_data"))
+            self._init_disk_cache(user_data_dir / "ai_signal_cache.sqlite")
+
+    def bot_loop_start(self, current_time: datetime, **kwargs) -> None:
+        """
+        Record the iteration time once per bot loop.
+
+        Args:
+            current_time: Current time (candle time during backtesting)
+        """
+        self._loop_time = current_time
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Add technical indicators to the dataframe.
@@ -125,25 +231,38 @@ class AIEnhancedStrategy(IStrategy):
         Returns:
             DataFrame with indicators added
         """
+        # Extract price arrays once and call TA-Lib's function API directly,
+        # instead of letting each abstract-API call re-read the dataframe
+        high = dataframe["high"].to_numpy(dtype=np.float64)
+        low = dataframe["low"].to_numpy(dtype=np.float64)
+        close = dataframe["close"].to_numpy(dtype=np.float64)
+
         # EMA indicators (same as SimpleTestStrategy)
-        dataframe["ema_fast"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_slow"] = ta.EMA(dataframe, timeperiod=50)
+        dataframe["ema_fast"] = talib.EMA(close, timeperiod=20)
+        dataframe["ema_slow"] = talib.EMA(close, timeperiod=50)
 
         # RSI
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
+        dataframe["rsi"] = talib.RSI(close, timeperiod=14)
 
         # Volume
-        dataframe["volume_mean"] = dataframe["volume"].rolling(window=20).mean()
+        dataframe["volume_mean"] = _rolling_mean(
+            dataframe["volume"].to_numpy(dtype=np.float64), 20
+        )
 
         # Additional indicators for AI context
-        dataframe["atr"] = ta.ATR(dataframe, timeperiod=14)  # Volatility
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)  # Trend strength
+        dataframe["atr"] = talib.ATR(high, low, close, timeperiod=14)  # Volatility
+        dataframe["adx"] = talib.ADX(high, low, close, timeperiod=14)  # Trend strength
 
         # Bollinger Bands (for volatility context)
-        bollinger = ta.BBANDS(dataframe, timeperiod=20)
-        dataframe["bb_upper"] = bollinger["upperband"]
-        dataframe["bb_middle"] = bollinger["middleband"]
-        dataframe["bb_lower"] = bollinger["lowerband"]
+        upper, middle, lower = talib.BBANDS(close, timeperiod=20)
+        dataframe["bb_upper"] = upper
+        dataframe["bb_middle"] = middle
+        dataframe["bb_lower"] = lower
+
+        # Signal columns start as int8 zeros (no signal) so they never exist as
+        # float64/NaN, even if entry/exit population bails out early
+        dataframe["enter_long"] = np.zeros(len(dataframe), dtype=np.int8)
+        dataframe["exit_long"] = np.zeros(len(dataframe), dtype=np.int8)
 
         return dataframe
 
@@ -165,69 +284,186 @@ class AIEnhancedStrategy(IStrategy):
             return None
 
         pair = metadata["pair"]
-        current_time = datetime.now(timezone.utc)
-
-        # Check cache first
-        if pair in self.ai_signal_cache:
-            cached = self.ai_signal_cache[pair]
-            age_minutes = (current_time - cached["timestamp"]).total_seconds() / 60
+        candle_time = (
+            dataframe["date"].iloc[-1]
+            if "date" in dataframe.columns
+            else dataframe.index[-1]
+        )
+        cache_key = (pair, candle_time)
 
-            if age_minutes < self.ai_cache_minutes:
-                # Cache is still valid
-                return cached["signal"]
+        # Check cache first (same candle → same signal)
+        if cache_key in self._signal_by_candle:
+            self._signal_by_candle.move_to_end(cache_key)
+            return self._signal_by_candle[cache_key]
 
         # Generate new AI signal
         try:
-            # Get recent candles for AI context
-            recent_data = dataframe.tail(self.ai_lookback_candles).copy()
+            # Slice the recent OHLCV window for AI context. Column selection
+            # already yields a new frame, so no defensive copy or index reset
+            # is needed (providers only read it via OHLCVData.to_summary_text).
+            recent_data = dataframe[["open", "high", "low", "close", "volume"]].tail(
+                self.ai_lookback_candles
+            )
 
-            # Ensure timestamp column exists
-            if "timestamp" not in recent_data.columns:
-                recent_data.reset_index(inplace=True)
-                if "date" in recent_data.columns:
-                    recent_data.rename(columns={"date": "timestamp"}, inplace=True)
+            # Latest indicator values (last row of the full dataframe)
+            last_row = dataframe.iloc[-1]
 
             # Convert to OHLCVData format
             ohlcv = OHLCVData(
                 pair=pair,
                 timeframe=self.timeframe,
-                data=recent_data[["open", "high", "low", "close", "volume"]].copy(),
+                data=recent_data,
                 indicators={
-                    "ema_fast": recent_data["ema_fast"].iloc[-1]
-                    if "ema_fast" in recent_data.columns
-                    else None,
-                    "ema_slow": recent_data["ema_slow"].iloc[-1]
-                    if "ema_slow" in recent_data.columns
-                    else None,
-                    "rsi": recent_data["rsi"].iloc[-1]
-                    if "rsi" in recent_data.columns
-                    else None,
-                    "atr": recent_data["atr"].iloc[-1]
-                    if "atr" in recent_data.columns
-                    else None,
-                    "adx": recent_data["adx"].iloc[-1]
-                    if "adx" in recent_data.columns
-                    else None,
+                    name: last_row[name] if name in dataframe.columns else None
+                    for name in ("ema_fast", "ema_slow", "rsi", "atr", "adx")
                 },
             )
 
-            # Generate AI consensus
-            signal = self.ai_orchestrator.generate_signal(
-                pair=pair,
-                timeframe=self.timeframe,
-                ohlcv_data=ohlcv.data,
-                indicators=ohlcv.indicators,
-            )
+            # Reuse a persisted signal for identical prompt inputs
+            disk_key = None
+            signal = None
+            if self._disk_cache_path is not None:
+                disk_key = self._disk_cache_key(pair, candle_time, ohlcv)
+                signal = self._load_disk_signal(disk_key)
+
+            if signal is None:
+                # Generate AI consensus
+                signal = self.ai_orchestrator.generate_signal(
+                    pair=pair,
+                    timeframe=self.timeframe,
+                    ohlcv_data=ohlcv.data,
+                    indicators=ohlcv.indicators,
+                )
+                self._store_disk_signal(disk_key, signal)
 
             # Cache the signal
-            self.ai_signal_cache[pair] = {"signal": signal, "timestamp": current_time}
+            self._signal_by_candle[cache_key] = signal
+            if len(self._signal_by_candle) > self.ai_candle_cache_size:
+                self._signal_by_candle.popitem(last=False)
+            self.ai_signal_cache[pair] = {
+                "signal": signal,
+                "timestamp": self._signal_timestamp(candle_time),
+            }
 
             return signal
 
         except Exception as e:
-            print(f"✗ AI signal generation failed for {pair}: {e}")
+            logger.error("AI signal generation failed for %s: %s", pair, e)
             return None
 
+    def _signal_timestamp(self, candle_time) -> datetime:
+        """
+        Time a signal for candle_time becomes valid (the candle's close).
+
+        Stamping with the candle rather than the clock keeps signal ages
+        correct in backtests, where populate_* runs over the whole history
+        before bot_loop_start is ever called.
+
+        Args:
+            candle_time: Open time of the last candle the signal was built on
+
+        Returns:
+            Close time of that candle, or the loop time if candle_time is not
+            a datetime
+        """
+        if not isinstance(candle_time, datetime):
+            return self._loop_time
+        return candle_time + timedelta(minutes=timeframe_to_minutes(self.timeframe))
+
+    def _init_disk_cache(self, path: Path) -> None:
+        """
+        Create the on-disk AI signal cache and purge expired entries.
+
+        Args:
+            path: SQLite database file for the cache
+        """
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with sqlite3.connect(path) as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS ai_signals "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, signal BLOB NOT NULL)"
+                )
+                conn.execute(
+                    "DELETE FROM ai_signals WHERE created < ?",
+                    (time.time() - self.ai_disk_cache_days * 86400,),
+                )
+            self._disk_cache_path = path
+        except sqlite3.Error as e:
+            logger.warning("AI signal disk cache disabled (%s): %s", path, e)
+
+    def _disk_cache_key(self, pair: str, candle_time, ohlcv: OHLCVData) -> str:
+        """
+        Build the persistent cache key for an AI signal request.
+
+        The key covers the pair, timeframe and candle, the model used by each
+        provider, the prompt templates and the market summary the providers
+        send, so any change to what the LLMs would see invalidates the entry.
+
+        Returns:
+            Hex digest identifying the request
+        """
+        providers = getattr(self.ai_orchestrator, "providers", {})
+        models = (
+            sorted((name, str(p.model)) for name, p in providers.items())
+            if isinstance(providers, dict)
+            else []
+        )
+        prompts = getattr(self.ai_orchestrator, "PROMPTS", {})
+        prompt_texts = sorted(prompts.items()) if isinstance(prompts, dict) else []
+
+        digest = hashlib.blake2b(digest_size=20)
+        for part in (
+            pair,
+            self.timeframe,
+            str(candle_time),
+            repr(models),
+            repr(prompt_texts),
+            ohlcv.to_summary_text(lookback=20),
+        ):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def _load_disk_signal(self, key: str) -> Optional[ConsensusSignal]:
+        """
+        Return the persisted signal for key, or None on miss/disabled cache.
+
+        An entry that cannot be read back (e.g. pickled by an incompatible
+        version of ConsensusSignal) is deleted, so the caller falls through to
+        a live query and overwrites it.
+        """
+        if self._disk_cache_path is None:
+            return None
+        try:
+            with sqlite3.connect(self._disk_cache_path) as conn:
+                row = conn.execute(
+                    "SELECT signal FROM ai_signals WHERE key = ?", (key,)
+                ).fetchone()
+            return pickle.loads(row[0]) if row else None
+        except Exception as e:
+            logger.warning("Discarding unreadable AI signal disk cache entry: %s", e)
+            try:
+                with sqlite3.connect(self._disk_cache_path) as conn:
+                    conn.execute("DELETE FROM ai_signals WHERE key = ?", (key,))
+            except sqlite3.Error:
+                pass
+            return None
+
+    def _store_disk_signal(self, key: str, signal: ConsensusSignal) -> None:
+        """Persist signal under key (no-op when the disk cache is disabled)."""
+        if self._disk_cache_path is None or signal is None:
+            return
+        try:
+            with sqlite3.connect(self._disk_cache_path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO ai_signals (key, created, signal) "
+                    "VALUES (?, ?, ?)",
+                    (key, time.time(), pickle.dumps(signal)),
+                )
+        except (sqlite3.Error, pickle.PicklingError, TypeError) as e:
+            logger.warning("Failed to write AI signal disk cache: %s", e)
+
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         Define entry (buy) signals with AI enhancement.
@@ -246,21 +482,21 @@ class AIEnhancedStrategy(IStrategy):
         # Get AI signal for current market state
         ai_signal = self.get_ai_signal(dataframe, metadata)
 
-        # Technical conditions (from SimpleTestStrategy)
+        # Technical conditions (from SimpleTestStrategy), evaluated on raw
+        # arrays to skip pandas index alignment and shifted-copy temporaries
+        rsi = dataframe["rsi"].to_numpy()
         technical_conditions = (
             # EMA crossover: fast crosses above slow
-            (dataframe["ema_fast"] > dataframe["ema_slow"])
-            & (dataframe["ema_fast"].shift(1) <= dataframe["ema_slow"].shift(1))
-            &
+            _crossed_above(
+                dataframe["ema_fast"].to_numpy(), dataframe["ema_slow"].to_numpy()
+            )
             # RSI not overbought
-            (dataframe["rsi"] > 30)
-            & (dataframe["rsi"] < 70)
-            &
+            & (rsi > 30)
+            & (rsi < 70)
             # Volume confirmation
-            (dataframe["volume"] > dataframe["volume_mean"])
-            &
+            & (dataframe["volume"].to_numpy() > dataframe["volume_mean"].to_numpy())
             # Trend strength (ADX > 20 = trending market)
-            (dataframe["adx"] > 20)
+            & (dataframe["adx"].to_numpy() > 20)
         )
 
         # AI conditions
@@ -270,23 +506,27 @@ class AIEnhancedStrategy(IStrategy):
             )
 
             # Combine technical + AI
-            dataframe.loc[technical_conditions & ai_conditions, "enter_long"] = 1
+            dataframe["enter_long"] = (technical_conditions & ai_conditions).astype(
+                np.int8
+            )
 
             # Debug logging
-            if ai_conditions:
-                print(
-                    f"✓ AI ENTRY signal for {metadata['pair']}: "
-                    f"direction={ai_signal.direction}, "
-                    f"confidence={ai_signal.confidence:.1%}, "
-                    f"providers={len(ai_signal.active_providers or [])}"
+            if ai_conditions and logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "AI ENTRY signal for %s: direction=%s, confidence=%.3f, providers=%d",
+                    metadata["pair"],
+                    ai_signal.direction,
+                    ai_signal.confidence,
+                    len(ai_signal.active_providers or []),
                 )
         else:
             # Fallback to technical-only if AI unavailable
-            dataframe.loc[technical_conditions, "enter_long"] = 1
+            dataframe["enter_long"] = technical_conditions.astype(np.int8)
 
             if self.ai_enabled:
-                print(
-                    f"⚠ AI signal unavailable for {metadata['pair']}, using technical-only entry"
+                logger.debug(
+                    "AI signal unavailable for %s, using technical-only entry",
+                    metadata["pair"],
                 )
 
         return dataframe
@@ -312,13 +552,11 @@ class AIEnhancedStrategy(IStrategy):
         # Technical exit conditions (from SimpleTestStrategy)
         technical_exit = (
             # EMA crossover: fast crosses below slow
-            (
-                (dataframe["ema_fast"] < dataframe["ema_slow"])
-                & (dataframe["ema_fast"].shift(1) >= dataframe["ema_slow"].shift(1))
+            _crossed_below(
+                dataframe["ema_fast"].to_numpy(), dataframe["ema_slow"].to_numpy()
             )
-            |
             # RSI overbought
-            (dataframe["rsi"] > 70)
+            | (dataframe["rsi"].to_numpy() > 70)
         )
 
         # AI exit conditions (direction changes or low confidence)
@@ -329,17 +567,18 @@ class AIEnhancedStrategy(IStrategy):
             )
 
             # Exit if technical OR AI says exit
-            dataframe.loc[technical_exit | ai_exit, "exit_long"] = 1
+            dataframe["exit_long"] = (technical_exit | ai_exit).astype(np.int8)
 
             if ai_exit:
-                print(
-                    f"✓ AI EXIT signal for {metadata['pair']}: "
-                    f"direction={ai_signal.direction}, "
-                    f"confidence={ai_signal.confidence:.1%}"
+                logger.debug(
+                    "AI EXIT signal for %s: direction=%s, confidence=%.3f",
+                    metadata["pair"],
+                    ai_signal.direction,
+                    ai_signal.confidence,
                 )
         else:
             # Fallback to technical-only
-            dataframe.loc[technical_exit, "exit_long"] = 1
+            dataframe["exit_long"] = technical_exit.astype(np.int8)
 
         return dataframe
 
@@ -378,20 +617,12 @@ class AIEnhancedStrategy(IStrategy):
                 # 50% confidence → 0.8x stake
                 # 75% confidence → 1.0x stake
                 # 100% confidence → 1.2x stake
-                # Formula: normalize confidence (0.5-1.0) to multiplier range (0.8-1.2)
-                confidence_normalized = (signal.confidence - self.ai_min_confidence) / (
-                    1.0 - self.ai_min_confidence
+                multiplier = _stake_multiplier(
+                    signal.confidence,
+                    self.ai_confidence_multiplier_min,
+                    self.ai_confidence_multiplier_max,
+                    self.ai_min_confidence,
                 )
-                multiplier = self.ai_confidence_multiplier_min + (
-                    confidence_normalized
-                    * (
-                        self.ai_confidence_multiplier_max
-                        - self.ai_confidence_multiplier_min
-                    )
-                )
-                # At 60%: (0.6-0.6)/(1-0.6) = 0.0 → 0.8 + 0.0*(1.2-0.8) = 0.8x
-                # At 80%: (0.8-0.6)/(1-0.6) = 0.5 → 0.8 + 0.5*0.4 = 1.0x
-                # At 100%: (1.0-0.6)/(1-0.6) = 1.0 → 0.8 + 1.0*0.4 = 1.2x
 
                 adjusted_stake = proposed_stake * multiplier
 
@@ -401,11 +632,14 @@ class AIEnhancedStrategy(IStrategy):
                 if adjusted_stake > max_stake:
                     adjusted_stake = max_stake
 
-                print(
-                    f"💰 Position sizing for {pair}: "
-                    f"base={proposed_stake:.2f} → "
-                    f"adjusted={adjusted_stake:.2f} "
-                    f"(AI confidence={signal.confidence:.1%}, multiplier={multiplier:.2f}x)"
+                logger.debug(
+                    "Position sizing for %s: base=%.2f -> adjusted=%.2f "
+                    "(AI confidence=%.3f, multiplier=%.2fx)",
+                    pair,
+                    proposed_stake,
+                    adjusted_stake,
+                    signal.confidence,
+                    multiplier,
                 )
 
                 return adjusted_stake
@@ -436,26 +670,30 @@ class AIEnhancedStrategy(IStrategy):
         if pair in self.ai_signal_cache:
             cached = self.ai_signal_cache[pair]
             signal = cached["signal"]
-            age_minutes = (
-                datetime.now(timezone.utc) - cached["timestamp"]
-            ).total_seconds() / 60
+            age_minutes = (current_time - cached["timestamp"]).total_seconds() / 60
 
             # Reject if signal expired or confidence dropped
             if age_minutes >= self.ai_cache_minutes:
-                print(
-                    f"✗ Rejecting {pair} entry: AI signal expired ({age_minutes:.1f} min old)"
+                logger.info(
+                    "Rejecting %s entry: AI signal expired (%.1f min old)",
+                    pair,
+                    age_minutes,
                 )
                 return False
 
             if signal.confidence < self.ai_min_confidence:
-                print(
-                    f"✗ Rejecting {pair} entry: AI confidence too low ({signal.confidence:.1%})"
+                logger.info(
+                    "Rejecting %s entry: AI confidence too low (%.3f)",
+                    pair,
+                    signal.confidence,
                 )
                 return False
 
             if signal.direction.lower() != "long":
-                print(
-                    f"✗ Rejecting {pair} entry: AI direction changed to {signal.direction}"
+                logger.info(
+                    "Rejecting %s entry: AI direction changed to %s",
+                    pair,
+                    signal.direction,
                 )
                 return False
 
@@ -4,6 +4,8 @@ Tests for Dashboard Data Fetcher
 Tests the data fetching utilities for the Streamlit dashboard.
 """
 
+import sqlite3
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
@@ -97,30 +99,60 @@ class TestTradeDatabaseReader:
         reader = TradeDatabaseReader(db_path=mock_db_path)
         assert str(reader.db_path) == mock_db_path
 
-    @patch("sqlite3.connect")
-    @patch("pathlib.Path.exists")
-    def test_get_all_trades(self, mock_exists, mock_connect):
+    def test_get_all_trades(self, mock_db_path):
         """Test retrieving all trades"""
-        mock_exists.return_value = True
-
-        # Mock cursor and connection
-        mock_cursor = MagicMock()
-        mock_cursor.description = [("id",), ("pair",), ("is_open",)]
-        mock_cursor.fetchall.return_value = [
-            (1, "BTC/USDT", 0),
-            (2, "ETH/USDT", 0),
-        ]
-
-        mock_conn = MagicMock()
-        mock_conn.cursor.return_value = mock_cursor
-        mock_connect.return_value = mock_conn
+        conn = sqlite3.connect(mock_db_path)
+        conn.execute(
+            """
+            CREATE TABLE trades (
+                id INTEGER, pair TEXT, is_open INTEGER, open_date TEXT,
+                close_date TEXT, open_rate REAL, close_rate REAL, amount REAL,
+                stake_amount REAL, close_profit REAL, close_profit_abs REAL
+            )
+            """
+        )
+        conn.executemany(
+            "INSERT INTO trades VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    1,
+                    "ETH/USDT",
+                    0,
+                    "2025-10-01",
+                    "2025-10-02",
+                    2500.0,
+                    2550.0,
+                    0.1,
+                    250.0,
+                    0.02,
+                    5.0,
+                ),
+                (
+                    2,
+                    "BTC/USDT",
+                    1,
+                    "2025-10-03",
+                    None,
+                    62500.0,
+                    None,
+                    0.01,
+                    625.0,
+                    None,
+                    None,
+                ),
+            ],
+        )
+        conn.commit()
+        conn.close()
 
-        reader = TradeDatabaseReader(db_path="test.db")
+        reader = TradeDatabaseReader(db_path=mock_db_path)
         trades = reader.get_all_trades(limit=100)
 
         assert len(trades) == 2
         assert trades[0]["pair"] == "BTC/USDT"
         assert trades[1]["pair"] == "ETH/USDT"
+        assert trades[0]["close_rate"] is None
+        assert trades[1]["close_profit_abs"] == 5.0
 
     @patch("sqlite3.connect")
     @patch("pathlib.Path.exists")
@@ -130,14 +162,14 @@ class TestTradeDatabaseReader:
 
         # Mock cursor
         mock_cursor = MagicMock()
-        mock_cursor.fetchone.side_effect = [
-            (100,),  # total_trades
-            (65,),  # winning_trades
-            (35,),  # losing_trades
-            (1234.56,),  # total_profit
-            (0.023,),  # avg_profit
-            (-0.015,),  # avg_loss
-        ]
+        mock_cursor.fetchone.return_value = (
+            100,  # total_trades
+            65,  # winning_trades
+            35,  # losing_trades
+            1234.56,  # total_profit
+            0.023,  # avg_profit
+            -0.015,  # avg_loss
+        )
 
         mock_conn = MagicMock()
         mock_conn.cursor.return_value = mock_cursor
@@ -153,20 +185,28 @@ class TestTradeDatabaseReader:
         assert stats["total_profit"] == 1234.56
         assert stats["avg_profit"] == 2.3
         assert stats["avg_loss"] == -1.5
+        mock_cursor.execute.assert_called_once()
+
+
+@pytest.fixture(scope="module")
+def mock_fetcher():
+    """Create a data fetcher with mocked dependencies (shared by the module)"""
+    with (
+        patch("proratio_tradehub.dashboard.data_fetcher.FreqtradeAPIClient"),
+        patch("proratio_tradehub.dashboard.data_fetcher.TradeDatabaseReader"),
+    ):
+        return DashboardDataFetcher()
 
 
 class TestDashboardDataFetcher:
     """Tests for main dashboard data fetcher"""
 
-    @pytest.fixture
-    def mock_fetcher(self):
-        """Create a data fetcher with mocked dependencies"""
-        with (
-            patch("proratio_tradehub.dashboard.data_fetcher.FreqtradeAPIClient"),
-            patch("proratio_tradehub.dashboard.data_fetcher.TradeDatabaseReader"),
-        ):
-            fetcher = DashboardDataFetcher()
-            return fetcher
+    @pytest.fixture(autouse=True)
+    def reset_fetcher(self, mock_fetcher):
+        """Clear mock state left over from the previous test"""
+        mock_fetcher.api.reset_mock(return_value=True, side_effect=True)
+        mock_fetcher.db.reset_mock(return_value=True, side_effect=True)
+        mock_fetcher.signal_orchestrator = None
 
     def test_init(self, mock_fetcher):
         """Test data fetcher initialization"""
@@ -11,87 +11,92 @@ Created: 2025-10-28
 """
 
 import pytest
-import tempfile
-from pathlib import Path
 from datetime import datetime, timedelta
+from types import MappingProxyType
+from unittest.mock import MagicMock
 import pandas as pd
 import numpy as np
-from sqlalchemy import create_engine
 
 from proratio_utilities.data.validation_repository import ValidationRepository
 
 
-@pytest.fixture(scope="function")
-def test_db_engine():
+@pytest.fixture(scope="session")
+def _shared_validation_repo():
     """
-    Provide an in-memory SQLite database engine for testing.
+    Build one in-memory SQLite ValidationRepository and its schema per session.
 
-    Scope: function - each test gets a fresh database.
+    Scope: session - engine creation and CREATE TABLE run once; the
+    per-test fixtures below only clear rows.
 
     Yields:
-        SQLAlchemy engine connected to in-memory SQLite database.
+        ValidationRepository instance with the validation_results table created.
     """
-    # Create in-memory SQLite engine
-    engine = create_engine("sqlite:///:memory:", echo=False)
-
-    # Create validation_results table
-    from proratio_utilities.data.validation_repository import ValidationRepository
-
     repo = ValidationRepository(database_url="sqlite:///:memory:")
-    repo.metadata.create_all(engine)
+    repo.metadata.create_all(repo.engine)
 
-    yield engine
+    yield repo
 
     # Cleanup
-    engine.dispose()
+    repo.engine.dispose()
+
+
+def _reset_validation_results(repo: ValidationRepository) -> None:
+    """Delete all rows from the shared validation_results table."""
+    with repo.engine.begin() as conn:
+        conn.execute(repo.validation_results.delete())
 
 
 @pytest.fixture(scope="function")
-def test_validation_repo():
+def test_db_engine(_shared_validation_repo):
     """
-    Provide a ValidationRepository instance connected to an in-memory SQLite database.
+    Provide an in-memory SQLite database engine for testing.
 
-    Scope: function - each test gets a fresh repository with empty database.
+    Scope: function - each test starts with an empty validation_results table.
 
     Returns:
-        ValidationRepository instance for testing.
+        SQLAlchemy engine connected to in-memory SQLite database.
     """
-    # Create in-memory SQLite repository
-    repo = ValidationRepository(database_url="sqlite:///:memory:")
+    _reset_validation_results(_shared_validation_repo)
+    return _shared_validation_repo.engine
 
-    # Create tables
-    repo.metadata.create_all(repo.engine)
 
-    yield repo
+@pytest.fixture(scope="function")
+def test_validation_repo(_shared_validation_repo):
+    """
+    Provide a ValidationRepository instance connected to an in-memory SQLite database.
 
-    # Cleanup
-    repo.engine.dispose()
+    Scope: function - each test gets the shared repository with an empty database.
+
+    Returns:
+        ValidationRepository instance for testing.
+    """
+    _reset_validation_results(_shared_validation_repo)
+    return _shared_validation_repo
 
 
 @pytest.fixture(scope="function")
-def test_storage_dir():
+def test_storage_dir(tmp_path):
     """
     Provide a temporary directory for data storage tests.
 
     Scope: function - each test gets a fresh temporary directory.
 
-    Yields:
+    Returns:
         Path object pointing to temporary directory.
 
-    Note: Automatic cleanup when context exits.
+    Note: Backed by pytest's tmp_path, which handles cleanup and retention.
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
+    return tmp_path
 
 
-@pytest.fixture(scope="function")
-def mock_market_data():
+@pytest.fixture(scope="session")
+def _mock_market_data_base():
     """
-    Provide synthetic market data for signal generation tests.
+    Build the synthetic market data once for the whole test session.
 
     Generates 100 hours of synthetic OHLCV data with realistic patterns.
 
-    Scope: function - each test gets fresh synthetic data.
+    Scope: session - the data is seeded, so every test would get the same frame.
 
     Returns:
         pandas.DataFrame with columns: timestamp, open, high, low, close, volume.
@@ -99,28 +104,27 @@ def mock_market_data():
     # Generate 100 hours of hourly data
     dates = pd.date_range("2024-01-01", periods=100, freq="1h")
 
-    # Generate synthetic price data with trend and noise
-    base_price = 50000.0
-    trend = np.linspace(0, 2000, 100)  # Upward trend
-    noise = np.random.randn(100) * 500  # Random fluctuations
+    # One seeded draw: rows are close noise, high wick, low wick, volume noise
+    rng = np.random.default_rng(0)
+    z = rng.standard_normal((4, 100))
 
-    close_prices = base_price + trend + noise
+    # Synthetic close prices with upward trend and random fluctuations
+    base_price = 50000.0
+    close_prices = base_price + np.linspace(0, 2000, 100) + 500 * z[0]
 
-    # Generate OHLC from close prices
-    open_prices = np.roll(close_prices, 1)
+    # Open is the previous close
+    open_prices = np.empty_like(close_prices)
     open_prices[0] = base_price
+    open_prices[1:] = close_prices[:-1]
 
-    high_prices = np.maximum(open_prices, close_prices) + np.abs(
-        np.random.randn(100) * 200
-    )
-    low_prices = np.minimum(open_prices, close_prices) - np.abs(
-        np.random.randn(100) * 200
-    )
+    # Wicks extend beyond the candle body
+    high_prices = np.maximum(open_prices, close_prices)
+    high_prices += 200 * np.abs(z[1], out=z[1])
+    low_prices = np.minimum(open_prices, close_prices)
+    low_prices -= 200 * np.abs(z[2], out=z[2])
 
     # Generate volume with realistic patterns
-    base_volume = 1000000
-    volume_noise = np.random.randn(100) * 200000
-    volumes = base_volume + volume_noise
+    volumes = 1_000_000 + 200_000 * z[3]
 
     return pd.DataFrame(
         {
@@ -134,6 +138,77 @@ def mock_market_data():
     )
 
 
+@pytest.fixture(scope="function")
+def mock_market_data(_mock_market_data_base):
+    """
+    Provide synthetic market data for signal generation tests.
+
+    Scope: function, backed by the session-wide frame. The frame is shared,
+    so tests that mutate it must work on ``mock_market_data.copy()``.
+
+    Returns:
+        pandas.DataFrame with columns: timestamp, open, high, low, close, volume.
+    """
+    return _mock_market_data_base
+
+
+@pytest.fixture(scope="session")
+def mock_market_rows(_mock_market_data_base):
+    """
+    Provide the synthetic market data as database rows (cursor.fetchall format).
+
+    Scope: session.
+
+    Returns:
+        List of tuples: (timestamp, open, high, low, close, volume).
+    """
+    return list(_mock_market_data_base.itertuples(index=False, name=None))
+
+
+@pytest.fixture(scope="session")
+def mock_market_description(_mock_market_data_base):
+    """
+    Provide a cursor.description matching mock_market_rows.
+
+    Scope: session.
+
+    Returns:
+        List of 1-tuples holding the column names.
+    """
+    return [(col,) for col in _mock_market_data_base.columns]
+
+
+@pytest.fixture(scope="function")
+def make_db_mock(mock_market_rows, mock_market_description):
+    """
+    Provide a factory for mocked database connections serving the market data.
+
+    The cursor is spec'd to the DB-API attributes DatabaseStorage and
+    pandas.read_sql_query use, so typos fail loudly instead of silently
+    creating new mock attributes.
+
+    Scope: function.
+
+    Returns:
+        Callable ``(rowcount=None) -> (conn, cursor)``; rowcount defaults to
+        the number of market data rows.
+    """
+
+    def _make(rowcount=None):
+        cursor = MagicMock(
+            spec=["fetchall", "fetchone", "description", "rowcount", "execute", "close"]
+        )
+        cursor.fetchall.return_value = mock_market_rows
+        cursor.description = mock_market_description
+        cursor.rowcount = len(mock_market_rows) if rowcount is None else rowcount
+
+        conn = MagicMock()
+        conn.cursor.return_value = cursor
+        return conn, cursor
+
+    return _make
+
+
 @pytest.fixture(scope="function")
 def sample_validation_result():
     """
@@ -157,29 +232,28 @@ def sample_validation_result():
     }
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="session")
 def sample_validation_results_batch():
     """
     Provide a batch of sample validation results for testing queries.
 
-    Generates 20 validation results across 3 strategies over 10 days.
+    Generates 20 validation results across 3 strategies over 10 days,
+    starting 2024-01-01 (two results per day).
 
-    Scope: function.
+    Scope: session - results are read-only views, so tests cannot mutate
+    the shared data.
 
     Returns:
-        List[dict]: List of validation result dictionaries.
+        Tuple[MappingProxyType, ...]: Read-only validation result mappings.
     """
     strategies = ["GridTrading", "AIEnhanced", "MomentumStrategy"]
-    results = []
-
-    for i in range(20):
-        strategy = strategies[i % 3]
-        timestamp = datetime.utcnow() - timedelta(days=10 - i // 2)
+    base = datetime(2024, 1, 1)
 
-        results.append(
+    return tuple(
+        MappingProxyType(
             {
-                "strategy_name": strategy,
-                "timestamp": timestamp,
+                "strategy_name": strategies[i % 3],
+                "timestamp": base + timedelta(days=i // 2),
                 "total_trades": 100 + i * 10,
                 "win_rate": 50.0 + i * 1.5,
                 "total_profit_pct": -5.0 + i * 1.0,
@@ -189,5 +263,5 @@ def sample_validation_results_batch():
                 "git_commit_hash": f"{i:040d}",  # Mock commit hashes
             }
         )
-
-    return results
+        for i in range(20)
+    )
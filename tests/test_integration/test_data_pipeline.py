@@ -28,7 +28,9 @@ class TestDataPipeline:
     """
 
     @pytest.mark.integration
-    def test_data_collection_to_storage(self, mock_market_data, test_storage_dir):
+    def test_data_collection_to_storage(
+        self, mock_market_data, test_storage_dir, make_db_mock
+    ):
         """
         Test that data collected from an exchange can be successfully stored in the database.
 
@@ -40,61 +42,59 @@ class TestDataPipeline:
         """
         logger.info("Starting test_data_collection_to_storage")
 
-        # Mock the BinanceCollector to return our synthetic data
-        with patch.object(
-            BinanceCollector,
-            "fetch_ohlcv",
-            return_value=self._df_to_tuples(mock_market_data),
+        # Mock the BinanceCollector to return our synthetic data, the DB
+        # connection, and execute_batch (avoids psycopg2 internal processing)
+        with (
+            patch.object(
+                BinanceCollector,
+                "fetch_ohlcv",
+                return_value=self._df_to_tuples(mock_market_data),
+            ),
+            patch.object(DatabaseStorage, "get_connection") as mock_conn,
+            patch(
+                "proratio_utilities.data.storage.execute_batch"
+            ) as mock_execute_batch,
         ):
-            # Create collector and storage (use in-memory DB for testing)
-            with patch.object(DatabaseStorage, "get_connection") as mock_conn:
-                # Mock execute_batch to avoid psycopg2 internal processing
-                with patch(
-                    "proratio_utilities.data.storage.execute_batch"
-                ) as mock_execute_batch:
-                    # Setup mock database connection
-                    mock_cursor = Mock()
-                    mock_cursor.rowcount = len(mock_market_data)
-                    mock_conn.return_value.cursor.return_value = mock_cursor
-                    mock_conn.return_value.commit = Mock()
-
-                    storage = DatabaseStorage()
-                    collector = BinanceCollector(testnet=True)
-
-                    # Step 1: Collect data from exchange
-                    collected_data = collector.fetch_ohlcv(
-                        pair="BTC/USDT",
-                        timeframe="1h",
-                        since=datetime(2024, 1, 1),
-                        limit=100,
-                    )
-
-                    # Verify data was collected
-                    assert collected_data is not None
-                    assert len(collected_data) > 0
-                    logger.info(f"Collected {len(collected_data)} candles")
-
-                    # Step 2: Store data in database
-                    inserted_count = storage.insert_ohlcv(
-                        exchange="binance",
-                        pair="BTC/USDT",
-                        timeframe="1h",
-                        data=collected_data,
-                    )
-
-                    # Verify data was stored
-                    assert inserted_count > 0
-                    assert inserted_count == len(collected_data)
-                    logger.info(f"Stored {inserted_count} candles successfully")
-
-                    # Verify execute_batch was called with correct parameters
-                    assert mock_execute_batch.called
-                    assert mock_execute_batch.call_count == 1
+            # Setup mock database connection
+            mock_conn.return_value, _ = make_db_mock()
+
+            storage = DatabaseStorage()
+            collector = BinanceCollector(testnet=True)
+
+            # Step 1: Collect data from exchange
+            collected_data = collector.fetch_ohlcv(
+                pair="BTC/USDT",
+                timeframe="1h",
+                since=datetime(2024, 1, 1),
+                limit=100,
+            )
+
+            # Verify data was collected
+            assert collected_data is not None
+            assert len(collected_data) > 0
+            logger.info(f"Collected {len(collected_data)} candles")
+
+            # Step 2: Store data in database
+            inserted_count = storage.insert_ohlcv(
+                exchange="binance",
+                pair="BTC/USDT",
+                timeframe="1h",
+                data=collected_data,
+            )
+
+            # Verify data was stored
+            assert inserted_count > 0
+            assert inserted_count == len(collected_data)
+            logger.info(f"Stored {inserted_count} candles successfully")
+
+            # Verify execute_batch was called with correct parameters
+            assert mock_execute_batch.called
+            assert mock_execute_batch.call_count == 1
 
         logger.info("test_data_collection_to_storage PASSED")
 
     @pytest.mark.integration
-    def test_storage_to_loading(self, mock_market_data):
+    def test_storage_to_loading(self, make_db_mock):
         """
         Test that data stored in the database can be successfully retrieved through the loading mechanism.
 
@@ -107,15 +107,8 @@ class TestDataPipeline:
         logger.info("Starting test_storage_to_loading")
 
         with patch.object(DatabaseStorage, "get_connection") as mock_conn:
-            # Setup mock database connection
-            mock_cursor = Mock()
-
             # Mock the database query to return our mock data
-            mock_cursor.fetchall.return_value = [
-                tuple(row) for row in mock_market_data.values
-            ]
-            mock_cursor.description = [(col,) for col in mock_market_data.columns]
-            mock_conn.return_value.cursor.return_value = mock_cursor
+            mock_conn.return_value, _ = make_db_mock()
 
             storage = DatabaseStorage()
 
@@ -146,7 +139,7 @@ class TestDataPipeline:
             logger.info("test_storage_to_loading PASSED")
 
     @pytest.mark.integration
-    def test_concurrent_reads(self, mock_market_data):
+    def test_concurrent_reads(self, make_db_mock):
         """
         Test that multiple concurrent read operations return consistent and correct data.
 
@@ -160,12 +153,7 @@ class TestDataPipeline:
 
         with patch.object(DatabaseStorage, "get_connection") as mock_conn:
             # Setup mock database connection
-            mock_cursor = Mock()
-            mock_cursor.fetchall.return_value = [
-                tuple(row) for row in mock_market_data.values
-            ]
-            mock_cursor.description = [(col,) for col in mock_market_data.columns]
-            mock_conn.return_value.cursor.return_value = mock_cursor
+            mock_conn.return_value, _ = make_db_mock()
 
             storage = DatabaseStorage()
 
@@ -220,7 +208,7 @@ class TestDataPipeline:
     @pytest.mark.skip(
         reason="Logger propagation blocked by deep mocking - functional logging verified in other tests (test_data_collection_to_storage, test_signal_to_trade_logging). Issue tracked for future sprint."
     )
-    def test_data_pipeline_logging(self, caplog, mock_market_data):
+    def test_data_pipeline_logging(self, caplog, mock_market_data, make_db_mock):
         """
         Test that the data pipeline logs operations correctly.
 
@@ -236,34 +224,29 @@ class TestDataPipeline:
         logger.info("Starting test_data_pipeline_logging")
 
         with caplog.at_level(logging.INFO):
-            with patch.object(
-                BinanceCollector,
-                "fetch_ohlcv",
-                return_value=self._df_to_tuples(mock_market_data),
+            with (
+                patch.object(
+                    BinanceCollector,
+                    "fetch_ohlcv",
+                    return_value=self._df_to_tuples(mock_market_data),
+                ),
+                patch.object(DatabaseStorage, "get_connection") as mock_conn,
+                # Mock execute_batch to avoid psycopg2 internal processing
+                patch("proratio_utilities.data.storage.execute_batch"),
             ):
-                with patch.object(DatabaseStorage, "get_connection") as mock_conn:
-                    # Mock execute_batch to avoid psycopg2 internal processing
-                    with patch(
-                        "proratio_utilities.data.storage.execute_batch"
-                    ):
-                        mock_cursor = Mock()
-                        mock_cursor.rowcount = len(mock_market_data)
-                        mock_conn.return_value.cursor.return_value = mock_cursor
-                        mock_conn.return_value.commit = Mock()
-
-                        storage = DatabaseStorage()
-                        collector = BinanceCollector(testnet=True)
-
-                        # Perform operations
-                        collected_data = collector.fetch_ohlcv(
-                            pair="BTC/USDT", timeframe="1h"
-                        )
-                        storage.insert_ohlcv(
-                            exchange="binance",
-                            pair="BTC/USDT",
-                            timeframe="1h",
-                            data=collected_data,
-                        )
+                mock_conn.return_value, _ = make_db_mock()
+
+                storage = DatabaseStorage()
+                collector = BinanceCollector(testnet=True)
+
+                # Perform operations
+                collected_data = collector.fetch_ohlcv(pair="BTC/USDT", timeframe="1h")
+                storage.insert_ohlcv(
+                    exchange="binance",
+                    pair="BTC/USDT",
+                    timeframe="1h",
+                    data=collected_data,
+                )
 
             # Verify logging occurred
             assert len(caplog.records) > 0, "No log records captured"
@@ -283,17 +266,8 @@ class TestDataPipeline:
         Returns:
             List of tuples: (timestamp, open, high, low, close, volume)
         """
-        return [
-            (
-                row.timestamp,
-                row.open,
-                row.high,
-                row.low,
-                row.close,
-                row.volume,
-            )
-            for row in df.itertuples(index=False)
-        ]
+        cols = ["timestamp", "open", "high", "low", "close", "volume"]
+        return list(zip(*(df[col].to_list() for col in cols)))
 
 
 class TestDataPipelinePerformance:
@@ -317,22 +291,24 @@ class TestDataPipelinePerformance:
         start_time = time.time()
 
         # Run a representative subset of integration tests
-        with patch.object(BinanceCollector, "fetch_ohlcv", return_value=[]):
-            with patch.object(DatabaseStorage, "get_connection") as mock_conn:
-                mock_cursor = Mock()
-                mock_cursor.rowcount = 0
-                mock_cursor.fetchall.return_value = []
-                mock_conn.return_value.cursor.return_value = mock_cursor
+        with (
+            patch.object(BinanceCollector, "fetch_ohlcv", return_value=[]),
+            patch.object(DatabaseStorage, "get_connection") as mock_conn,
+        ):
+            mock_cursor = Mock()
+            mock_cursor.rowcount = 0
+            mock_cursor.fetchall.return_value = []
+            mock_conn.return_value.cursor.return_value = mock_cursor
 
-                storage = DatabaseStorage()
-                collector = BinanceCollector(testnet=True)
+            storage = DatabaseStorage()
+            collector = BinanceCollector(testnet=True)
 
-                # Simulate multiple operations
-                for i in range(10):
-                    collector.fetch_ohlcv(pair="BTC/USDT", timeframe="1h")
-                    storage.insert_ohlcv(
-                        exchange="binance", pair="BTC/USDT", timeframe="1h", data=[]
-                    )
+            # Simulate multiple operations
+            for i in range(10):
+                collector.fetch_ohlcv(pair="BTC/USDT", timeframe="1h")
+                storage.insert_ohlcv(
+                    exchange="binance", pair="BTC/USDT", timeframe="1h", data=[]
+                )
 
         elapsed_time = time.time() - start_time
 
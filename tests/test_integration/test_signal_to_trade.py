@@ -4,6 +4,9 @@ Integration Tests for Signal-to-Trade Workflow
 Tests the complete workflow from signal generation through trade creation to trade management.
 Verifies that signals correctly trigger and manage trades through the trade hub.
 
+Every test builds its own MockTradeManager, and the shared fixtures and caches
+are read-only, so the module is safe to run in parallel (pytest -n auto).
+
 Feature: 001-test-validation-dashboard
 User Story 2: Integration Test Coverage for Signal-to-Trade Workflow (Priority: P1)
 Created: 2025-10-28
@@ -12,17 +15,23 @@ Created: 2025-10-28
 import pytest
 import logging
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import Mock
 from dataclasses import dataclass
+from types import MappingProxyType
 
-from proratio_signals.orchestrator import ConsensusSignal
+from proratio_signals.orchestrator import ConsensusSignal, SignalOrchestrator
 from proratio_signals.llm_providers.base import MarketAnalysis
 
+pytestmark = pytest.mark.integration
+
 # Setup logging for tests
 logger = logging.getLogger(__name__)
 
+# Fixed timestamp for test signals and analyses (tests never compare to wall-clock time)
+_TS = datetime(2025, 1, 1, tzinfo=timezone.utc)
 
-@dataclass
+
+@dataclass(slots=True)
 class MockTrade:
     """Mock trade object for testing."""
 
@@ -38,24 +47,35 @@ class MockTrade:
     def update_stop_loss(self, new_stop_loss: float):
         """Update stop loss price."""
         self.stop_loss = new_stop_loss
-        logger.info(f"Updated stop loss for trade {self.id} to {new_stop_loss}")
+        logger.info("Updated stop loss for trade %s to %s", self.id, new_stop_loss)
 
     def update_take_profit(self, new_take_profit: float):
         """Update take profit price."""
         self.take_profit = new_take_profit
-        logger.info(f"Updated take profit for trade {self.id} to {new_take_profit}")
+        logger.info("Updated take profit for trade %s to %s", self.id, new_take_profit)
 
     def close(self, exit_price: float):
         """Close the trade."""
         self.status = "closed"
-        logger.info(f"Closed trade {self.id} at price {exit_price}")
+        logger.info("Closed trade %s at price %s", self.id, exit_price)
 
 
 class MockTradeManager:
     """Mock trade manager for testing."""
 
+    __slots__ = ("trades", "next_trade_id")
+
+    # Position sizing constants (simple 1% risk model with fixed SL/TP)
+    _ENTRY_PRICE = 50000.0  # Mock BTC price
+    _RISK_PCT = 0.01  # Risk 1% of balance per trade
+    _SL_PCT = 0.02  # 2% stop loss
+    _TP_PCT = 0.04  # 4% take profit
+    _QTY_PER_UNIT_BALANCE = _RISK_PCT / (_ENTRY_PRICE * _SL_PCT)
+    _SL_MULT = {"buy": 1 - _SL_PCT, "sell": 1 + _SL_PCT}
+    _TP_MULT = {"buy": 1 + _TP_PCT, "sell": 1 - _TP_PCT}
+
     def __init__(self):
-        self.trades = []
+        self.trades: dict[int, MockTrade] = {}  # trade_id -> trade, in creation order
         self.next_trade_id = 1
 
     def create_trade_from_signal(
@@ -75,10 +95,8 @@ class MockTradeManager:
         side = "buy" if signal.direction == "long" else "sell"
 
         # Calculate position size (simple 1% risk model)
-        risk_per_trade = balance * 0.01
-        entry_price = 50000.0  # Mock BTC price
-        stop_loss_pct = 0.02  # 2% stop loss
-        quantity = risk_per_trade / (entry_price * stop_loss_pct)
+        entry_price = self._ENTRY_PRICE
+        quantity = balance * self._QTY_PER_UNIT_BALANCE
 
         # Create trade
         trade = MockTrade(
@@ -87,20 +105,22 @@ class MockTradeManager:
             side=side,
             entry_price=entry_price,
             quantity=quantity,
-            stop_loss=entry_price * (1 - stop_loss_pct)
-            if side == "buy"
-            else entry_price * (1 + stop_loss_pct),
-            take_profit=entry_price * (1 + 0.04)
-            if side == "buy"
-            else entry_price * (1 - 0.04),
+            stop_loss=entry_price * self._SL_MULT[side],
+            take_profit=entry_price * self._TP_MULT[side],
         )
 
-        self.trades.append(trade)
+        self.trades[trade.id] = trade
         self.next_trade_id += 1
 
         logger.info(
-            f"Created {side} trade #{trade.id} for {signal.pair}: "
-            f"quantity={quantity:.4f}, entry={entry_price}, SL={trade.stop_loss}, TP={trade.take_profit}"
+            "Created %s trade #%s for %s: quantity=%.4f, entry=%s, SL=%s, TP=%s",
+            side,
+            trade.id,
+            signal.pair,
+            quantity,
+            entry_price,
+            trade.stop_loss,
+            trade.take_profit,
         )
 
         return trade
@@ -116,7 +136,7 @@ class MockTradeManager:
         Returns:
             Updated MockTrade object
         """
-        trade = next((t for t in self.trades if t.id == trade_id), None)
+        trade = self.trades.get(trade_id)
         if not trade:
             raise ValueError(f"Trade {trade_id} not found")
 
@@ -139,7 +159,7 @@ class MockTradeManager:
         Returns:
             Closed MockTrade object
         """
-        trade = next((t for t in self.trades if t.id == trade_id), None)
+        trade = self.trades.get(trade_id)
         if not trade:
             raise ValueError(f"Trade {trade_id} not found")
 
@@ -147,69 +167,117 @@ class MockTradeManager:
         return trade
 
 
-class TestSignalToTrade:
-    """
-    Integration tests for signal-to-trade workflow.
+# Per-provider analysis details for signals built with_analyses=True
+_ANALYSIS_DETAILS = {
+    "chatgpt": {
+        "confidence": 0.7,
+        "technical_summary": "Strong uptrend with bullish breakout patterns",
+        "risk_assessment": "Low risk with favorable 2:1 R:R ratio",
+        "sentiment": "Bullish market sentiment across indicators",
+        "reasoning": "Bullish technical patterns",
+    },
+    "claude": {
+        "confidence": 0.75,
+        "technical_summary": "Price consolidation with upside breakout potential",
+        "risk_assessment": "Low risk environment with tight stop loss",
+        "sentiment": "Positive momentum building",
+        "reasoning": "Low risk environment",
+    },
+    "gemini": {
+        "confidence": 0.80,
+        "technical_summary": "Strong support levels holding with bullish continuation",
+        "risk_assessment": "Minimal downside risk at current levels",
+        "sentiment": "Positive sentiment with high confidence",
+        "reasoning": "Positive sentiment",
+    },
+}
+
+_PROVIDER_MODELS = {"chatgpt": "gpt-4", "claude": "claude-3", "gemini": "gemini-pro"}
+
+# MarketAnalysis objects are read-only in these tests, so build them once per direction
+_ANALYSES_BY_DIRECTION = {}
+
+
+def _analyses_for(direction: str) -> MappingProxyType:
+    """Return cached, read-only per-provider MarketAnalysis objects for a direction."""
+    if direction not in _ANALYSES_BY_DIRECTION:
+        _ANALYSES_BY_DIRECTION[direction] = MappingProxyType(
+            {
+                provider: MarketAnalysis(
+                    direction=direction,
+                    provider=provider,
+                    timestamp=_TS,
+                    pair="BTC/USDT",
+                    timeframe="1h",
+                    **details,
+                )
+                for provider, details in _ANALYSIS_DETAILS.items()
+            }
+        )
+    return _ANALYSES_BY_DIRECTION[direction]
+
+
+def make_signal(
+    direction: str = "long",
+    confidence: float = 0.75,
+    consensus_score: float = 0.80,
+    providers: tuple = ("chatgpt", "claude", "gemini"),
+    with_analyses: bool = False,
+) -> ConsensusSignal:
     """
+    Build a BTC/USDT 1h consensus signal for testing.
+
+    Args:
+        direction: Signal direction ('long', 'short', 'neutral')
+        confidence: Weighted confidence
+        consensus_score: Agreement level
+        providers: Providers reported as active
+        with_analyses: Attach per-provider analyses, summaries and models
 
-    @pytest.fixture
-    def sample_signal(self):
-        """Provide a sample consensus signal for testing."""
-        return ConsensusSignal(
-            direction="long",
-            confidence=0.75,
-            consensus_score=0.80,
-            chatgpt_analysis=MarketAnalysis(
-                direction="long",
-                confidence=0.7,
-                technical_summary="Strong uptrend with bullish breakout patterns",
-                risk_assessment="Low risk with favorable 2:1 R:R ratio",
-                sentiment="Bullish market sentiment across indicators",
-                reasoning="Bullish technical patterns",
-                provider="chatgpt",
-                timestamp=datetime.now(timezone.utc),
-                pair="BTC/USDT",
-                timeframe="1h",
-            ),
-            claude_analysis=MarketAnalysis(
-                direction="long",
-                confidence=0.75,
-                technical_summary="Price consolidation with upside breakout potential",
-                risk_assessment="Low risk environment with tight stop loss",
-                sentiment="Positive momentum building",
-                reasoning="Low risk environment",
-                provider="claude",
-                timestamp=datetime.now(timezone.utc),
-                pair="BTC/USDT",
-                timeframe="1h",
-            ),
-            gemini_analysis=MarketAnalysis(
-                direction="long",
-                confidence=0.80,
-                technical_summary="Strong support levels holding with bullish continuation",
-                risk_assessment="Minimal downside risk at current levels",
-                sentiment="Positive sentiment with high confidence",
-                reasoning="Positive sentiment",
-                provider="gemini",
-                timestamp=datetime.now(timezone.utc),
-                pair="BTC/USDT",
-                timeframe="1h",
-            ),
+    Returns:
+        ConsensusSignal object
+    """
+    extra = {}
+    if with_analyses:
+        analyses = _analyses_for(direction)
+        extra = {f"{provider}_analysis": analyses[provider] for provider in providers}
+        extra.update(
             combined_reasoning="Strong bullish consensus across all providers",
             risk_summary="Low risk, favorable R:R ratio",
             technical_summary="Bullish breakout pattern",
-            timestamp=datetime.now(timezone.utc),
-            pair="BTC/USDT",
-            timeframe="1h",
-            active_providers=["chatgpt", "claude", "gemini"],
-            failed_providers=[],
-            provider_models={
-                "chatgpt": "gpt-4",
-                "claude": "claude-3",
-                "gemini": "gemini-pro",
-            },
+            provider_models={p: _PROVIDER_MODELS[p] for p in providers},
         )
 
+    return ConsensusSignal(
+        direction=direction,
+        confidence=confidence,
+        consensus_score=consensus_score,
+        timestamp=_TS,
+        pair="BTC/USDT",
+        timeframe="1h",
+        active_providers=list(providers),
+        failed_providers=[],
+        **extra,
+    )
+
+
+@pytest.fixture(scope="module")
+def signal_factory():
+    """Provide the make_signal factory to tests."""
+    return make_signal
+
+
+@pytest.fixture(scope="module")
+def sample_signal(signal_factory):
+    """Provide a sample consensus signal for testing (read-only, shared by the module)."""
+    return signal_factory(with_analyses=True)
+
+
+class TestSignalToTrade:
+    """
+    Integration tests for signal-to-trade workflow.
+    """
+
     @pytest.mark.integration
     def test_signal_to_trade_creation(self, sample_signal):
         """
@@ -325,7 +393,7 @@ class TestSignalToTrade:
         logger.info("test_trade_closure PASSED")
 
     @pytest.mark.integration
-    def test_signal_orchestration_to_trade_hub(self, mock_market_data):
+    def test_signal_orchestration_to_trade_hub(self, mock_market_data, signal_factory):
         """
         Test integration between signal orchestrator and trade hub.
 
@@ -337,43 +405,35 @@ class TestSignalToTrade:
         """
         logger.info("Starting test_signal_orchestration_to_trade_hub")
 
-        # Mock signal orchestrator
-        with patch(
-            "proratio_signals.orchestrator.SignalOrchestrator"
-        ) as mock_orchestrator:
-            # Create mock signal
-            mock_signal = ConsensusSignal(
-                direction="short",
-                confidence=0.70,
-                consensus_score=0.75,
-                pair="BTC/USDT",
-                timeframe="1h",
-                timestamp=datetime.now(timezone.utc),
-                active_providers=["chatgpt", "claude"],
-                failed_providers=[],
-            )
-
-            # Mock orchestrator.generate_signal() to return our signal
-            mock_instance = mock_orchestrator.return_value
-            mock_instance.generate_signal.return_value = mock_signal
-
-            # Create trade manager
-            trade_manager = MockTradeManager()
+        # Create mock signal
+        mock_signal = signal_factory(
+            direction="short",
+            confidence=0.70,
+            consensus_score=0.75,
+            providers=("chatgpt", "claude"),
+        )
+
+        # Stand-in orchestrator whose generate_signal() returns our signal
+        mock_orchestrator = Mock(spec=SignalOrchestrator)
+        mock_orchestrator.generate_signal.return_value = mock_signal
+
+        # Create trade manager
+        trade_manager = MockTradeManager()
 
-            # Generate signal and create trade
-            signal = mock_instance.generate_signal(mock_market_data)
-            trade = trade_manager.create_trade_from_signal(signal)
+        # Generate signal and create trade
+        signal = mock_orchestrator.generate_signal(mock_market_data)
+        trade = trade_manager.create_trade_from_signal(signal)
 
-            # Verify end-to-end flow
-            assert signal.direction == "short"
-            assert trade.side == "sell"  # short direction maps to sell
-            assert trade.pair == signal.pair
+        # Verify end-to-end flow
+        assert signal.direction == "short"
+        assert trade.side == "sell"  # short direction maps to sell
+        assert trade.pair == signal.pair
 
-            logger.info("Signal orchestration to trade hub integration successful")
-            logger.info("test_signal_orchestration_to_trade_hub PASSED")
+        logger.info("Signal orchestration to trade hub integration successful")
+        logger.info("test_signal_orchestration_to_trade_hub PASSED")
 
     @pytest.mark.integration
-    def test_invalid_signal_handling(self):
+    def test_invalid_signal_handling(self, signal_factory):
         """
         Test that invalid or conflicting signals are handled appropriately.
 
@@ -386,15 +446,11 @@ class TestSignalToTrade:
         logger.info("Starting test_invalid_signal_handling")
 
         # Create invalid signal (neutral direction with high confidence - contradictory)
-        invalid_signal = ConsensusSignal(
+        invalid_signal = signal_factory(
             direction="neutral",
             confidence=0.80,
             consensus_score=0.50,
-            pair="BTC/USDT",
-            timeframe="1h",
-            timestamp=datetime.now(timezone.utc),
-            active_providers=["chatgpt"],
-            failed_providers=[],
+            providers=("chatgpt",),
         )
 
         # Verify signal should_trade() returns False
@@ -448,16 +504,9 @@ class TestSignalToTrade:
         # Create a scenario that will fail
         trade_manager = MockTradeManager()
 
-        # Attempt to update non-existent trade
-        try:
+        # Attempt to update non-existent trade - the error must name the trade ID
+        with pytest.raises(ValueError, match=r"Trade 999 not found"):
             trade_manager.update_trade(999, 50000.0)
-            assert False, "Expected ValueError was not raised"
-        except ValueError as e:
-            error_message = str(e)
-            # Verify error message is clear and identifies the problem
-            assert "Trade 999 not found" in error_message
-            assert "999" in error_message  # Trade ID is included
-            logger.info(f"Clear error message provided: {error_message}")
 
         logger.info("test_signal_failure_messages PASSED")
 
@@ -468,7 +517,7 @@ class TestSignalToTradeEdgeCases:
     """
 
     @pytest.mark.integration
-    def test_multiple_signals_sequential(self):
+    def test_multiple_signals_sequential(self, signal_factory):
         """
         Test that multiple signals can be processed sequentially without interference.
         """
@@ -478,17 +527,7 @@ class TestSignalToTradeEdgeCases:
 
         # Create multiple signals
         signals = [
-            ConsensusSignal(
-                direction="long",
-                confidence=0.75,
-                consensus_score=0.80,
-                pair="BTC/USDT",
-                timeframe="1h",
-                timestamp=datetime.now(timezone.utc),
-                active_providers=["chatgpt"],
-                failed_providers=[],
-            )
-            for i in range(3)
+            signal_factory(direction="long", providers=("chatgpt",)) for _ in range(3)
         ]
 
         # Process all signals
@@ -497,7 +536,7 @@ class TestSignalToTradeEdgeCases:
         # Verify all trades were created
         assert len(trades) == 3
         assert len(trade_manager.trades) == 3
-        assert all(trade.status == "open" for trade in trades)
+        assert all(trade.status == "open" for trade in trade_manager.trades.values())
 
         # Verify unique trade IDs
         trade_ids = [trade.id for trade in trades]
@@ -0,0 +1,110 @@
+"""
+Integration Tests for ValidationRepository
+
+Runs the repository against the shared in-memory SQLite database from
+conftest.py, covering inserts, filtered queries and per-test isolation.
+
+Feature: 001-test-validation-dashboard
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import inspect
+
+from proratio_utilities.data.validation_repository import ValidationResult
+
+
+def _insert_all(repo, results):
+    """Insert each result mapping and return the assigned IDs."""
+    return [repo.insert_validation_result(**result) for result in results]
+
+
+class TestValidationRepository:
+    """
+    Integration tests for storing and querying backtest validation results.
+    """
+
+    @pytest.mark.integration
+    def test_schema_created(self, test_db_engine):
+        """
+        Test that the shared engine exposes an empty validation_results table.
+
+        Given: The session-wide in-memory SQLite database
+        When: A test requests the database engine
+        Then: The validation_results table exists
+        """
+        assert "validation_results" in inspect(test_db_engine).get_table_names()
+
+    @pytest.mark.integration
+    def test_insert_and_get_by_id(self, test_validation_repo, sample_validation_result):
+        """
+        Test that an inserted result can be read back by its ID.
+
+        Given: An empty repository
+        When: A single validation result is inserted
+        Then: get_validation_by_id returns the same values
+        """
+        validation_id = test_validation_repo.insert_validation_result(
+            **sample_validation_result
+        )
+
+        stored = test_validation_repo.get_validation_by_id(validation_id)
+
+        assert isinstance(stored, ValidationResult)
+        assert stored.strategy_name == sample_validation_result["strategy_name"]
+        assert stored.total_trades == sample_validation_result["total_trades"]
+        assert stored.win_rate == pytest.approx(sample_validation_result["win_rate"])
+        assert stored.git_commit_hash == sample_validation_result["git_commit_hash"]
+
+    @pytest.mark.integration
+    @pytest.mark.parametrize("run", [1, 2])
+    def test_each_test_starts_empty(
+        self, test_validation_repo, sample_validation_result, run
+    ):
+        """
+        Test that rows written by one test are not visible to the next.
+
+        Given: The shared repository, reset before each test
+        When: Each parametrized run inserts one result
+        Then: Every run counts exactly one row
+        """
+        assert test_validation_repo.count_validations() == 0
+
+        test_validation_repo.insert_validation_result(**sample_validation_result)
+
+        assert test_validation_repo.count_validations() == 1
+
+    @pytest.mark.integration
+    def test_query_batch_filters(
+        self, test_validation_repo, sample_validation_results_batch
+    ):
+        """
+        Test filtering and ordering over a batch of results.
+
+        Given: 20 results for 3 strategies over 10 days
+        When: The repository is queried by strategy, date range and order
+        Then: Counts, filters and ordering match the inserted batch
+        """
+        ids = _insert_all(test_validation_repo, sample_validation_results_batch)
+
+        assert len(set(ids)) == len(sample_validation_results_batch)
+        assert test_validation_repo.count_validations() == 20
+        assert test_validation_repo.count_validations(strategy_name="GridTrading") == 7
+
+        in_range = test_validation_repo.query_validation_results(
+            start_date=datetime(2024, 1, 3),
+            end_date=datetime(2024, 1, 5),
+            order_by="timestamp_asc",
+        )
+        assert len(in_range) == 6
+        timestamps = [result.timestamp for result in in_range]
+        assert timestamps == sorted(timestamps)
+
+        best = test_validation_repo.query_validation_results(
+            limit=1, order_by="total_profit_desc"
+        )
+        assert best[0].total_profit_pct == pytest.approx(14.0)
+
+        latest = test_validation_repo.get_latest_validation("AIEnhanced")
+        assert latest.timestamp == datetime(2024, 1, 10)
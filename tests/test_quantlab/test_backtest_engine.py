@@ -15,6 +15,72 @@ from proratio_quantlab.backtesting.backtest_engine import (
 )
 
 
+# Freqtrade report with a full set of summary metrics
+_BASIC_OUTPUT = """
+│    TOTAL │     45 │        -0.41 │         -18.371 │        -0.18 │     12:44:00 │   21     0    24  46.7 │
+
+│ Total/Daily Avg Trades        │ 45 / 0.25                      │
+│ Absolute profit               │ -18.371 USDT                   │
+│ Total profit %                │ -0.18%                         │
+│ Sharpe                        │ -1.03                          │
+│ Sortino                       │ -1.85                          │
+│ Max % of account underwater   │ 0.25%                          │
+│ Best trade                    │ ETH/USDT 2.00%                 │
+│ Worst trade                   │ ETH/USDT -4.50%                │
+"""
+
+# Recent freqtrade report, with qualified summary labels
+_QUALIFIED_LABELS_OUTPUT = """
+│    TOTAL │     45 │        -0.41 │         -18.371 │        -0.18 │     12:44:00 │   21     0    24  46.7 │
+
+│ Total/Daily Avg Trades                │ 45 / 0.25                      │
+│ Absolute profit                       │ -18.371 USDT                   │
+│ Total profit %                        │ -0.18%                         │
+│ Sharpe (closed trades)                │ -1.23                          │
+│ Sortino (closed trades)               │ -0.45                          │
+│ Sharpe (daily wallet balance)         │ 0.77                           │
+│ Max % of account underwater (balance) │ 0.30%                          │
+│ Best trade                            │ ETH/USDT 2.00%                 │
+│ Worst trade                           │ ETH/USDT -4.50%                │
+"""
+
+# Freqtrade report for a run that made no trades
+_NO_TRADES_OUTPUT = """
+│    TOTAL │      0 │          0.0 │           0.000 │          0.0 │         0:00 │    0     0     0     0 │
+
+│ Total/Daily Avg Trades        │ 0 / 0.00                       │
+No trades made.
+"""
+
+# Freqtrade stdout for a successful backtest run
+_SUCCESS_OUTPUT = """
+│    TOTAL │     50 │         0.50 │          50.000 │          0.5 │     10:00:00 │   30     0    20  60.0 │
+│ Total/Daily Avg Trades        │ 50 / 0.25                      │
+│ Absolute profit               │ 50.000 USDT                    │
+│ Total profit %                │ 0.50%                          │
+│ Sharpe                        │ 1.50                           │
+"""
+
+
+@pytest.fixture(scope="module")
+def good_subprocess_result():
+    """Completed freqtrade process with a successful backtest report"""
+    return Mock(returncode=0, stdout=_SUCCESS_OUTPUT)
+
+
+@pytest.fixture(scope="module")
+def failed_subprocess_result():
+    """Completed freqtrade process that exited with an error"""
+    return Mock(returncode=1, stderr="Strategy not found")
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Create engine with mocked paths (stateless, so shared by the module)"""
+    with patch.object(Path, "exists", return_value=True):
+        return BacktestEngine()
+
+
 class TestBacktestResults:
     """Test BacktestResults dataclass"""
 
@@ -82,13 +148,6 @@ class TestBacktestResults:
 class TestBacktestEngine:
     """Test BacktestEngine class"""
 
-    @pytest.fixture
-    def engine(self):
-        """Create engine with mocked paths"""
-        with patch.object(Path, "exists", return_value=True):
-            engine = BacktestEngine()
-            return engine
-
     def test_initialization(self, engine):
         """Test engine initialization"""
         assert engine.user_data_dir is not None
@@ -102,21 +161,8 @@ class TestBacktestEngine:
 
     def test_parse_results_basic(self, engine):
         """Test parsing of backtest output"""
-        sample_output = """
-│    TOTAL │     45 │        -0.41 │         -18.371 │        -0.18 │     12:44:00 │   21     0    24  46.7 │
-
-│ Total/Daily Avg Trades        │ 45 / 0.25                      │
-│ Absolute profit               │ -18.371 USDT                   │
-│ Total profit %                │ -0.18%                         │
-│ Sharpe                        │ -1.03                          │
-│ Sortino                       │ -1.85                          │
-│ Max % of account underwater   │ 0.25%                          │
-│ Best trade                    │ ETH/USDT 2.00%                 │
-│ Worst trade                   │ ETH/USDT -4.50%                │
-"""
-
         result = engine._parse_results(
-            output=sample_output,
+            output=_BASIC_OUTPUT,
             strategy="TestStrategy",
             timeframe="1h",
             start_date="2024-01-01",
@@ -136,17 +182,28 @@ class TestBacktestEngine:
         assert result.best_trade_pct == 2.00
         assert result.worst_trade_pct == -4.50
 
-    def test_parse_results_no_trades(self, engine):
-        """Test parsing output with no trades"""
-        sample_output = """
-│    TOTAL │      0 │          0.0 │           0.000 │          0.0 │         0:00 │    0     0     0     0 │
+    def test_parse_results_qualified_labels(self, engine):
+        """Test parsing summary rows whose labels carry a "(...)" qualifier"""
+        result = engine._parse_results(
+            output=_QUALIFIED_LABELS_OUTPUT,
+            strategy="TestStrategy",
+            timeframe="1h",
+            start_date="2024-01-01",
+            end_date="2024-06-30",
+            pairs=["BTC/USDT", "ETH/USDT"],
+        )
 
-│ Total/Daily Avg Trades        │ 0 / 0.00                       │
-No trades made.
-"""
+        # The closed-trades Sharpe is kept, not the later wallet-balance one
+        assert result.sharpe_ratio == -1.23
+        assert result.sortino_ratio == -0.45
+        assert result.max_drawdown_pct == 0.30
+        assert result.total_trades == 45
+        assert result.total_profit_pct == -0.18
 
+    def test_parse_results_no_trades(self, engine):
+        """Test parsing output with no trades"""
         result = engine._parse_results(
-            output=sample_output,
+            output=_NO_TRADES_OUTPUT,
             strategy="TestStrategy",
             timeframe="1h",
             start_date="2024-01-01",
@@ -159,19 +216,9 @@ No trades made.
         assert result.losing_trades == 0
 
     @patch("subprocess.run")
-    def test_backtest_success(self, mock_run, engine):
+    def test_backtest_success(self, mock_run, engine, good_subprocess_result):
         """Test successful backtest execution"""
-        # Mock subprocess result
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-│    TOTAL │     50 │         0.50 │          50.000 │          0.5 │     10:00:00 │   30     0    20  60.0 │
-│ Total/Daily Avg Trades        │ 50 / 0.25                      │
-│ Absolute profit               │ 50.000 USDT                    │
-│ Total profit %                │ 0.50%                          │
-│ Sharpe                        │ 1.50                           │
-"""
-        mock_run.return_value = mock_result
+        mock_run.return_value = good_subprocess_result
 
         result = engine.backtest(
             strategy="TestStrategy",
@@ -187,12 +234,9 @@ No trades made.
         assert mock_run.called
 
     @patch("subprocess.run")
-    def test_backtest_failure(self, mock_run, engine):
+    def test_backtest_failure(self, mock_run, engine, failed_subprocess_result):
         """Test backtest failure handling"""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Strategy not found"
-        mock_run.return_value = mock_result
+        mock_run.return_value = failed_subprocess_result
 
         with pytest.raises(RuntimeError, match="Backtest failed"):
             engine.backtest(
@@ -260,18 +304,9 @@ No trades made.
             assert all(isinstance(r, BacktestResults) for r in results)
 
     @patch("subprocess.run")
-    def test_compare_strategies(self, mock_run, engine):
+    def test_compare_strategies(self, mock_run, engine, good_subprocess_result):
         """Test strategy comparison"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = """
-│    TOTAL │     50 │         0.50 │          50.000 │          0.5 │     10:00:00 │   30     0    20  60.0 │
-│ Total/Daily Avg Trades        │ 50 / 0.25                      │
-│ Absolute profit               │ 50.000 USDT                    │
-│ Total profit %                │ 0.50%                          │
-│ Sharpe                        │ 1.50                           │
-"""
-        mock_run.return_value = mock_result
+        mock_run.return_value = good_subprocess_result
 
         results = engine.compare_strategies(
             strategies=["Strategy1", "Strategy2"],
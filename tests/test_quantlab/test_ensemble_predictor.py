@@ -13,39 +13,26 @@ Date: 2025-10-11
 Phase: 3.3 - Ensemble Learning
 """
 
+from itertools import product
+
 import pytest
 import numpy as np
 import pandas as pd
-from pathlib import Path
-import tempfile
+from joblib import Parallel, delayed
+from scipy.optimize import nnls
+from importlib.util import find_spec
 from sklearn.linear_model import Ridge
 from sklearn.ensemble import RandomForestRegressor
 
-# Try to import ensemble modules
-try:
-    from proratio_quantlab.ml.ensemble_predictor import (
-        EnsemblePredictor,
-        EnsembleBuilder,
-    )
-
-    ENSEMBLE_AVAILABLE = True
-except ImportError:
-    ENSEMBLE_AVAILABLE = False
-
-# Try to import base model libraries
-try:
-    import lightgbm as lgb
-
-    LIGHTGBM_AVAILABLE = True
-except ImportError:
-    LIGHTGBM_AVAILABLE = False
+# Skip the whole module at collection time if the ensemble module is unavailable
+ensemble_predictor = pytest.importorskip("proratio_quantlab.ml.ensemble_predictor")
+EnsemblePredictor = ensemble_predictor.EnsemblePredictor
+EnsembleBuilder = ensemble_predictor.EnsembleBuilder
 
-try:
-    import xgboost as xgb
-
-    XGBOOST_AVAILABLE = True
-except ImportError:
-    XGBOOST_AVAILABLE = False
+# Check for base model libraries without importing them (the tests never use
+# lightgbm/xgboost directly, only through EnsembleBuilder)
+LIGHTGBM_AVAILABLE = find_spec("lightgbm") is not None
+XGBOOST_AVAILABLE = find_spec("xgboost") is not None
 
 
 # ============================================================================
@@ -53,9 +40,9 @@ except ImportError:
 # ============================================================================
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_regression_data():
-    """Create sample regression data for testing."""
+    """Create sample regression data for testing (shared, read-only)."""
     np.random.seed(42)
     n_samples = 500
     n_features = 10
@@ -78,67 +65,84 @@ def sample_regression_data():
     X_test = X[train_size + val_size :]
     y_test = y[train_size + val_size :]
 
+    # Shared across the session, so guard against in-place modification
+    X.flags.writeable = False
+    y.flags.writeable = False
+
     return (X_train, y_train), (X_val, y_val), (X_test, y_test)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_base_models():
     """Create simple sklearn models for testing."""
     from sklearn.linear_model import LinearRegression, Ridge
 
+    # Tests only need a valid tree-based regressor, not a good one, so keep
+    # the forest tiny
     models = {
         "linear": LinearRegression(),
         "ridge": Ridge(alpha=1.0),
-        "rf": RandomForestRegressor(n_estimators=10, max_depth=3, random_state=42),
+        "rf": RandomForestRegressor(n_estimators=3, max_depth=2, random_state=42),
     }
 
     return models
 
 
+@pytest.fixture(scope="session")
+def pretrained_base_models(sample_regression_data, simple_base_models):
+    """Base models fitted once on the training split and shared by all tests."""
+    (X_train, y_train), *_ = sample_regression_data
+
+    # Independent estimators, so fit them side by side; threads (not processes)
+    # so the fixture's own model objects are the ones that get fitted
+    Parallel(n_jobs=len(simple_base_models), backend="threading")(
+        delayed(model.fit)(X_train, y_train) for model in simple_base_models.values()
+    )
+
+    return simple_base_models
+
+
 # ============================================================================
 # Test EnsemblePredictor - Initialization
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestEnsemblePredictorInit:
     """Test ensemble predictor initialization."""
 
-    def test_initialization_stacking(self):
-        """Test stacking ensemble initialization."""
-        ensemble = EnsemblePredictor(
-            ensemble_method="stacking", meta_model_type="ridge"
-        )
+    @pytest.mark.parametrize(
+        "method,meta_model_cls",
+        [
+            ("stacking", Ridge),
+            ("blending", type(None)),
+            ("voting", type(None)),
+        ],
+    )
+    def test_initialization(self, method, meta_model_cls):
+        """Test ensemble initialization for each ensemble method."""
+        ensemble = EnsemblePredictor(ensemble_method=method, meta_model_type="ridge")
 
-        assert ensemble.ensemble_method == "stacking"
+        assert ensemble.ensemble_method == method
         assert ensemble.meta_model_type == "ridge"
-        assert isinstance(ensemble.meta_model, Ridge)
+        # Only stacking builds a meta-model
+        assert isinstance(ensemble.meta_model, meta_model_cls)
         assert len(ensemble.base_models) == 0
-
-    def test_initialization_blending(self):
-        """Test blending ensemble initialization."""
-        ensemble = EnsemblePredictor(ensemble_method="blending")
-
-        assert ensemble.ensemble_method == "blending"
-        assert ensemble.meta_model is None
         assert len(ensemble.weights) == 0
 
-    def test_initialization_voting(self):
-        """Test voting ensemble initialization."""
-        ensemble = EnsemblePredictor(ensemble_method="voting")
-
-        assert ensemble.ensemble_method == "voting"
-        assert ensemble.meta_model is None
-
-    def test_invalid_ensemble_method(self):
-        """Test invalid ensemble method raises error."""
-        with pytest.raises(ValueError, match="ensemble_method must be one of"):
-            EnsemblePredictor(ensemble_method="invalid")
-
-    def test_invalid_meta_model_type(self):
-        """Test invalid meta-model type raises error."""
-        with pytest.raises(ValueError, match="Unknown meta_model_type"):
-            EnsemblePredictor(ensemble_method="stacking", meta_model_type="invalid")
+    @pytest.mark.parametrize(
+        "kwargs,match",
+        [
+            ({"ensemble_method": "invalid"}, "ensemble_method must be one of"),
+            (
+                {"ensemble_method": "stacking", "meta_model_type": "invalid"},
+                "Unknown meta_model_type",
+            ),
+        ],
+    )
+    def test_invalid_configuration(self, kwargs, match):
+        """Test invalid ensemble method or meta-model type raises error."""
+        with pytest.raises(ValueError, match=match):
+            EnsemblePredictor(**kwargs)
 
 
 # ============================================================================
@@ -146,7 +150,6 @@ class TestEnsemblePredictorInit:
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestEnsembleBaseModels:
     """Test base model management."""
 
@@ -187,23 +190,18 @@ class TestEnsembleBaseModels:
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestStackingEnsemble:
     """Test stacking ensemble functionality."""
 
-    def test_train_stacking(self, sample_regression_data, simple_base_models):
+    def test_train_stacking(self, sample_regression_data, pretrained_base_models):
         """Test stacking ensemble training."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(
             ensemble_method="stacking", meta_model_type="ridge"
         )
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Train stacking
@@ -214,19 +212,15 @@ class TestStackingEnsemble:
         assert metrics["mse"] > 0
         assert metrics["mae"] > 0
 
-    def test_predict_stacking(self, sample_regression_data, simple_base_models):
+    def test_predict_stacking(self, sample_regression_data, pretrained_base_models):
         """Test stacking predictions."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create and train ensemble
         ensemble = EnsemblePredictor(
             ensemble_method="stacking", meta_model_type="ridge"
         )
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         ensemble.train_stacking(X_train, y_train, X_val, y_val)
@@ -238,24 +232,22 @@ class TestStackingEnsemble:
         assert predictions.dtype == np.float64
 
     def test_stacking_different_meta_models(
-        self, sample_regression_data, simple_base_models
+        self, sample_regression_data, pretrained_base_models
     ):
         """Test stacking with different meta-models."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         meta_models = ["ridge", "lasso", "rf"]
         results = {}
 
+        # One ensemble for all meta-model types: only the meta-model is swapped
+        ensemble = EnsemblePredictor(ensemble_method="stacking")
+        for name, model in pretrained_base_models.items():
+            ensemble.add_base_model(name, model)
+
         for meta_type in meta_models:
-            ensemble = EnsemblePredictor(
-                ensemble_method="stacking", meta_model_type=meta_type
-            )
-            for name, model in simple_base_models.items():
-                ensemble.add_base_model(name, model)
+            ensemble.meta_model_type = meta_type
+            ensemble.meta_model = ensemble._create_meta_model(meta_type)
 
             metrics = ensemble.train_stacking(X_train, y_train, X_val, y_val)
             results[meta_type] = metrics["mse"]
@@ -263,27 +255,46 @@ class TestStackingEnsemble:
         # All meta-models should produce valid results
         assert all(mse > 0 for mse in results.values())
 
+    def test_float32_meta_features(
+        self, sample_regression_data, pretrained_base_models
+    ):
+        """Test float32 meta-features still yield float64 predictions."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
+
+        predictions = {}
+        for dtype in (np.float64, np.float32):
+            ensemble = EnsemblePredictor(ensemble_method="stacking", meta_dtype=dtype)
+            for name, model in pretrained_base_models.items():
+                ensemble.add_base_model(name, model)
+            ensemble.train_stacking(X_train, y_train, X_val, y_val)
+
+            assert ensemble._get_base_predictions(X_test).dtype == dtype
+            predictions[dtype] = ensemble.predict(X_test)
+
+            contributions = ensemble.get_model_contributions(X_test)
+            assert (contributions.dtypes == np.float64).all()
+
+        assert predictions[np.float32].dtype == np.float64
+        np.testing.assert_allclose(
+            predictions[np.float32], predictions[np.float64], rtol=1e-4, atol=1e-4
+        )
+
 
 # ============================================================================
 # Test EnsemblePredictor - Blending
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestBlendingEnsemble:
     """Test blending ensemble functionality."""
 
-    def test_train_blending(self, sample_regression_data, simple_base_models):
+    def test_train_blending(self, sample_regression_data, pretrained_base_models):
         """Test blending ensemble training."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Train blending
@@ -294,17 +305,63 @@ class TestBlendingEnsemble:
         assert "weights" in metrics
         assert sum(metrics["weights"].values()) == pytest.approx(1.0, abs=1e-6)
 
-    def test_predict_blending(self, sample_regression_data, simple_base_models):
-        """Test blending predictions."""
+    @pytest.mark.parametrize("metric", ["mse", "mae"])
+    def test_blending_weights_non_negative(
+        self, sample_regression_data, pretrained_base_models, metric
+    ):
+        """Test optimized blending weights are a convex combination."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
+        ensemble = EnsemblePredictor(ensemble_method="blending")
+        for name, model in pretrained_base_models.items():
+            ensemble.add_base_model(name, model)
+
+        metrics = ensemble.train_blending(X_val, y_val, optimization_metric=metric)
+
+        weights = np.array(list(metrics["weights"].values()))
+        assert (weights >= 0).all()
+        assert weights.sum() == pytest.approx(1.0)
+
+    def test_mse_weights_no_worse_than_grid(self):
+        """Test the MSE weights beat the simplex grid and rescaled NNLS."""
+        rng = np.random.default_rng(0)
+        y = rng.normal(size=300)
+        # Biased, shrunk forecasts: the unconstrained NNLS weights sum to ~2
+        base_predictions = np.column_stack(
+            [
+                0.5 * y + rng.normal(scale=0.3, size=300),
+                0.4 * y + rng.normal(scale=0.2, size=300) + 0.1,
+                0.6 * y + rng.normal(scale=0.5, size=300),
+            ]
+        )
+
+        ensemble = EnsemblePredictor(ensemble_method="blending")
+        ensemble.model_names = ["a", "b", "c"]
+        weights = np.array(ensemble._optimize_weights(base_predictions, y, "mse"))
+
+        def mse(w):
+            return np.mean((base_predictions @ w - y) ** 2)
+
+        assert (weights >= 0).all()
+        assert weights.sum() == pytest.approx(1.0)
+
+        grid = np.linspace(0, 1, 11)
+        grid_mse = min(
+            mse(np.array(w) / sum(w)) for w in product(grid, repeat=3) if sum(w) > 0
+        )
+        nnls_weights, _ = nnls(base_predictions, y)
+        rescaled_mse = mse(nnls_weights / nnls_weights.sum())
+
+        assert mse(weights) <= grid_mse + 1e-12
+        assert mse(weights) <= rescaled_mse + 1e-12
+
+    def test_predict_blending(self, sample_regression_data, pretrained_base_models):
+        """Test blending predictions."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
         # Create and train ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         ensemble.train_blending(X_val, y_val)
@@ -315,19 +372,15 @@ class TestBlendingEnsemble:
         assert len(predictions) == len(X_test)
         assert predictions.dtype == np.float64
 
-    def test_manual_weights(self, sample_regression_data, simple_base_models):
+    def test_manual_weights(self, sample_regression_data, pretrained_base_models):
         """Test blending with manually set weights."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble with manual weights
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        ensemble.add_base_model("model1", simple_base_models["linear"], weight=0.5)
-        ensemble.add_base_model("model2", simple_base_models["ridge"], weight=0.3)
-        ensemble.add_base_model("model3", simple_base_models["rf"], weight=0.2)
+        ensemble.add_base_model("model1", pretrained_base_models["linear"], weight=0.5)
+        ensemble.add_base_model("model2", pretrained_base_models["ridge"], weight=0.3)
+        ensemble.add_base_model("model3", pretrained_base_models["rf"], weight=0.2)
 
         # Predict without training (uses manual weights)
         predictions = ensemble.predict(X_test)
@@ -340,21 +393,16 @@ class TestBlendingEnsemble:
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestVotingEnsemble:
     """Test voting ensemble functionality."""
 
-    def test_predict_voting(self, sample_regression_data, simple_base_models):
+    def test_predict_voting(self, sample_regression_data, pretrained_base_models):
         """Test voting predictions (equal weights)."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="voting")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Make predictions
@@ -362,33 +410,68 @@ class TestVotingEnsemble:
 
         # Voting should be mean of all predictions
         base_preds = np.column_stack(
-            [model.predict(X_test) for model in simple_base_models.values()]
+            [model.predict(X_test) for model in pretrained_base_models.values()]
         )
         expected = base_preds.mean(axis=1)
 
         np.testing.assert_array_almost_equal(predictions, expected)
 
+        # Meta-features are laid out column-major, one contiguous column per model
+        meta = ensemble._get_base_predictions(X_test)
+        assert meta.flags.f_contiguous
+        np.testing.assert_array_equal(meta, base_preds)
+
+    def test_parallel_matches_sequential(
+        self, sample_regression_data, pretrained_base_models
+    ):
+        """Test threaded base-model predictions match a sequential run."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
+
+        results = []
+        for n_jobs in (1, -1):
+            ensemble = EnsemblePredictor(ensemble_method="voting", n_jobs=n_jobs)
+            for name, model in pretrained_base_models.items():
+                ensemble.add_base_model(name, model)
+            results.append(ensemble.predict(X_test))
+
+        np.testing.assert_array_equal(results[0], results[1])
+
+    def test_sequential_predictions_by_default(
+        self, sample_regression_data, pretrained_base_models, monkeypatch
+    ):
+        """Test no thread pool is used unless n_jobs is set."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
+
+        def fail_parallel(*args, **kwargs):
+            raise AssertionError("Parallel used without opting in")
+
+        monkeypatch.setattr(ensemble_predictor, "Parallel", fail_parallel)
+
+        ensemble = EnsemblePredictor(ensemble_method="voting")
+        for name, model in pretrained_base_models.items():
+            ensemble.add_base_model(name, model)
+
+        assert ensemble.n_jobs == 1
+        assert len(ensemble.predict(X_test)) == len(X_test)
+
 
 # ============================================================================
 # Test EnsemblePredictor - Dynamic Weighting
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestDynamicWeighting:
     """Test dynamic weight adjustment."""
 
-    def test_update_weights_dynamic(self, sample_regression_data, simple_base_models):
+    def test_update_weights_dynamic(
+        self, sample_regression_data, pretrained_base_models
+    ):
         """Test dynamic weight updates based on recent performance."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Initial weights
@@ -403,18 +486,14 @@ class TestDynamicWeighting:
         assert sum(ensemble.weights.values()) == pytest.approx(1.0, abs=1e-6)
 
     def test_performance_history_tracking(
-        self, sample_regression_data, simple_base_models
+        self, sample_regression_data, pretrained_base_models
     ):
         """Test performance history is tracked."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Update weights twice
@@ -431,21 +510,16 @@ class TestDynamicWeighting:
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestEnsembleEvaluation:
     """Test ensemble evaluation functionality."""
 
-    def test_evaluate_all_models(self, sample_regression_data, simple_base_models):
+    def test_evaluate_all_models(self, sample_regression_data, pretrained_base_models):
         """Test evaluation of ensemble and base models."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create and train ensemble
         ensemble = EnsemblePredictor(ensemble_method="voting")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
 
         # Evaluate
@@ -458,23 +532,21 @@ class TestEnsembleEvaluation:
         assert "rmse" in results["ensemble"]
 
         # Check individual model results
-        for name in simple_base_models.keys():
+        for name in pretrained_base_models.keys():
             assert name in results
             assert "mse" in results[name]
             assert "mae" in results[name]
             assert "rmse" in results[name]
 
-    def test_get_model_contributions(self, sample_regression_data, simple_base_models):
+    def test_get_model_contributions(
+        self, sample_regression_data, pretrained_base_models
+    ):
         """Test getting individual model contributions."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model, weight=1.0 / 3)
 
         # Get contributions
@@ -487,45 +559,143 @@ class TestEnsembleEvaluation:
         assert "rf_pred" in contributions.columns
         assert len(contributions) == len(X_test)
 
+    def test_base_predictions_shared_within_call(
+        self, sample_regression_data, pretrained_base_models
+    ):
+        """Test each base model predicts once per call and nothing is kept."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
+
+        calls = {}
+
+        class CountingModel:
+            def __init__(self, name, model):
+                self.name = name
+                self.model = model
+
+            def predict(self, X):
+                calls[self.name] = calls.get(self.name, 0) + 1
+                return self.model.predict(X)
+
+        ensemble = EnsemblePredictor(ensemble_method="blending")
+        for name, model in pretrained_base_models.items():
+            ensemble.add_base_model(name, CountingModel(name, model))
+
+        ensemble.train_blending(X_test, y_test)
+        assert calls == {name: 1 for name in pretrained_base_models}
+
+        ensemble.evaluate(X_test, y_test)
+        assert calls == {name: 2 for name in pretrained_base_models}
+
+        ensemble.get_model_contributions(X_test)
+        assert calls == {name: 3 for name in pretrained_base_models}
+
+        # Predictions are not reused across calls, so in-place edits are seen
+        X = X_test.copy()
+        before = ensemble.predict(X)
+        X *= 2.0
+        assert not np.allclose(ensemble.predict(X), before)
+
 
 # ============================================================================
 # Test EnsemblePredictor - Save/Load
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestEnsemblePersistence:
     """Test ensemble save/load functionality."""
 
-    def test_save_and_load(self, sample_regression_data, simple_base_models):
+    def test_save_and_load(
+        self, sample_regression_data, pretrained_base_models, tmp_path
+    ):
         """Test saving and loading ensemble."""
         (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-        # Train base models
-        for model in simple_base_models.values():
-            model.fit(X_train, y_train)
-
         # Create ensemble
         ensemble = EnsemblePredictor(ensemble_method="blending")
-        for name, model in simple_base_models.items():
+        for name, model in pretrained_base_models.items():
             ensemble.add_base_model(name, model)
         ensemble.train_blending(X_val, y_val)
 
         # Save
-        with tempfile.NamedTemporaryFile(suffix=".pkl", delete=False) as tmp:
-            ensemble.save(tmp.name)
+        save_path = tmp_path / "ensemble"
+        ensemble.save(save_path)
+
+        assert (save_path / "manifest.json").exists()
+
+        # Create new ensemble and load
+        ensemble2 = EnsemblePredictor(ensemble_method="blending")
+        ensemble2.load(save_path)
+
+        # Check loaded attributes
+        assert ensemble2.ensemble_method == ensemble.ensemble_method
+        assert ensemble2.weights == ensemble.weights
+        assert ensemble2.model_names == ensemble.model_names
+
+        # Base models are deserialized lazily on first prediction
+        np.testing.assert_array_almost_equal(
+            ensemble2.predict(X_test), ensemble.predict(X_test)
+        )
+
+    def test_save_and_load_documented_path(
+        self, sample_regression_data, pretrained_base_models, tmp_path
+    ):
+        """Test round-trip through the single-file path used by the scripts."""
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
+
+        ensemble = EnsemblePredictor(ensemble_method="blending")
+        for name, model in pretrained_base_models.items():
+            ensemble.add_base_model(name, model)
+        ensemble.train_blending(X_val, y_val)
+
+        # Re-save a lazily loaded ensemble to the documented file path
+        ensemble.save(tmp_path / "ensemble")
+        lazy = EnsemblePredictor()
+        lazy.load(tmp_path / "ensemble")
+
+        save_path = tmp_path / "models" / "ensemble_model.pkl"
+        lazy.save(save_path)
+
+        assert save_path.is_file()
+
+        ensemble2 = EnsemblePredictor()
+        ensemble2.load(save_path)
+
+        assert ensemble2.weights == ensemble.weights
+        assert ensemble2.model_names == ensemble.model_names
+        np.testing.assert_array_almost_equal(
+            ensemble2.predict(X_test), ensemble.predict(X_test)
+        )
+
+    def test_load_legacy_single_file(
+        self, sample_regression_data, pretrained_base_models, tmp_path
+    ):
+        """Test loading an ensemble saved as a single joblib pickle."""
+        import joblib
+
+        (X_train, y_train), (X_val, y_val), (X_test, y_test) = sample_regression_data
 
-            # Create new ensemble and load
-            ensemble2 = EnsemblePredictor(ensemble_method="blending")
-            ensemble2.load(tmp.name)
+        model = pretrained_base_models["linear"]
+
+        legacy_path = tmp_path / "ensemble_model.pkl"
+        joblib.dump(
+            {
+                "ensemble_method": "voting",
+                "meta_model_type": "ridge",
+                "weights": {"linear": 1.0},
+                "model_names": ["linear"],
+                "base_models": {"linear": model},
+                "meta_model": None,
+            },
+            legacy_path,
+        )
 
-            # Check loaded attributes
-            assert ensemble2.ensemble_method == ensemble.ensemble_method
-            assert ensemble2.weights == ensemble.weights
-            assert ensemble2.model_names == ensemble.model_names
+        ensemble = EnsemblePredictor()
+        ensemble.load(legacy_path)
 
-            # Clean up
-            Path(tmp.name).unlink()
+        assert ensemble.ensemble_method == "voting"
+        np.testing.assert_array_almost_equal(
+            ensemble.predict(X_test), model.predict(X_test)
+        )
 
 
 # ============================================================================
@@ -533,7 +703,6 @@ class TestEnsemblePersistence:
 # ============================================================================
 
 
-@pytest.mark.skipif(not ENSEMBLE_AVAILABLE, reason="Requires ensemble modules")
 class TestEnsembleBuilder:
     """Test ensemble builder functionality."""
 
@@ -9,6 +9,10 @@ Install separately: pip install torch==2.8.0
 Most tests will be skipped if PyTorch is not available.
 """
 
+import copy
+import weakref
+
+import joblib
 import pytest
 import pandas as pd
 import numpy as np
@@ -17,10 +21,14 @@ import numpy as np
 try:
     import torch
 
+    from torch.utils._python_dispatch import TorchDispatchMode
+    from torch.utils._pytree import tree_leaves
+
     PYTORCH_AVAILABLE = True
 except ImportError:
     PYTORCH_AVAILABLE = False
     torch = None
+    TorchDispatchMode = object
 
 # Try importing LSTM modules (will fail if PyTorch not available)
 try:
@@ -37,31 +45,44 @@ except ImportError:
 
 from proratio_quantlab.ml.lstm_data_pipeline import LSTMDataPipeline, prepare_lstm_data
 
+# Mixed-precision settings exercised by the training tests (None = float32)
+AMP_DTYPES = [None, torch.bfloat16] if PYTORCH_AVAILABLE else [None]
+
+# Recurrent model architectures sharing the same interface
+RNN_MODEL_CLASSES = [LSTMModel, GRUModel] if LSTM_MODULES_AVAILABLE else []
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_time_series_data():
-    """Create sample time-series data for testing"""
+    """Create sample time-series data for testing (shared, do not mutate)"""
     dates = pd.date_range(start="2024-01-01", periods=500, freq="4h")
 
     # Generate realistic crypto-like price data
-    np.random.seed(42)
+    rng = np.random.default_rng(42)
     base_price = 50000
-    returns = np.random.normal(0.0001, 0.02, 500)
-    prices = base_price * np.exp(np.cumsum(returns))
+    returns = rng.normal(0.0001, 0.02, 500)
+    prices = base_price * np.cumprod(1.0 + returns)
+
+    # One draw for open/high/low offsets, volume and RSI (ranges per row)
+    open_off, high_off, low_off, volume, rsi = rng.uniform(
+        low=[[-0.01], [0.001], [-0.02], [1000], [30]],
+        high=[[0.01], [0.02], [-0.001], [10000], [70]],
+        size=(5, 500),
+    )
 
     df = pd.DataFrame(
         {
             "date": dates,
-            "open": prices * (1 + np.random.uniform(-0.01, 0.01, 500)),
-            "high": prices * (1 + np.random.uniform(0.001, 0.02, 500)),
-            "low": prices * (1 + np.random.uniform(-0.02, -0.001, 500)),
+            "open": prices * (1 + open_off),
+            "high": prices * (1 + high_off),
+            "low": prices * (1 + low_off),
             "close": prices,
-            "volume": np.random.uniform(1000, 10000, 500),
+            "volume": volume,
         }
     )
 
     # Add some simple features
-    df["rsi_14"] = np.random.uniform(30, 70, 500)
+    df["rsi_14"] = rsi
     df["ema_9"] = prices * 0.98
     df["ema_21"] = prices * 0.95
     df["volume_sma"] = df["volume"].rolling(20).mean().fillna(df["volume"])
@@ -72,6 +93,49 @@ def sample_time_series_data():
     return df.dropna()
 
 
+@pytest.fixture(scope="module")
+def preprocessed_data(sample_time_series_data):
+    """Scaled features, targets and the untrained predictor whose scaler was fit"""
+    if not LSTM_MODULES_AVAILABLE:
+        pytest.skip("Requires PyTorch")
+
+    predictor = LSTMPredictor(
+        model_type="lstm", sequence_length=10, hidden_size=32, num_layers=1
+    )
+    X, y = predictor.preprocess_data(
+        sample_time_series_data, target_column="target_return", fit_scaler=True
+    )
+    return X, y, predictor
+
+
+@pytest.fixture(scope="session")
+def rnn_input():
+    """Batch of sequences (batch_size, sequence_length, input_size), on GPU if any"""
+    if not PYTORCH_AVAILABLE:
+        pytest.skip("Requires PyTorch")
+
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    return torch.randn(32, 20, 10, device=device)
+
+
+@pytest.fixture(scope="module")
+def compiled_lstm(rnn_input):
+    """Eager LSTM and its CUDA-graph compiled twin, captured once per module"""
+    if not LSTM_MODULES_AVAILABLE or not torch.cuda.is_available():
+        pytest.skip("Requires PyTorch with CUDA")
+
+    model = LSTMModel(input_size=10, hidden_size=64, num_layers=2).eval().cuda()
+    # No fullgraph: dynamo does not trace nn.LSTM, so the recurrent layer runs
+    # eagerly and only the surrounding layers are captured
+    compiled = torch.compile(model, mode="reduce-overhead")
+
+    # Warm up once so graph capture happens here, not in the first test
+    with torch.no_grad():
+        compiled(rnn_input)
+
+    return model, compiled
+
+
 @pytest.mark.skipif(not LSTM_MODULES_AVAILABLE, reason="Requires PyTorch")
 class TestTimeSeriesDataset:
     """Test TimeSeriesDataset class"""
@@ -109,73 +173,88 @@ class TestTimeSeriesDataset:
             X, y = dataset[i]
             assert X.shape == (10, 5)
 
+    def test_get_all(self):
+        """Test batched access matches per-item access"""
+        data = np.random.randn(100, 5)
+        targets = np.random.randn(100)
+
+        dataset = TimeSeriesDataset(data, targets, sequence_length=10)
+
+        X_all, y_all = dataset.get_all()
+
+        assert X_all.shape == (90, 10, 5)
+        assert y_all.shape == (90,)
+        for i in (0, 45, 89):
+            X, y = dataset[i]
+            assert torch.equal(X_all[i], X)
+            assert torch.equal(y_all[i], y)
+
+        # Windows are views over the dataset's data, not copies
+        assert X_all.untyped_storage().data_ptr() == dataset.data.data_ptr()
+
 
 @pytest.mark.skipif(not LSTM_MODULES_AVAILABLE, reason="Requires PyTorch")
-class TestLSTMModel:
-    """Test LSTM model architecture"""
+class TestRNNModel:
+    """Test LSTM and GRU model architectures"""
 
-    def test_initialization(self):
-        """Test LSTM model initialization"""
-        model = LSTMModel(input_size=10, hidden_size=64, num_layers=2)
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_initialization(self, model_cls):
+        """Test model initialization"""
+        model = model_cls(input_size=10, hidden_size=64, num_layers=2)
 
         assert model.input_size == 10
         assert model.hidden_size == 64
         assert model.num_layers == 2
 
-    def test_forward_pass(self):
-        """Test forward pass through LSTM"""
-        model = LSTMModel(input_size=10, hidden_size=64, num_layers=2)
-        model.eval()
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_forward_pass(self, model_cls, rnn_input):
+        """Test forward pass through the recurrent model"""
+        model = model_cls(input_size=10, hidden_size=64, num_layers=2)
+        model.eval().to(rnn_input.device)
 
-        # Batch of sequences
-        x = torch.randn(32, 20, 10)  # batch_size, sequence_length, input_size
-        output = model(x)
+        output = model(rnn_input)
 
         assert output.shape == (32, 1)  # batch_size, output_size
 
-    def test_output_no_nan(self):
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_output_no_nan(self, model_cls, rnn_input):
         """Test that forward pass doesn't produce NaN"""
-        model = LSTMModel(input_size=10, hidden_size=64, num_layers=2)
-        model.eval()
+        model = model_cls(input_size=10, hidden_size=64, num_layers=2)
+        model.eval().to(rnn_input.device)
 
-        x = torch.randn(8, 20, 10)
-        output = model(x)
+        output = model(rnn_input[:8])
 
         assert not torch.isnan(output).any()
 
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_jit_scripted_forward(self, model_cls, rnn_input):
+        """Test TorchScript model matches eager execution"""
+        model = model_cls(input_size=10, hidden_size=64, num_layers=2)
+        model.eval().to(rnn_input.device)
+        scripted = torch.jit.script(model)
 
-@pytest.mark.skipif(not LSTM_MODULES_AVAILABLE, reason="Requires PyTorch")
-class TestGRUModel:
-    """Test GRU model architecture"""
-
-    def test_initialization(self):
-        """Test GRU model initialization"""
-        model = GRUModel(input_size=10, hidden_size=64, num_layers=2)
-
-        assert model.input_size == 10
-        assert model.hidden_size == 64
-        assert model.num_layers == 2
+        with torch.no_grad():
+            torch.testing.assert_close(scripted(rnn_input), model(rnn_input))
 
-    def test_forward_pass(self):
-        """Test forward pass through GRU"""
-        model = GRUModel(input_size=10, hidden_size=64, num_layers=2)
-        model.eval()
+    def test_compiled_forward_pass(self, compiled_lstm, rnn_input):
+        """Test compiled forward pass matches eager execution"""
+        model, compiled = compiled_lstm
 
-        x = torch.randn(32, 20, 10)
-        output = model(x)
+        with torch.no_grad():
+            expected = model(rnn_input)
+            output = compiled(rnn_input)
 
         assert output.shape == (32, 1)
+        torch.testing.assert_close(output, expected)
 
     def test_gru_faster_than_lstm(self):
         """GRU should have fewer parameters than LSTM"""
         lstm = LSTMModel(input_size=10, hidden_size=64, num_layers=2)
         gru = GRUModel(input_size=10, hidden_size=64, num_layers=2)
 
-        lstm_params = sum(p.numel() for p in lstm.parameters())
-        gru_params = sum(p.numel() for p in gru.parameters())
-
         # GRU typically has ~75% of LSTM parameters
-        assert gru_params < lstm_params
+        assert gru.num_parameters < lstm.num_parameters
+        assert lstm.num_parameters == sum(p.numel() for p in lstm.parameters())
 
 
 @pytest.mark.skipif(not LSTM_MODULES_AVAILABLE, reason="Requires PyTorch")
@@ -202,15 +281,12 @@ class TestLSTMPredictor:
         assert X.shape[1] > 0  # Has features
         assert len(y) == len(sample_time_series_data)
 
-    def test_train_basic(self, sample_time_series_data):
+    @pytest.mark.parametrize("amp_dtype", AMP_DTYPES)
+    def test_train_basic(self, preprocessed_data, amp_dtype):
         """Test basic training functionality"""
-        predictor = LSTMPredictor(
-            model_type="lstm", sequence_length=10, hidden_size=32, num_layers=1
-        )
-
-        X, y = predictor.preprocess_data(
-            sample_time_series_data, target_column="target_return", fit_scaler=True
-        )
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.amp_dtype = amp_dtype
 
         # Train for just 2 epochs (quick test)
         history = predictor.train(
@@ -221,16 +297,44 @@ class TestLSTMPredictor:
         assert "val_loss" in history
         assert len(history["train_loss"]) > 0
 
-    def test_predict(self, sample_time_series_data):
-        """Test prediction functionality"""
-        predictor = LSTMPredictor(
-            model_type="lstm", sequence_length=10, hidden_size=32, num_layers=1
-        )
+    def test_loader_worker_config(self, preprocessed_data):
+        """Test worker loaders keep batches on the host (not iterated, no fork)"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.num_workers = 1
+        predictor.pin_memory = True
+
+        loader = predictor._create_loader(X[:300], y[:300], shuffle=True)
+        assert loader.num_workers == 1
+        assert loader.persistent_workers
+        assert loader.prefetch_factor == 2
+        assert loader.pin_memory == torch.cuda.is_available()
+        assert loader.dataset.windows.device.type == "cpu"
+
+    def test_train_with_host_side_batches(self, preprocessed_data):
+        """Test training when batches are copied from host memory per step"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.pin_memory = True
+
+        loader = predictor._create_loader(X[:300], y[:300])
+        assert loader.num_workers == 0
+        assert loader.dataset.windows.device.type == "cpu"
 
-        X, y = predictor.preprocess_data(
-            sample_time_series_data, target_column="target_return", fit_scaler=True
+        history = predictor.train(
+            X[:300], y[:300], X[300:], y[300:], epochs=2, verbose=False
         )
 
+        assert len(history["train_loss"]) == 2
+        assert np.isfinite(history["val_loss"]).all()
+
+    @pytest.mark.parametrize("amp_dtype", AMP_DTYPES)
+    def test_predict(self, preprocessed_data, amp_dtype):
+        """Test prediction functionality"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.amp_dtype = amp_dtype
+
         # Train briefly
         predictor.train(X[:300], y[:300], epochs=2, verbose=False)
 
@@ -240,26 +344,44 @@ class TestLSTMPredictor:
         # Account for sequence_length reduction
         expected_length = 400 - 300 - predictor.sequence_length
         assert len(predictions) == expected_length
+        assert predictions.dtype == np.float32
         assert not np.isnan(predictions).any()
 
-    def test_save_and_load(self, sample_time_series_data, tmp_path):
-        """Test model saving and loading"""
-        predictor = LSTMPredictor(
-            model_type="lstm", sequence_length=10, hidden_size=32, num_layers=1
-        )
+        # Chunked inference matches the single-batch path
+        chunked = predictor.predict(X[300:400], batch_size=16)
+        np.testing.assert_allclose(chunked, predictions, rtol=1e-2, atol=1e-3)
 
-        X, y = predictor.preprocess_data(
-            sample_time_series_data, target_column="target_return", fit_scaler=True
-        )
+    def test_train_jit(self, preprocessed_data):
+        """Test training and prediction with a TorchScript model"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.jit = True
+
+        history = predictor.train(X[:300], y[:300], epochs=1, verbose=False)
+        predictions = predictor.predict(X[300:400])
+
+        assert isinstance(predictor.model, torch.jit.ScriptModule)
+        assert len(history["train_loss"]) == 1
+        assert len(predictions) == 100 - predictor.sequence_length
+
+        predictor.gradient_checkpointing = True
+        with pytest.raises(ValueError, match="not supported with jit"):
+            predictor._create_model(X.shape[1])
+
+    def test_save_and_load(self, preprocessed_data, tmp_path):
+        """Test model saving and loading"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
 
         # Train briefly
         predictor.train(X[:300], y[:300], epochs=2, verbose=False)
 
         # Save
-        save_path = tmp_path / "test_model.pkl"
+        save_path = tmp_path / "test_model.pt"
         predictor.save(str(save_path))
 
         assert save_path.exists()
+        assert save_path.stat().st_size > 0
 
         # Load into new predictor
         predictor2 = LSTMPredictor()
@@ -268,10 +390,132 @@ class TestLSTMPredictor:
         assert predictor2.model_type == predictor.model_type
         assert predictor2.sequence_length == predictor.sequence_length
         assert predictor2.hidden_size == predictor.hidden_size
+        assert (
+            predictor2.model.state_dict().keys() == predictor.model.state_dict().keys()
+        )
+        np.testing.assert_allclose(predictor2.scaler.mean_, predictor.scaler.mean_)
+        np.testing.assert_allclose(
+            predictor2.predict(X[300:400]), predictor.predict(X[300:400]), rtol=1e-6
+        )
+
+    def test_load_legacy_joblib(self, preprocessed_data, tmp_path):
+        """Test loading a checkpoint written with joblib"""
+        X, y, base_predictor = preprocessed_data
+        predictor = copy.deepcopy(base_predictor)
+        predictor.train(X[:300], y[:300], epochs=1, verbose=False)
+
+        save_path = tmp_path / "legacy_model.pkl"
+        joblib.dump(
+            {
+                "model_state_dict": predictor.model.state_dict(),
+                "scaler": predictor.scaler,
+                "feature_names": predictor.feature_names,
+                "input_size": predictor.input_size,
+                "config": {
+                    "model_type": predictor.model_type,
+                    "sequence_length": predictor.sequence_length,
+                    "hidden_size": predictor.hidden_size,
+                    "num_layers": predictor.num_layers,
+                    "dropout": predictor.dropout,
+                },
+            },
+            save_path,
+        )
 
+        predictor2 = LSTMPredictor()
+        predictor2.load(str(save_path))
 
+        np.testing.assert_allclose(
+            predictor2.predict(X[300:400]), predictor.predict(X[300:400]), rtol=1e-6
+        )
+
+
+class _PeakTensorMemory(TorchDispatchMode):
+    """
+    Track peak bytes of live tensor storages created inside the context.
+
+    Works on any device (including CPU, which has no allocator statistics),
+    and sees tensors recomputed by checkpointing during backward.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.live = 0
+        self.peak = 0
+        self._storages = weakref.WeakSet()
+
+    def _release(self, nbytes: int):
+        self.live -= nbytes
+
+    def __torch_dispatch__(self, func, types, args=(), kwargs=None):
+        out = func(*args, **(kwargs or {}))
+        for t in tree_leaves(out):
+            if isinstance(t, torch.Tensor):
+                storage = t.untyped_storage()
+                if storage not in self._storages:
+                    self._storages.add(storage)
+                    self.live += storage.nbytes()
+                    weakref.finalize(storage, self._release, storage.nbytes())
+        self.peak = max(self.peak, self.live)
+        return out
+
+
+@pytest.mark.skipif(not LSTM_MODULES_AVAILABLE, reason="Requires PyTorch")
+class TestLSTMMemory:
+    """Test gradient checkpointing"""
+
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_checkpointing_preserves_gradients(self, model_cls):
+        """Checkpointed training computes the same gradients"""
+        torch.manual_seed(0)
+        model = model_cls(input_size=10, hidden_size=32, num_layers=2, dropout=0.0)
+        checkpointed = model_cls(
+            input_size=10,
+            hidden_size=32,
+            num_layers=2,
+            dropout=0.0,
+            gradient_checkpointing=True,
+        )
+        checkpointed.load_state_dict(model.state_dict())
+
+        x = torch.randn(8, 20, 10)
+        for m in (model, checkpointed):
+            m.train()
+            m(x).sum().backward()
+
+        for (name, p), p_ckpt in zip(
+            model.named_parameters(), checkpointed.parameters()
+        ):
+            torch.testing.assert_close(p.grad, p_ckpt.grad, msg=name)
+
+    @pytest.mark.parametrize("model_cls", RNN_MODEL_CLASSES)
+    def test_checkpointing_reduces_memory(self, model_cls):
+        """Per-layer checkpointing lowers peak training memory"""
+        x = torch.randn(32, 50, 16)
+
+        peaks = {}
+        for enabled in (False, True):
+            torch.manual_seed(0)
+            model = model_cls(
+                input_size=16,
+                hidden_size=128,
+                num_layers=4,
+                dropout=0.0,
+                gradient_checkpointing=enabled,
+            )
+            model.train()
+
+            with _PeakTensorMemory() as tracker:
+                model(x).sum().backward()
+            peaks[enabled] = tracker.peak
+
+        # Only one of the four layers is materialized at a time
+        assert peaks[True] < 0.5 * peaks[False]
+
+
+@pytest.mark.cpu_parallel
 class TestLSTMDataPipeline:
-    """Test LSTM data pipeline"""
+    """Test LSTM data pipeline (CPU-only, safe to distribute with -n auto)"""
 
     def test_initialization(self):
         """Test pipeline initialization"""
@@ -339,7 +583,8 @@ class TestLSTMDataPipeline:
 class TestLSTMIntegration:
     """Integration tests for LSTM workflow"""
 
-    def test_full_pipeline(self, sample_time_series_data):
+    @pytest.mark.parametrize("amp_dtype", AMP_DTYPES)
+    def test_full_pipeline(self, sample_time_series_data, amp_dtype):
         """Test complete training and prediction pipeline"""
         # Prepare data
         (X_train, y_train), (X_val, y_val), (X_test, y_test), feature_cols = (
@@ -348,7 +593,11 @@ class TestLSTMIntegration:
 
         # Create predictor
         predictor = LSTMPredictor(
-            model_type="lstm", sequence_length=10, hidden_size=32, num_layers=1
+            model_type="lstm",
+            sequence_length=10,
+            hidden_size=32,
+            num_layers=1,
+            amp_dtype=amp_dtype,
         )
 
         # Preprocess
@@ -379,7 +628,7 @@ class TestLSTMIntegration:
             sample_time_series_data
         )
 
-        # LSTM
+        # Preprocess once and share the fitted scaler between both models
         lstm_predictor = LSTMPredictor(
             model_type="lstm", sequence_length=10, hidden_size=32
         )
@@ -389,19 +638,15 @@ class TestLSTMIntegration:
             ),
             fit_scaler=True,
         )
-        lstm_history = lstm_predictor.train(
-            X_scaled, y_train[:200], epochs=2, verbose=False
-        )
 
-        # GRU
         gru_predictor = LSTMPredictor(
             model_type="gru", sequence_length=10, hidden_size=32
         )
-        X_scaled, _ = gru_predictor.preprocess_data(
-            pd.DataFrame(X_train[:200], columns=feature_cols).assign(
-                target_return=y_train[:200]
-            ),
-            fit_scaler=True,
+        gru_predictor.scaler = lstm_predictor.scaler
+        gru_predictor.feature_names = lstm_predictor.feature_names
+
+        lstm_history = lstm_predictor.train(
+            X_scaled, y_train[:200], epochs=2, verbose=False
         )
         gru_history = gru_predictor.train(
             X_scaled, y_train[:200], epochs=2, verbose=False
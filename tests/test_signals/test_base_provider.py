@@ -4,7 +4,10 @@ Tests for Base LLM Provider
 Tests the abstract base class and common functionality for all LLM providers.
 """
 
+import re
+
 import pytest
+import numpy as np
 import pandas as pd
 from datetime import datetime
 from proratio_signals.llm_providers.base import (
@@ -13,6 +16,12 @@ from proratio_signals.llm_providers.base import (
     OHLCVData,
 )
 
+# Expected fields of OHLCVData.to_summary_text(), in output order
+_SUMMARY_RE = re.compile(
+    r"Pair: BTC/USDT\nTimeframe: 1h\nCurrent Price:.*RSI: 50\.00\n.*MACD: 2\.50",
+    re.DOTALL,
+)
+
 
 class MockLLMProvider(BaseLLMProvider):
     """Mock implementation for testing"""
@@ -35,28 +44,33 @@ class MockLLMProvider(BaseLLMProvider):
 
 def create_sample_ohlcv() -> pd.DataFrame:
     """Create sample OHLCV data for testing"""
-    dates = pd.date_range(start="2024-01-01", periods=100, freq="1H")
+    i = np.arange(100, dtype=np.int64)
     data = {
-        "timestamp": dates,
-        "open": [100 + i for i in range(100)],
-        "high": [105 + i for i in range(100)],
-        "low": [95 + i for i in range(100)],
-        "close": [102 + i for i in range(100)],
-        "volume": [1000 + i * 10 for i in range(100)],
+        "timestamp": pd.date_range(start="2024-01-01", periods=100, freq="1h"),
+        "open": 100 + i,
+        "high": 105 + i,
+        "low": 95 + i,
+        "close": 102 + i,
+        "volume": 1000 + i * 10,
     }
     return pd.DataFrame(data)
 
 
+@pytest.fixture(scope="module")
+def sample_ohlcv() -> pd.DataFrame:
+    """Sample OHLCV data shared by the module (read-only in tests)"""
+    return create_sample_ohlcv()
+
+
 class TestOHLCVData:
     """Test OHLCVData container"""
 
-    def test_creation(self):
+    def test_creation(self, sample_ohlcv):
         """Test OHLCVData creation"""
-        df = create_sample_ohlcv()
         ohlcv = OHLCVData(
             pair="BTC/USDT",
             timeframe="1h",
-            data=df,
+            data=sample_ohlcv,
             indicators={"RSI": 50.0, "EMA_20": 100.5},
         )
 
@@ -65,23 +79,18 @@ class TestOHLCVData:
         assert len(ohlcv.data) == 100
         assert ohlcv.indicators["RSI"] == 50.0
 
-    def test_to_summary_text(self):
+    def test_to_summary_text(self, sample_ohlcv):
         """Test conversion to summary text"""
-        df = create_sample_ohlcv()
         ohlcv = OHLCVData(
             pair="BTC/USDT",
             timeframe="1h",
-            data=df,
+            data=sample_ohlcv,
             indicators={"RSI": 50.0, "MACD": 2.5},
         )
 
         summary = ohlcv.to_summary_text(lookback=20)
 
-        assert "BTC/USDT" in summary
-        assert "1h" in summary
-        assert "RSI: 50.00" in summary
-        assert "MACD: 2.50" in summary
-        assert "Current Price:" in summary
+        assert _SUMMARY_RE.search(summary), summary
 
 
 class TestMarketAnalysis:
@@ -126,11 +135,10 @@ class TestBaseLLMProvider:
         with pytest.raises(ValueError, match="Invalid API key"):
             MockLLMProvider(api_key="bad")
 
-    def test_parse_response_long_signal(self):
+    def test_parse_response_long_signal(self, sample_ohlcv):
         """Test response parsing for LONG signal"""
         provider = MockLLMProvider(api_key="test_key_12345")
-        df = create_sample_ohlcv()
-        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=df)
+        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=sample_ohlcv)
 
         response = "This is a strong LONG signal with high confidence. Buy recommended."
         analysis = provider._parse_response(response, ohlcv)
@@ -139,11 +147,10 @@ class TestBaseLLMProvider:
         assert analysis.confidence > 0.5
         assert analysis.pair == "BTC/USDT"
 
-    def test_parse_response_short_signal(self):
+    def test_parse_response_short_signal(self, sample_ohlcv):
         """Test response parsing for SHORT signal"""
         provider = MockLLMProvider(api_key="test_key_12345")
-        df = create_sample_ohlcv()
-        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=df)
+        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=sample_ohlcv)
 
         response = "Bearish signal detected. Sell recommended with short position."
         analysis = provider._parse_response(response, ohlcv)
@@ -151,17 +158,34 @@ class TestBaseLLMProvider:
         assert analysis.direction == "short"
         assert analysis.pair == "BTC/USDT"
 
-    def test_parse_response_neutral_signal(self):
+    def test_parse_response_neutral_signal(self, sample_ohlcv):
         """Test response parsing for NEUTRAL signal"""
         provider = MockLLMProvider(api_key="test_key_12345")
-        df = create_sample_ohlcv()
-        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=df)
+        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=sample_ohlcv)
 
         response = "Market conditions are unclear. No clear signal."
         analysis = provider._parse_response(response, ohlcv)
 
         assert analysis.direction == "neutral"
 
+    @pytest.mark.parametrize(
+        "response, expected",
+        [
+            ("Selling pressure is fading, buyers step in", "long"),
+            ("Short-term bounce but overall BULLISH", "long"),
+            ("Consider shorting the rally", "short"),
+            ("Trend remains unclear", "neutral"),
+        ],
+    )
+    def test_parse_response_direction_keywords(self, sample_ohlcv, response, expected):
+        """Test keyword matching is case-insensitive and prefers long"""
+        provider = MockLLMProvider(api_key="test_key_12345")
+        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=sample_ohlcv)
+
+        analysis = provider._parse_response(response, ohlcv)
+
+        assert analysis.direction == expected
+
     def test_test_connection(self):
         """Test connection testing"""
         provider = MockLLMProvider(api_key="test_key_12345")
@@ -172,11 +196,10 @@ class TestBaseLLMProvider:
 class TestProviderAnalyzeMarket:
     """Test analyze_market method"""
 
-    def test_analyze_market_basic(self):
+    def test_analyze_market_basic(self, sample_ohlcv):
         """Test basic market analysis"""
         provider = MockLLMProvider(api_key="test_key_12345")
-        df = create_sample_ohlcv()
-        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=df)
+        ohlcv = OHLCVData(pair="BTC/USDT", timeframe="1h", data=sample_ohlcv)
 
         analysis = provider.analyze_market(
             ohlcv_data=ohlcv, prompt_template="Analyze this: {market_data}"
@@ -186,14 +209,13 @@ class TestProviderAnalyzeMarket:
         assert analysis.provider == "mock"
         assert analysis.direction in ["long", "short", "neutral"]
 
-    def test_analyze_market_with_indicators(self):
+    def test_analyze_market_with_indicators(self, sample_ohlcv):
         """Test market analysis with technical indicators"""
         provider = MockLLMProvider(api_key="test_key_12345")
-        df = create_sample_ohlcv()
         ohlcv = OHLCVData(
             pair="BTC/USDT",
             timeframe="1h",
-            data=df,
+            data=sample_ohlcv,
             indicators={"RSI": 65.0, "MACD": 1.5},
         )
 
@@ -5,6 +5,8 @@ Tests the hybrid ML+LLM prediction engine including signal strength
 classification, conflict resolution, and agreement scoring.
 """
 
+import threading
+
 import pytest
 import pandas as pd
 import numpy as np
@@ -19,6 +21,71 @@ from proratio_signals.hybrid_predictor import (
 )
 
 
+@pytest.fixture(scope="module")
+def sample_ohlcv():
+    """Sample OHLCV data shared by the module (read-only in tests)"""
+    dates = pd.date_range("2024-01-01", periods=100, freq="4h")
+    # One draw for all columns: open, high, low, close, volume ranges
+    values = np.random.default_rng(0).uniform(
+        low=[40000, 45000, 35000, 40000, 1000],
+        high=[45000, 50000, 40000, 45000, 5000],
+        size=(100, 5),
+    )
+    return pd.DataFrame(
+        values,
+        columns=["open", "high", "low", "close", "volume"],
+        index=dates,
+        copy=False,
+    )
+
+
+@pytest.fixture(scope="class")
+def mock_ensemble():
+    """Create mock ensemble model"""
+    ensemble = Mock()
+    ensemble.prepare_features = Mock(return_value=pd.DataFrame())
+    ensemble.predict = Mock(
+        return_value={
+            "direction": 1,
+            "confidence": 0.75,
+            "predicted_return": 0.025,
+            "model_contributions": {
+                "LSTM": 0.02,
+                "LightGBM": 0.03,
+                "XGBoost": 0.025,
+            },
+        }
+    )
+    return ensemble
+
+
+@pytest.fixture(scope="class")
+def mock_llm_orchestrator():
+    """Create mock LLM orchestrator"""
+    orchestrator = Mock()
+
+    # Mock consensus signal
+    mock_signal = Mock()
+    mock_signal.direction = "long"
+    mock_signal.confidence = 0.80
+    mock_signal.combined_reasoning = "Strong bullish momentum with RSI oversold"
+
+    orchestrator.generate_signal = Mock(return_value=mock_signal)
+    return orchestrator
+
+
+@pytest.fixture(scope="class")
+def predictor(mock_ensemble, mock_llm_orchestrator):
+    """Create hybrid predictor with mocks (shared by the class)"""
+    return HybridMLLLMPredictor(
+        ensemble_model=mock_ensemble,
+        llm_orchestrator=mock_llm_orchestrator,
+        min_ml_confidence=0.60,
+        min_llm_confidence=0.60,
+        min_agreement_for_trade=0.70,
+    )
+
+
 class TestMLPrediction:
     """Test MLPrediction dataclass"""
 
@@ -88,66 +155,6 @@ class TestHybridSignal:
 class TestHybridMLLLMPredictor:
     """Test HybridMLLLMPredictor core functionality"""
 
-    @pytest.fixture
-    def mock_ensemble(self):
-        """Create mock ensemble model"""
-        ensemble = Mock()
-        ensemble.prepare_features = Mock(return_value=pd.DataFrame())
-        ensemble.predict = Mock(
-            return_value={
-                "direction": 1,
-                "confidence": 0.75,
-                "predicted_return": 0.025,
-                "model_contributions": {
-                    "LSTM": 0.02,
-                    "LightGBM": 0.03,
-                    "XGBoost": 0.025,
-                },
-            }
-        )
-        return ensemble
-
-    @pytest.fixture
-    def mock_llm_orchestrator(self):
-        """Create mock LLM orchestrator"""
-        orchestrator = Mock()
-
-        # Mock consensus signal
-        mock_signal = Mock()
-        mock_signal.direction = "long"
-        mock_signal.confidence = 0.80
-        mock_signal.combined_reasoning = "Strong bullish momentum with RSI oversold"
-
-        orchestrator.generate_signal = Mock(return_value=mock_signal)
-        return orchestrator
-
-    @pytest.fixture
-    def predictor(self, mock_ensemble, mock_llm_orchestrator):
-        """Create hybrid predictor with mocks"""
-        return HybridMLLLMPredictor(
-            ensemble_model=mock_ensemble,
-            llm_orchestrator=mock_llm_orchestrator,
-            min_ml_confidence=0.60,
-            min_llm_confidence=0.60,
-            min_agreement_for_trade=0.70,
-        )
-
-    @pytest.fixture
-    def sample_ohlcv(self):
-        """Create sample OHLCV data"""
-        dates = pd.date_range("2024-01-01", periods=100, freq="4h")
-        df = pd.DataFrame(
-            {
-                "open": np.random.uniform(40000, 45000, 100),
-                "high": np.random.uniform(45000, 50000, 100),
-                "low": np.random.uniform(35000, 40000, 100),
-                "close": np.random.uniform(40000, 45000, 100),
-                "volume": np.random.uniform(1000, 5000, 100),
-            },
-            index=dates,
-        )
-        return df
-
     def test_predictor_initialization(self, predictor):
         """Test predictor initializes correctly"""
         assert predictor.min_ml_confidence == 0.60
@@ -162,6 +169,20 @@ class TestHybridMLLLMPredictor:
         assert predictor._normalize_llm_direction("short") == "down"
         assert predictor._normalize_llm_direction("neutral") == "neutral"
 
+    @pytest.mark.parametrize(
+        "llm_direction, expected",
+        [
+            ("bullish", "up"),
+            ("BUY", "up"),
+            ("Bearish", "down"),
+            ("sell", "down"),
+            ("hold", "neutral"),
+        ],
+    )
+    def test_normalize_llm_direction_synonyms(self, predictor, llm_direction, expected):
+        """Test bullish/bearish synonyms and case-insensitive matching"""
+        assert predictor._normalize_llm_direction(llm_direction) == expected
+
     def test_calculate_agreement(self, predictor):
         """Test agreement calculation from predictions"""
         # Perfect agreement
@@ -179,6 +200,15 @@ class TestHybridMLLLMPredictor:
         agreement = predictor._calculate_agreement(predictions)
         assert agreement < 0.55  # Slightly higher threshold for edge case
 
+    def test_calculate_agreement_matches_std(self, predictor):
+        """Test agreement equals exponential decay of the population std"""
+        predictions = [0.02, -0.01, 0.03, 0.4, 0.15]
+
+        agreement = predictor._calculate_agreement(predictions)
+
+        assert agreement == pytest.approx(np.exp(-2.0 * np.std(predictions)))
+        assert predictor._calculate_agreement([]) == 0.0
+
     def test_signal_strength_very_strong(self, predictor):
         """Test VERY_STRONG signal classification"""
         ml_pred = MLPrediction("up", 0.80, 0.03, 0.90, {})
@@ -234,6 +264,31 @@ class TestHybridMLLLMPredictor:
 
         assert strength == SignalStrength.CONFLICT
 
+    @pytest.mark.parametrize(
+        "ml_conf, llm_conf, agreement, expected",
+        [
+            # Thresholds are exclusive: sitting on one drops a tier
+            (0.76, 0.76, 0.86, SignalStrength.VERY_STRONG),
+            (0.75, 0.76, 0.86, SignalStrength.STRONG),
+            (0.76, 0.76, 0.85, SignalStrength.STRONG),
+            (0.66, 0.66, 0.71, SignalStrength.STRONG),
+            (0.65, 0.90, 0.90, SignalStrength.NO_SIGNAL),
+            (0.90, 0.65, 0.70, SignalStrength.MODERATE),
+        ],
+    )
+    def test_signal_strength_thresholds(
+        self, predictor, ml_conf, llm_conf, agreement, expected
+    ):
+        """Test tier boundaries for aligned signals"""
+        ml_pred = MLPrediction("up", ml_conf, 0.02, 0.80, {})
+        llm_pred = LLMPrediction("long", llm_conf, "Bullish", [], 0.80)
+
+        strength = predictor._classify_signal_strength(
+            ml_pred, llm_pred, directional_match=True, agreement_score=agreement
+        )
+
+        assert strength == expected
+
     def test_determine_action_very_strong(self, predictor):
         """Test action for VERY_STRONG signal"""
         ml_pred = MLPrediction("up", 0.80, 0.03, 0.90, {})
@@ -328,21 +383,48 @@ class TestHybridMLLLMPredictor:
         assert signal.recommended_position_size >= 0.0
         assert len(signal.reasoning) > 0
 
-    def test_ml_prediction_error_handling(self, predictor, sample_ohlcv):
+    def test_ml_and_llm_predictions_overlap(self, predictor, sample_ohlcv, monkeypatch):
+        """Test ML prediction runs while the LLM request is in flight"""
+        llm_started = threading.Event()
+        ml_saw_llm = []
+
+        def fake_llm(pair, ohlcv_data, market_context):
+            llm_started.set()
+            return LLMPrediction("long", 0.80, "Bullish", [], 0.85)
+
+        def fake_ml(pair, ohlcv_data):
+            # Only returns True if the LLM call was dispatched concurrently
+            ml_saw_llm.append(llm_started.wait(timeout=5))
+            return MLPrediction("up", 0.80, 0.03, 0.85, {})
+
+        monkeypatch.setattr(predictor, "_get_llm_prediction", fake_llm)
+        monkeypatch.setattr(predictor, "_get_ml_prediction", fake_ml)
+
+        signal = predictor.generate_hybrid_signal("BTC/USDT", sample_ohlcv)
+
+        assert ml_saw_llm == [True]
+        assert signal.llm_prediction.direction == "long"
+        assert signal.ml_prediction.direction == "up"
+
+    def test_ml_prediction_error_handling(self, predictor, sample_ohlcv, monkeypatch):
         """Test ML prediction returns neutral on error"""
-        # Make ensemble raise error
-        predictor.ensemble.predict = Mock(side_effect=Exception("ML Error"))
+        # Make ensemble raise error (restored after the test)
+        monkeypatch.setattr(
+            predictor.ensemble, "predict", Mock(side_effect=Exception("ML Error"))
+        )
 
         ml_pred = predictor._get_ml_prediction("BTC/USDT", sample_ohlcv)
 
         assert ml_pred.direction == "neutral"
         assert ml_pred.confidence == 0.0
 
-    def test_llm_prediction_error_handling(self, predictor, sample_ohlcv):
+    def test_llm_prediction_error_handling(self, predictor, sample_ohlcv, monkeypatch):
         """Test LLM prediction returns neutral on error"""
-        # Make orchestrator raise error
-        predictor.llm_orchestrator.generate_signal = Mock(
-            side_effect=Exception("LLM Error")
+        # Make orchestrator raise error (restored after the test)
+        monkeypatch.setattr(
+            predictor.llm_orchestrator,
+            "generate_signal",
+            Mock(side_effect=Exception("LLM Error")),
         )
 
         llm_pred = predictor._get_llm_prediction("BTC/USDT", sample_ohlcv, None)
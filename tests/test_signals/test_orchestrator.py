@@ -10,6 +10,7 @@ from datetime import datetime
 from unittest.mock import patch, MagicMock
 from proratio_signals.orchestrator import SignalOrchestrator, ConsensusSignal
 from proratio_signals.llm_providers.base import MarketAnalysis
+from proratio_signals.llm_providers.exceptions import QuotaError
 
 
 def create_sample_ohlcv() -> pd.DataFrame:
@@ -44,6 +45,12 @@ def create_mock_analysis(
     )
 
 
+@pytest.fixture(scope="module")
+def orchestrator():
+    """Bare orchestrator (no providers) for exercising the combining logic"""
+    return SignalOrchestrator.__new__(SignalOrchestrator)
+
+
 class TestConsensusSignal:
     """Test ConsensusSignal dataclass"""
 
@@ -108,7 +115,7 @@ class TestConsensusSignal:
 class TestConsensusCalculation:
     """Test consensus calculation logic"""
 
-    def test_unanimous_long_signal(self):
+    def test_unanimous_long_signal(self, orchestrator):
         """Test consensus when all providers agree on LONG"""
         analyses = {
             "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
@@ -116,9 +123,6 @@ class TestConsensusCalculation:
             "gemini": create_mock_analysis("long", 0.75, "gemini"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         signal = orchestrator._calculate_consensus(
             analyses,
             "BTC/USDT",
@@ -132,7 +136,7 @@ class TestConsensusCalculation:
         # Weighted confidence: 0.8*0.4 + 0.7*0.35 + 0.75*0.25 = 0.7525
         assert abs(signal.confidence - 0.7525) < 0.01
 
-    def test_split_signal(self):
+    def test_split_signal(self, orchestrator):
         """Test consensus when providers disagree"""
         analyses = {
             "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
@@ -140,9 +144,6 @@ class TestConsensusCalculation:
             "gemini": create_mock_analysis("neutral", 0.6, "gemini"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         signal = orchestrator._calculate_consensus(
             analyses,
             "BTC/USDT",
@@ -155,13 +156,10 @@ class TestConsensusCalculation:
         assert signal.direction == "long"  # Highest weight
         assert signal.consensus_score == 0.40  # Only 40% agree
 
-    def test_dynamic_reweighting_one_provider(self):
+    def test_dynamic_reweighting_one_provider(self, orchestrator):
         """Test dynamic reweighting with only one provider"""
         analyses = {"claude": create_mock_analysis("long", 0.7, "claude")}
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         signal = orchestrator._calculate_consensus(
             analyses, "BTC/USDT", "1h", ["chatgpt", "gemini"], {"claude": "sonnet-4"}
         )
@@ -172,16 +170,13 @@ class TestConsensusCalculation:
         assert signal.confidence == 0.7  # Claude's confidence
         assert signal.failed_providers == ["chatgpt", "gemini"]
 
-    def test_dynamic_reweighting_two_providers(self):
+    def test_dynamic_reweighting_two_providers(self, orchestrator):
         """Test dynamic reweighting with two providers"""
         analyses = {
             "claude": create_mock_analysis("long", 0.7, "claude"),
             "gemini": create_mock_analysis("long", 0.6, "gemini"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         signal = orchestrator._calculate_consensus(
             analyses,
             "BTC/USDT",
@@ -197,13 +192,10 @@ class TestConsensusCalculation:
         assert abs(signal.confidence - 0.658) < 0.01
         assert len(signal.active_providers) == 2
 
-    def test_no_providers_available(self):
+    def test_no_providers_available(self, orchestrator):
         """Test consensus when no providers are available"""
         analyses = {}
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         signal = orchestrator._calculate_consensus(
             analyses, "BTC/USDT", "1h", ["chatgpt", "claude", "gemini"], {}
         )
@@ -258,16 +250,13 @@ class TestOrchestrator:
 class TestCombiningMethods:
     """Test reasoning/risk/technical summary combination methods"""
 
-    def test_combine_reasoning(self):
+    def test_combine_reasoning(self, orchestrator):
         """Test combining reasoning from multiple providers"""
         analyses = {
             "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
             "claude": create_mock_analysis("long", 0.7, "claude"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-        orchestrator.WEIGHTS = {"chatgpt": 0.40, "claude": 0.35, "gemini": 0.25}
-
         combined = orchestrator._combine_reasoning(analyses)
 
         assert "CHATGPT" in combined
@@ -275,32 +264,125 @@ class TestCombiningMethods:
         assert "40%" in combined
         assert "35%" in combined
 
-    def test_combine_risk_assessments(self):
+    def test_combine_risk_assessments(self, orchestrator):
         """Test combining risk assessments"""
         analyses = {
             "claude": create_mock_analysis("long", 0.7, "claude"),
             "gemini": create_mock_analysis("long", 0.6, "gemini"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-
         combined = orchestrator._combine_risk_assessments(analyses)
 
         assert "claude" in combined
         assert "gemini" in combined
         assert "risk assessment" in combined.lower()
 
-    def test_combine_technical_summaries(self):
+    def test_combine_technical_summaries(self, orchestrator):
         """Test combining technical summaries"""
         analyses = {
             "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
             "claude": create_mock_analysis("long", 0.7, "claude"),
         }
 
-        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
-
         combined = orchestrator._combine_technical_summaries(analyses)
 
         assert "chatgpt" in combined
         assert "claude" in combined
         assert "analysis" in combined.lower()
+
+
+class TestEarlyConsensus:
+    """Test skipping secondary providers when primary providers agree"""
+
+    def _make_orchestrator(self, analyses, tolerance=0.2):
+        orchestrator = SignalOrchestrator.__new__(SignalOrchestrator)
+        orchestrator.early_consensus_tolerance = tolerance
+        orchestrator.providers = {}
+        for name, analysis in analyses.items():
+            provider = MagicMock(model=f"{name}-model")
+            provider.analyze_market.return_value = analysis
+            orchestrator.providers[name] = provider
+        return orchestrator
+
+    def test_agreement_skips_gemini(self):
+        """Test Gemini is not called when ChatGPT and Claude agree"""
+        orchestrator = self._make_orchestrator(
+            {
+                "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
+                "claude": create_mock_analysis("long", 0.7, "claude"),
+                "gemini": create_mock_analysis("short", 0.9, "gemini"),
+            }
+        )
+
+        signal = orchestrator.generate_signal("BTC/USDT", "1h", create_sample_ohlcv())
+
+        orchestrator.providers["gemini"].analyze_market.assert_not_called()
+        assert signal.direction == "long"
+        assert signal.active_providers == ["chatgpt", "claude"]
+        assert signal.failed_providers == []
+        # Reweighted: (0.8*0.40 + 0.7*0.35) / 0.75 = 0.7533
+        assert abs(signal.confidence - 0.7533) < 0.01
+
+    def test_disagreement_calls_gemini(self):
+        """Test Gemini breaks the tie when directions differ"""
+        orchestrator = self._make_orchestrator(
+            {
+                "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
+                "claude": create_mock_analysis("short", 0.7, "claude"),
+                "gemini": create_mock_analysis("short", 0.6, "gemini"),
+            }
+        )
+
+        signal = orchestrator.generate_signal("BTC/USDT", "1h", create_sample_ohlcv())
+
+        orchestrator.providers["gemini"].analyze_market.assert_called_once()
+        assert signal.direction == "short"
+        assert len(signal.active_providers) == 3
+
+    def test_confidence_gap_calls_gemini(self):
+        """Test Gemini is called when confidences are too far apart"""
+        orchestrator = self._make_orchestrator(
+            {
+                "chatgpt": create_mock_analysis("long", 0.9, "chatgpt"),
+                "claude": create_mock_analysis("long", 0.5, "claude"),
+                "gemini": create_mock_analysis("long", 0.6, "gemini"),
+            }
+        )
+
+        orchestrator.generate_signal("BTC/USDT", "1h", create_sample_ohlcv())
+
+        orchestrator.providers["gemini"].analyze_market.assert_called_once()
+
+    def test_primary_failure_calls_gemini(self):
+        """Test Gemini is called when a primary provider fails"""
+        orchestrator = self._make_orchestrator(
+            {
+                "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
+                "claude": create_mock_analysis("long", 0.7, "claude"),
+                "gemini": create_mock_analysis("long", 0.6, "gemini"),
+            }
+        )
+        orchestrator.providers["claude"].analyze_market.side_effect = QuotaError(
+            "credits exhausted"
+        )
+
+        signal = orchestrator.generate_signal("BTC/USDT", "1h", create_sample_ohlcv())
+
+        orchestrator.providers["gemini"].analyze_market.assert_called_once()
+        assert signal.failed_providers == ["claude"]
+        assert signal.active_providers == ["chatgpt", "gemini"]
+
+    def test_disabled_tolerance_calls_all(self):
+        """Test every provider is called when early consensus is disabled"""
+        orchestrator = self._make_orchestrator(
+            {
+                "chatgpt": create_mock_analysis("long", 0.8, "chatgpt"),
+                "claude": create_mock_analysis("long", 0.8, "claude"),
+                "gemini": create_mock_analysis("long", 0.8, "gemini"),
+            },
+            tolerance=None,
+        )
+
+        orchestrator.generate_signal("BTC/USDT", "1h", create_sample_ohlcv())
+
+        orchestrator.providers["gemini"].analyze_market.assert_called_once()
@@ -0,0 +1,180 @@
+"""
+Unit Tests for the archived AI-enhanced strategy's signal caching
+
+Loads strategies/archived/6347_ai-enhanced/strategy.py directly (the
+directory name is not an importable package) and checks signal ages the way
+Freqtrade's backtester drives the strategy.
+"""
+
+import importlib.util
+import sqlite3
+from datetime import timedelta
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pandas as pd
+import pytest
+
+from proratio_signals import ConsensusSignal
+
+STRATEGY_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "strategies"
+    / "archived"
+    / "6347_ai-enhanced"
+    / "strategy.py"
+)
+
+_spec = importlib.util.spec_from_file_location("ai_enhanced_strategy", STRATEGY_PATH)
+ai_enhanced_strategy = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ai_enhanced_strategy)
+AIEnhancedStrategy = ai_enhanced_strategy.AIEnhancedStrategy
+
+
+def _make_strategy(tmp_path, disk_cache=False):
+    """Strategy with a mocked orchestrator returning a confident LONG signal"""
+    config = {
+        "stake_currency": "USDT",
+        "stake_amount": 100,
+        "dry_run": True,
+        "user_data_dir": str(tmp_path),
+    }
+    with (
+        patch.object(ai_enhanced_strategy, "SignalOrchestrator"),
+        patch.object(AIEnhancedStrategy, "ai_disk_cache_enabled", disk_cache),
+    ):
+        strategy = AIEnhancedStrategy(config)
+    strategy.ai_enabled = True
+    strategy.ai_orchestrator = Mock(providers={}, PROMPTS={})
+    strategy.ai_orchestrator.generate_signal.return_value = ConsensusSignal(
+        direction="long",
+        confidence=0.75,
+        consensus_score=0.80,
+        combined_reasoning="Strong bullish trend detected",
+        pair="BTC/USDT",
+        timeframe="1h",
+    )
+    return strategy
+
+
+@pytest.fixture
+def strategy(tmp_path):
+    """Strategy with the (default) disabled disk cache"""
+    return _make_strategy(tmp_path)
+
+
+@pytest.fixture
+def cached_strategy(tmp_path):
+    """Strategy persisting AI signals under tmp_path"""
+    return _make_strategy(tmp_path, disk_cache=True)
+
+
+@pytest.fixture
+def sample_dataframe():
+    """Historical 1h OHLCV frame with a UTC date column, as Freqtrade passes it"""
+    dates = pd.date_range(start="2024-01-01", periods=200, freq="1h", tz="UTC")
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": [100.0 + i * 0.1 for i in range(200)],
+            "high": [101.0 + i * 0.1 for i in range(200)],
+            "low": [99.0 + i * 0.1 for i in range(200)],
+            "close": [100.5 + i * 0.1 for i in range(200)],
+            "volume": [1000000 + i * 1000 for i in range(200)],
+        }
+    )
+
+
+def _confirm(strategy, current_time):
+    return strategy.confirm_trade_entry(
+        pair="BTC/USDT",
+        order_type="limit",
+        amount=1.0,
+        rate=120.0,
+        time_in_force="GTC",
+        current_time=current_time,
+        entry_tag=None,
+        side="long",
+    )
+
+
+class TestSignalTimestamp:
+    """Signal ages follow candle time, not the wall clock"""
+
+    def test_signal_stamped_with_candle_close(self, strategy, sample_dataframe):
+        """Test cached signal is stamped with the close of the last candle"""
+        metadata = {"pair": "BTC/USDT"}
+        df = strategy.populate_indicators(sample_dataframe.copy(), metadata)
+        strategy.get_ai_signal(df, metadata)
+
+        last_open = df["date"].iloc[-1]
+        assert strategy.ai_signal_cache["BTC/USDT"]["timestamp"] == (
+            last_open + timedelta(hours=1)
+        )
+
+    def test_backtest_order_expires_signal(self, strategy, sample_dataframe):
+        """Test populate-before-bot_loop_start (backtest order) still expires signals"""
+        metadata = {"pair": "BTC/USDT"}
+        df = strategy.populate_indicators(sample_dataframe.copy(), metadata)
+        strategy.get_ai_signal(df, metadata)
+
+        # Backtests confirm entries at the open of the next candle
+        entry_time = df["date"].iloc[-1] + timedelta(hours=1)
+        strategy.bot_loop_start(current_time=entry_time)
+        assert _confirm(strategy, entry_time) is True
+
+        # Same signal, confirmed after the cache window has passed
+        late_time = entry_time + timedelta(minutes=strategy.ai_cache_minutes)
+        strategy.bot_loop_start(current_time=late_time)
+        assert _confirm(strategy, late_time) is False
+
+
+class TestDiskCache:
+    """Persistent AI signal cache"""
+
+    def test_disabled_by_default(self, strategy, sample_dataframe, tmp_path):
+        """Test no cache file or key is built unless enabled"""
+        assert AIEnhancedStrategy.ai_disk_cache_enabled is False
+        metadata = {"pair": "BTC/USDT"}
+        df = strategy.populate_indicators(sample_dataframe.copy(), metadata)
+
+        with patch.object(strategy, "_disk_cache_key") as disk_cache_key:
+            assert strategy.get_ai_signal(df, metadata) is not None
+
+        disk_cache_key.assert_not_called()
+        assert not (tmp_path / "ai_signal_cache.sqlite").exists()
+
+    def test_replays_persisted_signal(
+        self, cached_strategy, sample_dataframe, tmp_path
+    ):
+        """Test a rerun reuses the stored signal instead of querying the LLMs"""
+        metadata = {"pair": "BTC/USDT"}
+        df = cached_strategy.populate_indicators(sample_dataframe.copy(), metadata)
+        first = cached_strategy.get_ai_signal(df, metadata)
+
+        rerun = _make_strategy(tmp_path, disk_cache=True)
+        assert rerun.get_ai_signal(df, metadata) == first
+        rerun.ai_orchestrator.generate_signal.assert_not_called()
+
+    def test_unreadable_entry_falls_through(
+        self, cached_strategy, sample_dataframe, tmp_path
+    ):
+        """Test a corrupt entry is deleted and replaced by a live query"""
+        metadata = {"pair": "BTC/USDT"}
+        df = cached_strategy.populate_indicators(sample_dataframe.copy(), metadata)
+        cached_strategy.get_ai_signal(df, metadata)
+
+        # Pickle of a class that no longer exists (raises AttributeError)
+        stale = b"cproratio_signals\nRemovedSignal\n."
+        cache_path = tmp_path / "ai_signal_cache.sqlite"
+        with sqlite3.connect(cache_path) as conn:
+            conn.execute("UPDATE ai_signals SET signal = ?", (stale,))
+
+        rerun = _make_strategy(tmp_path, disk_cache=True)
+        signal = rerun.get_ai_signal(df, metadata)
+
+        assert signal is not None
+        rerun.ai_orchestrator.generate_signal.assert_called_once()
+        with sqlite3.connect(cache_path) as conn:
+            (stored,) = conn.execute("SELECT signal FROM ai_signals").fetchone()
+        assert stored != stale
@@ -26,6 +26,13 @@ class TestBinanceCollector:
         assert collector._parse_timeframe_to_seconds("4h") == 14400
         assert collector._parse_timeframe_to_seconds("1d") == 86400
 
+    def test_parse_timeframe_to_seconds_unsupported(self):
+        """Test unsupported timeframes are rejected"""
+        collector = BinanceCollector()
+
+        with pytest.raises(ValueError, match="Unsupported timeframe"):
+            collector._parse_timeframe_to_seconds("7x")
+
     @pytest.mark.skipif(True, reason="Requires API keys and network connection")
     def test_fetch_ohlcv(self):
         """Test fetching OHLCV data (requires API keys)"""